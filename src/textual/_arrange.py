@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from fractions import Fraction
 from operator import attrgetter
 from typing import TYPE_CHECKING, Iterable, Mapping, Sequence
 
@@ -128,9 +127,7 @@ def _arrange_dock_widgets(
     for dock_widget in dock_widgets:
         edge = dock_widget.styles.dock
 
-        box_model = dock_widget._get_box_model(
-            size, viewport, Fraction(size.width), Fraction(size.height)
-        )
+        box_model = dock_widget._get_box_model(size, viewport, size.width, size.height)
         widget_width_fraction, widget_height_fraction, margin = box_model
 
         widget_width = int(widget_width_fraction) + margin.width
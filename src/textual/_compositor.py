@@ -26,13 +26,14 @@ from typing import (
 import rich.repr
 from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
 from rich.control import Control
-from rich.segment import Segment
+from rich.segment import ControlType, Segment
 from rich.style import Style
 
-from . import errors
+from . import constants, errors
 from ._cells import cell_len
 from ._context import visible_screen_stack
 from ._loop import loop_last
+from ._segment_tools import line_diff
 from .geometry import NULL_OFFSET, NULL_SPACING, Offset, Region, Size, Spacing
 from .strip import Strip, StripRenderable
 
@@ -84,6 +85,9 @@ class MapGeometry(NamedTuple):
 # Maps a widget on to its geometry (information that describes its position in the composition)
 CompositorMap: TypeAlias = "dict[Widget, MapGeometry]"
 
+# Style of lines exposed by a terminal scroll, which never matches rendered content
+_EXPOSED_STYLE = Style(meta={"@exposed": True})
+
 
 class CompositorUpdate:
     """An update generated by the compositor, which also doubles as console renderables."""
@@ -211,6 +215,8 @@ class ChopsUpdate(CompositorUpdate):
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
+        if not self.spans:
+            return
         move_to = Control.move_to
         new_line = Segment.line()
         chops = self.chops
@@ -267,6 +273,9 @@ class ChopsUpdate(CompositorUpdate):
             Raw data with escape sequences.
         """
 
+        if not self.spans:
+            return ""
+
         sequences: list[str] = []
         append = sequences.append
 
@@ -290,8 +299,8 @@ class ChopsUpdate(CompositorUpdate):
                     append(strip.render(console))
                     continue
 
-                strip = strip.crop(0, min(end, x2) - x)
-                append(move_to(x, y).segment.text)
+                strip = strip.crop(max(0, x1 - x), min(end, x2) - x)
+                append(move_to(max(x, x1), y).segment.text)
                 append(strip.render(console))
 
             if y != last_y:
@@ -304,6 +313,69 @@ class ChopsUpdate(CompositorUpdate):
         yield from ()
 
 
+@rich.repr.auto(angular=True)
+class ScrollUpdate(ChopsUpdate):
+    """A renderable that scrolls regions of the terminal, then applies updated spans.
+
+    Regions are scrolled with terminal scroll margins (DECSTBM), so only lines exposed
+    by the scroll need to be written by the chops.
+    """
+
+    def __init__(
+        self,
+        scrolls: list[tuple[Region, int]],
+        chops: Sequence[Mapping[int, Strip | None]],
+        spans: list[tuple[int, int, int]],
+        chop_ends: list[list[int]],
+    ) -> None:
+        """A renderable which scrolls lines, then updates chops.
+
+        Args:
+            scrolls: A list of full width regions, and the distance to scroll them
+                (positive to scroll content up, negative to scroll content down).
+            chops: A mapping of offsets to list of segments, per line.
+            spans: Spans to update.
+            chop_ends: A list of the end offsets for each line
+        """
+        self.scrolls = scrolls
+        super().__init__(chops, spans, chop_ends)
+
+    def _render_scrolls(self) -> str:
+        """Render escape sequences to scroll the terminal.
+
+        Returns:
+            Raw data with escape sequences.
+        """
+        sequences: list[str] = []
+        append = sequences.append
+        for region, distance in self.scrolls:
+            append(f"\x1b[{region.y + 1};{region.bottom}r")
+            append(f"\x1b[{distance}S" if distance > 0 else f"\x1b[{-distance}T")
+        append("\x1b[r")  # Reset scroll margins
+        return "".join(sequences)
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        # Setting scroll margins moves the cursor home
+        yield Segment(self._render_scrolls(), None, [(ControlType.HOME,)])
+        yield from super().__rich_console__(console, options)
+
+    def render_segments(self, console: Console) -> str:
+        """Render the update to raw data, suitable for writing to terminal.
+
+        Args:
+            console: Console instance.
+
+        Returns:
+            Raw data with escape sequences.
+        """
+        return self._render_scrolls() + super().render_segments(console)
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield self.scrolls
+
+
 @rich.repr.auto(angular=True)
 class Compositor:
     """Responsible for storing information regarding the relative positions of Widgets and rendering them."""
@@ -331,12 +403,27 @@ class Compositor:
         # The points in each line where the line bisects the left and right edges of the widget
         self._cuts: list[list[int]] | None = None
 
+        # State used to update cuts incrementally
+        self._cut_counts_size = Size(0, 0)
+        # Reference counts of cut positions, per line
+        self._cut_counts: list[dict[int, int]] = []
+        # Visible (cropped) regions accounted for in the cut counts
+        self._cut_regions: set[Region] = set()
+        # Cuts for every line, as of the last update
+        self._cut_lines: list[list[int]] = []
+
         # Regions that require an update
         self._dirty_regions: set[Region] = set()
 
         # Mapping of line numbers on to lists of widget and regions
         self._layers_visible: list[list[tuple[Widget, Region, Region]]] | None = None
 
+        # The last frame sent to the terminal (one strip per line), or `None` if unknown
+        self._front_buffer: list[Strip] | None = None
+
+        # Scrollable (full width) regions and their vertical scroll offset, as of the last update
+        self._scroll_positions: dict[Widget, tuple[Region, int]] = {}
+
     @classmethod
     def _regions_to_spans(
         cls, regions: Iterable[Region]
@@ -466,7 +553,14 @@ class Compositor:
         self.size = size
 
         # Keep a copy of the old map because we're going to compare it with the update
-        old_map = self._visible_map or {}
+        old_map = self._visible_map
+        if old_map is None:
+            # The full map is current, so the visible portion is what is on screen
+            old_map = {
+                widget: map_geometry
+                for widget, map_geometry in self._full_map.items()
+                if map_geometry.visible_region
+            }
         map, widgets = self._arrange_root(parent, size, visible_only=True)
 
         # Replace map and widgets
@@ -917,6 +1011,9 @@ class Compositor:
 
         A cut is every point on a line where a widget starts or ends.
 
+        Cuts are updated incrementally: only lines covered by widget regions which
+        have been added or removed since the last call are recalculated.
+
         Returns:
             A list of cuts for every line.
         """
@@ -924,21 +1021,56 @@ class Compositor:
             return self._cuts
 
         width, height = self.size
-        cuts = [[0, width] for _ in range(height)]
-
         intersection = Region.intersection
-        extend = list.extend
-
-        for region, clip in self.visible_widgets.values():
-            x, y, region_width, region_height = intersection(region, clip)
-            if region_width and region_height:
-                region_cuts = (x, x + region_width)
-                for cut in cuts[y : y + region_height]:
-                    extend(cut, region_cuts)
-
-        # Sort the cuts for each line
-        self._cuts = [sorted(set(line_cuts)) for line_cuts in cuts]
+        regions = {
+            cropped_region
+            for cropped_region in (
+                intersection(region, clip)
+                for region, clip in self.visible_widgets.values()
+            )
+            if cropped_region
+        }
 
+        if self._cut_counts_size != self.size:
+            # Size has changed, so start from scratch
+            self._cut_counts_size = self.size
+            self._cut_counts = [{} for _ in range(height)]
+            self._cut_regions = set()
+            self._cut_lines = [[0, width] for _ in range(height)]
+
+        cut_counts = self._cut_counts
+        updated_lines: set[int] = set()
+        add_lines = updated_lines.update
+        _range = range
+
+        for x, y, region_width, region_height in self._cut_regions - regions:
+            line_range = _range(max(y, 0), min(y + region_height, height))
+            add_lines(line_range)
+            x2 = x + region_width
+            for line_counts in cut_counts[line_range.start : line_range.stop]:
+                for cut in (x, x2):
+                    count = line_counts[cut] - 1
+                    if count:
+                        line_counts[cut] = count
+                    else:
+                        del line_counts[cut]
+
+        for x, y, region_width, region_height in regions - self._cut_regions:
+            line_range = _range(max(y, 0), min(y + region_height, height))
+            add_lines(line_range)
+            x2 = x + region_width
+            for line_counts in cut_counts[line_range.start : line_range.stop]:
+                line_counts[x] = line_counts.get(x, 0) + 1
+                line_counts[x2] = line_counts.get(x2, 0) + 1
+
+        self._cut_regions = regions
+        if updated_lines:
+            cut_lines = self._cut_lines = self._cut_lines[:]
+            screen_cuts = {0, width}
+            for y in updated_lines:
+                cut_lines[y] = sorted(screen_cuts.union(cut_counts[y]))
+
+        self._cuts = self._cut_lines
         return self._cuts
 
     def _get_renders(
@@ -1018,11 +1150,21 @@ class Compositor:
 
         visible_screen_stack.set([] if screen_stack is None else screen_stack)
         screen_region = self.size.region
-        if full or screen_region in self._dirty_regions:
+        if full or (
+            self._front_buffer is None and screen_region in self._dirty_regions
+        ):
             return self.render_full_update(simplify=simplify)
         else:
             return self.render_partial_update()
 
+    def clear_front_buffer(self) -> None:
+        """Forget the last frame written to the terminal.
+
+        Call this when the terminal content can no longer be relied upon (resize, screen
+        switch, etc). The next full update will restore the front buffer.
+        """
+        self._front_buffer = None
+
     def render_inline(
         self,
         size: Size,
@@ -1056,10 +1198,11 @@ class Compositor:
         self._dirty_regions.clear()
         crop = screen_region
         chops = self._render_chops(crop, lambda y: True)
+        render_strips = [Strip.join(chop.values()) for chop in chops]
+        self._front_buffer = render_strips[:]
+        self._scroll_positions = self._get_scroll_positions()
         if simplify:
-            render_strips = [Strip.join(chop.values()).simplify() for chop in chops]
-        else:
-            render_strips = [Strip.join(chop.values()) for chop in chops]
+            render_strips = [strip.simplify() for strip in render_strips]
 
         return LayoutUpdate(render_strips, screen_region)
 
@@ -1072,6 +1215,9 @@ class Compositor:
         screen_region = self.size.region
         update_regions = self._dirty_regions.copy()
         self._dirty_regions.clear()
+        scrolls = self._scroll_front_buffer()
+        # Scrolled lines must be compared with the (scrolled) front buffer
+        update_regions.update(region for region, _ in scrolls)
         if update_regions:
             # Create a crop region that surrounds all updates.
             crop = Region.from_union(update_regions).intersection(screen_region)
@@ -1081,8 +1227,136 @@ class Compositor:
             return None
         chops = self._render_chops(crop, is_rendered_line)
         chop_ends = [cut_set[1:] for cut_set in self.cuts]
+        spans = self._update_front_buffer(chops, spans, chop_ends)
+        if scrolls and self._front_buffer is not None:
+            return ScrollUpdate(scrolls, chops, spans, chop_ends)
         return ChopsUpdate(chops, spans, chop_ends)
 
+    def _get_scroll_positions(self) -> dict[Widget, tuple[Region, int]]:
+        """Get the scrollable regions which may be scrolled with the terminal.
+
+        Returns:
+            A mapping of widgets on to a full width region of lines, and vertical scroll offset.
+        """
+        if not constants.SCROLL_REGIONS:
+            return {}
+        width = self.size.width
+        scroll_positions: dict[Widget, tuple[Region, int]] = {}
+        for widget, (region, clip) in self.visible_widgets.items():
+            if region.x > 0 or region.right < width or not widget.is_scrollable:
+                continue
+            scrollable_region = (
+                region.shrink(widget.styles.gutter)
+                .shrink(widget.scrollbar_gutter)
+                .intersection(clip)
+            )
+            if scrollable_region.height > 1:
+                scroll_positions[widget] = (
+                    Region(0, scrollable_region.y, width, scrollable_region.height),
+                    widget.scroll_offset.y,
+                )
+        return scroll_positions
+
+    def _scroll_front_buffer(self) -> list[tuple[Region, int]]:
+        """Scroll lines in the front buffer to match widgets which have scrolled vertically.
+
+        Returns:
+            A list of scrolled regions and the distance they were scrolled.
+        """
+        previous_positions = self._scroll_positions
+        self._scroll_positions = scroll_positions = self._get_scroll_positions()
+        front_buffer = self._front_buffer
+        if front_buffer is None or len(front_buffer) != self.size.height:
+            return []
+
+        scrolls: list[tuple[Region, int]] = []
+        width = self.size.width
+        exposed_line = Strip([Segment(" " * width, _EXPOSED_STYLE)], width)
+
+        for widget, (region, scroll_y) in scroll_positions.items():
+            previous_region, previous_scroll_y = previous_positions.get(
+                widget, (None, scroll_y)
+            )
+            distance = scroll_y - previous_scroll_y
+            if (
+                not distance
+                or region != previous_region
+                or abs(distance) >= region.height
+                or any(region.overlaps(scrolled) for scrolled, _ in scrolls)
+            ):
+                continue
+            top, bottom = region.line_span
+            lines = front_buffer[top:bottom]
+            if distance > 0:
+                lines = lines[distance:] + [exposed_line] * distance
+            else:
+                lines = [exposed_line] * -distance + lines[:distance]
+            front_buffer[top:bottom] = lines
+            scrolls.append((region, distance))
+
+        return scrolls
+
+    def _update_front_buffer(
+        self,
+        chops: Sequence[Mapping[int, Strip | None]],
+        spans: list[tuple[int, int, int]],
+        chop_ends: list[list[int]],
+    ) -> list[tuple[int, int, int]]:
+        """Compare rendered chops with the front buffer, and narrow spans to changed cells.
+
+        The front buffer is updated with the new content, so that it reflects what will
+        be on the terminal once the update is written.
+
+        Args:
+            chops: Rendered chops.
+            spans: Spans that require an update.
+            chop_ends: A list of the end offsets for each line.
+
+        Returns:
+            Spans covering only the cells that differ from the front buffer.
+        """
+        front_buffer = self._front_buffer
+        width, height = self.size
+        if front_buffer is None or len(front_buffer) != height:
+            self._front_buffer = None
+            return spans
+
+        changed_spans: list[tuple[int, int, int]] = []
+        add_span = changed_spans.append
+        _line_diff = line_diff
+        join = Strip.join
+
+        for y, x1, x2 in spans:
+            x2 = min(x2, width)
+            if not 0 <= y < height or x1 >= x2:
+                continue
+            new_strips: list[Strip] = []
+            for end, (x, strip) in zip(chop_ends[y], chops[y].items()):
+                if x >= x2 or end <= x1:
+                    continue
+                if strip is None:
+                    # Content not rendered; we can no longer know what is on screen
+                    self._front_buffer = None
+                    return spans
+                new_strips.append(strip.crop(max(0, x1 - x), min(end, x2) - x))
+            new_strip = join(new_strips)
+            front_line = front_buffer[y]
+            if new_strip.cell_length != x2 - x1 or front_line.cell_length != width:
+                self._front_buffer = None
+                return spans
+            diff = _line_diff(
+                front_line.crop(x1, x2)._segments, new_strip._segments, x2 - x1
+            )
+            if diff is None:
+                continue
+            start, end = diff
+            add_span((y, x1 + start, x1 + end))
+            front_buffer[y] = join(
+                [front_line.crop(0, x1), new_strip, front_line.crop(x2, width)]
+            )
+
+        return changed_spans
+
     def render_strips(self, size: Size | None = None) -> list[Strip]:
         """Render to a list of strips.
 
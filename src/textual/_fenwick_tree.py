@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from itertools import accumulate, islice
+from typing import Iterable, Iterator
+
+
+class FenwickTree:
+    """A list of integers which can efficiently sum any prefix of its values.
+
+    Updating a value, summing a prefix, and finding the value at a running total are
+    O(log n) operations. Inserting or removing values invalidates the tree after the
+    first changed value. The tree is repaired lazily, and only as far as required by
+    later operations, so inserting values near the position of the next operation is
+    also cheap.
+    """
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        """Initialize a Fenwick tree.
+
+        Args:
+            values: Initial values.
+        """
+        self._values: list[int] = list(values)
+        self._tree: list[int] = [0]
+        """Tree nodes (1 based), up to and including the last valid node."""
+        self._total = sum(self._values)
+        """The sum of all values."""
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._values)
+
+    def __getitem__(self, index: int) -> int:
+        return self._values[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        values = self._values
+        if index < 0:
+            index += len(values)
+        delta = value - values[index]
+        values[index] = value
+        if delta:
+            self._total += delta
+            self._update_tree(index, delta)
+
+    def _update_tree(self, index: int, delta: int) -> None:
+        """Add a delta to the valid nodes which include a value.
+
+        Args:
+            index: Index of the value which changed.
+            delta: Change in the value.
+        """
+        tree = self._tree
+        valid_nodes = len(tree) - 1
+        node = index + 1
+        while node <= valid_nodes:
+            tree[node] += delta
+            node += node & -node
+
+    def replace(self, start: int, stop: int, values: Iterable[int]) -> None:
+        """Replace a range of values, like assigning to a slice of a list.
+
+        Args:
+            start: Index of first value to replace.
+            stop: Index after the last value to replace.
+            values: New values, which may be more or fewer than the values replaced.
+        """
+        tree_values = self._values
+        old_values = tree_values[start:stop]
+        new_values = list(values)
+        tree_values[start:stop] = new_values
+        self._total += sum(new_values) - sum(old_values)
+        if len(old_values) == len(new_values):
+            update_tree = self._update_tree
+            for index, (old_value, new_value) in enumerate(
+                zip(old_values, new_values), start
+            ):
+                if old_value != new_value:
+                    update_tree(index, new_value - old_value)
+        else:
+            # Nodes after start cover values which have moved
+            del self._tree[start + 1 :]
+
+    def _repair(self, valid_nodes: int) -> None:
+        """Ensure that tree nodes are valid, up to a given node.
+
+        Args:
+            valid_nodes: Number of nodes required.
+        """
+        tree = self._tree
+        values = self._values
+        first_node = len(tree)
+        if valid_nodes - first_node > first_node:
+            # Most of the tree is required, so compute each node from prefix sums
+            prefix_sums = list(accumulate(islice(values, valid_nodes), initial=0))
+            tree.extend(
+                prefix_sums[node] - prefix_sums[node & (node - 1)]
+                for node in range(first_node, valid_nodes + 1)
+            )
+            return
+        for node in range(first_node, valid_nodes + 1):
+            # A node is its value plus the nodes which cover the values before it.
+            total = values[node - 1]
+            lowest_bit = node & -node
+            child_offset = 1
+            while child_offset < lowest_bit:
+                total += tree[node - child_offset]
+                child_offset <<= 1
+            tree.append(total)
+
+    def prefix_sum(self, index: int) -> int:
+        """Sum the values before an index.
+
+        Args:
+            index: Index of the first value to exclude, or the number of values to sum
+                all values.
+
+        Returns:
+            The sum of `values[:index]`.
+        """
+        index = min(max(0, index), len(self._values))
+        if index >= len(self._tree):
+            self._repair(index)
+        tree = self._tree
+        total = 0
+        while index:
+            total += tree[index]
+            index &= index - 1
+        return total
+
+    def find(self, target: int) -> int:
+        """Find the index of the value which contains a running total.
+
+        Values must not be negative. The tree is only repaired as far as required,
+        which is at most twice as far as the value which is found.
+
+        Args:
+            target: A total from 0 up to (but not including) the sum of all values.
+
+        Returns:
+            The index `i` where `prefix_sum(i) <= target < prefix_sum(i + 1)`, or the
+                number of values if the target is not less than the total.
+        """
+        tree = self._tree
+        size = len(self._values)
+        while True:
+            valid_nodes = len(tree) - 1
+            index = 0
+            remaining = target
+            step = 1 << valid_nodes.bit_length()
+            while step:
+                next_index = index + step
+                if next_index <= valid_nodes and tree[next_index] <= remaining:
+                    index = next_index
+                    remaining -= tree[next_index]
+                step >>= 1
+            if index < valid_nodes or valid_nodes == size:
+                return index
+            # The value may be after the valid nodes
+            self._repair(min(size, max(2 * valid_nodes, 16)))
+
+    @property
+    def total(self) -> int:
+        """The sum of all values."""
+        return self._total
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, AbstractSet, Iterable
+
+from .css.model import CombinatorType, SelectorSet, SelectorType
+
+if TYPE_CHECKING:
+    from .dom import DOMNode
+    from .widget import Widget
+
+
+class QueryIndex:
+    """An index of the widgets on a screen, by ID, CSS type name, and class name.
+
+    The index is used to find the widgets which may match a query, without walking
+    the DOM. It contains the screen, and every widget which has been registered on
+    the screen and not yet unregistered.
+    """
+
+    def __init__(self) -> None:
+        self._widgets: defaultdict[str, set[Widget]] = defaultdict(set)
+        """Maps a selector name (e.g. "#id", ".class", or "Type") on to widgets."""
+
+    @classmethod
+    def _get_names(cls, widget: DOMNode) -> Iterable[str]:
+        """Get the selector names of a widget which are indexed.
+
+        Args:
+            widget: A widget.
+
+        Returns:
+            Selector names.
+        """
+        yield from widget._css_type_names
+        yield from (f".{class_name}" for class_name in widget._classes)
+        if widget._id is not None:
+            yield f"#{widget._id}"
+
+    def add(self, widget: Widget) -> None:
+        """Add a widget to the index.
+
+        Args:
+            widget: A widget.
+        """
+        index = self._widgets
+        for name in self._get_names(widget):
+            index[name].add(widget)
+        widget._query_index = self
+
+    def discard(self, widget: Widget) -> None:
+        """Remove a widget from the index, if it is present.
+
+        Args:
+            widget: A widget.
+        """
+        index = self._widgets
+        for name in self._get_names(widget):
+            widgets = index.get(name)
+            if widgets is not None:
+                widgets.discard(widget)
+                if not widgets:
+                    del index[name]
+        widget._query_index = None
+
+    def update_classes(self, widget: DOMNode, old_classes: AbstractSet[str]) -> None:
+        """Update the index after the classes of a widget have changed.
+
+        Args:
+            widget: A widget in the index.
+            old_classes: The classes of the widget before the change.
+        """
+        index = self._widgets
+        new_classes = widget._classes
+        for class_name in old_classes - new_classes:
+            widgets = index.get(f".{class_name}")
+            if widgets is not None:
+                widgets.discard(widget)  # type: ignore[arg-type]
+                if not widgets:
+                    del index[f".{class_name}"]
+        for class_name in new_classes - old_classes:
+            index[f".{class_name}"].add(widget)  # type: ignore[arg-type]
+
+    def _get_selector_set_candidates(
+        self, selector_set: SelectorSet
+    ) -> AbstractSet[Widget] | None:
+        """Get the widgets which may match a selector set.
+
+        Args:
+            selector_set: A selector set.
+
+        Returns:
+            A set of widgets, or `None` if the rightmost selector has no indexed name.
+        """
+        index = self._widgets
+        candidates: AbstractSet[Widget] | None = None
+        for selector in reversed(selector_set.selectors):
+            # Check the selectors in the rightmost compound selector
+            selector_type = selector.type
+            if selector_type == SelectorType.ID:
+                name = f"#{selector.name}"
+            elif selector_type == SelectorType.CLASS:
+                name = f".{selector.name}"
+            elif selector_type == SelectorType.TYPE:
+                name = selector.name
+            else:
+                name = None
+            if name is not None:
+                widgets = index.get(name, frozenset())
+                if candidates is None or len(widgets) < len(candidates):
+                    candidates = widgets
+            if selector.combinator != CombinatorType.SAME:
+                break
+        return candidates
+
+    def get_candidates(
+        self, filters: Iterable[tuple[SelectorSet, ...]]
+    ) -> AbstractSet[Widget] | None:
+        """Get the widgets which may match all of the filters of a query.
+
+        Args:
+            filters: The filters of a query, where a widget must match at least
+                one selector set of each filter.
+
+        Returns:
+            A set of widgets which includes every matching widget (and possibly
+                others), or `None` if the index can't narrow down the widgets.
+                The set must not be modified.
+        """
+        candidates: AbstractSet[Widget] | None = None
+        for selector_sets in filters:
+            filter_candidates: AbstractSet[Widget] | None = None
+            for selector_set in selector_sets:
+                selector_set_candidates = self._get_selector_set_candidates(
+                    selector_set
+                )
+                if selector_set_candidates is None:
+                    # Any widget may match this filter
+                    filter_candidates = None
+                    break
+                if filter_candidates is None:
+                    filter_candidates = selector_set_candidates
+                else:
+                    filter_candidates = filter_candidates | selector_set_candidates
+            if filter_candidates is not None and (
+                candidates is None or len(filter_candidates) < len(candidates)
+            ):
+                candidates = filter_candidates
+        return candidates
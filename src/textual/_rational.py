@@ -0,0 +1,65 @@
+"""
+Exact arithmetic for layout, which avoids `Fraction` where values are whole.
+
+Layout values are exact rationals, but most are whole numbers of cells. An `int`
+is an exact rational, and arithmetic on ints is much faster than on `Fraction`
+objects. These functions return an `int` where the result is whole, and only
+create a `Fraction` where a value has a fractional part.
+"""
+
+from __future__ import annotations
+
+from fractions import Fraction
+from typing import Union
+
+Rational = Union[int, Fraction]
+"""An exact value, which is an `int` if it is whole."""
+
+
+def exact(value: float | Fraction) -> Rational:
+    """Convert a number to an exact value.
+
+    Args:
+        value: A number.
+
+    Returns:
+        An `int` if the value is whole, otherwise a `Fraction`.
+    """
+    integer = int(value)
+    if integer == value:
+        return integer
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+
+def divide(numerator: Rational, denominator: Rational) -> Rational:
+    """Divide two exact values.
+
+    Args:
+        numerator: The value to divide.
+        denominator: The value to divide by, which must not be zero.
+
+    Returns:
+        The exact quotient, which is an `int` if it is whole.
+    """
+    if type(numerator) is int and type(denominator) is int:
+        quotient, remainder = divmod(numerator, denominator)
+        if not remainder:
+            return quotient
+        return Fraction(numerator, denominator)
+    fraction = Fraction(numerator, denominator)
+    return fraction.numerator if fraction.denominator == 1 else fraction
+
+
+def truncate(numerator: int, denominator: int) -> int:
+    """Divide two integers, rounding towards zero (like `int(Fraction(...))`).
+
+    Args:
+        numerator: The value to divide.
+        denominator: The value to divide by, which must be positive.
+
+    Returns:
+        The quotient, rounded towards zero.
+    """
+    if numerator < 0:
+        return -(-numerator // denominator)
+    return numerator // denominator
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from fractions import Fraction
-from itertools import accumulate
+from math import gcd
 from typing import TYPE_CHECKING, Iterable, Sequence, cast
 
 from typing_extensions import Literal
 
+from ._rational import Rational, divide, exact, truncate
 from .box_model import BoxModel
 from .css.scalar import Scalar
 from .css.styles import RenderStyles
@@ -24,6 +24,9 @@ def resolve(
 ) -> list[tuple[int, int]]:
     """Resolve a list of dimensions.
 
+    Lengths are calculated with integers only. Every length is a multiple of a
+    common denominator, so the remainders of fraction units are distributed exactly.
+
     Args:
         dimensions: Scalars for column / row sizes.
         total: Total space to divide.
@@ -34,47 +37,59 @@ def resolve(
     Returns:
         List of (<OFFSET>, <LENGTH>)
     """
-    resolved: list[tuple[Scalar, Fraction | None]] = [
+    if not dimensions:
+        return []
+
+    # Each dimension as an integer ratio (of cells, or fraction units)
+    ratios = [
         (
-            (scalar, None)
+            scalar.value.as_integer_ratio()
             if scalar.is_fraction
-            else (scalar, scalar.resolve(size, viewport))
+            else scalar.resolve(size, viewport).as_integer_ratio()
         )
         for scalar in dimensions
     ]
-
-    from_float = Fraction.from_float
-    total_fraction = from_float(
-        sum([scalar.value for scalar, fraction in resolved if fraction is None])
-    )
-
-    if total_fraction:
+    denominator = 1
+    for _, ratio_denominator in ratios:
+        if ratio_denominator != 1:
+            denominator *= ratio_denominator // gcd(denominator, ratio_denominator)
+
+    # Numerators of the dimensions over the common denominator
+    fraction_total = 0
+    consumed = 0
+    numerators: list[int] = []
+    for scalar, (numerator, ratio_denominator) in zip(dimensions, ratios):
+        numerator *= denominator // ratio_denominator
+        numerators.append(numerator)
+        if scalar.is_fraction:
+            fraction_total += numerator
+        else:
+            consumed += numerator
+
+    if fraction_total:
+        # A fraction unit is `remaining / fraction_total`, so scale lengths in cells
+        # by `fraction_total`, to keep every length a whole multiple.
         total_gutter = gutter * (len(dimensions) - 1)
-        consumed = sum([fraction for _, fraction in resolved if fraction is not None])
-        remaining = max(Fraction(0), Fraction(total - total_gutter) - consumed)
-        fraction_unit = Fraction(remaining, total_fraction)
-        resolved_fractions = [
-            from_float(scalar.value) * fraction_unit if fraction is None else fraction
-            for scalar, fraction in resolved
+        remaining = max(0, (total - total_gutter) * denominator - consumed)
+        lengths = [
+            numerator * remaining if scalar.is_fraction else numerator * fraction_total
+            for scalar, numerator in zip(dimensions, numerators)
         ]
+        denominator *= fraction_total
     else:
-        resolved_fractions = cast(
-            "list[Fraction]", [fraction for _, fraction in resolved]
-        )
-
-    fraction_gutter = Fraction(gutter)
-    offsets = [0] + [
-        int(fraction)
-        for fraction in accumulate(
-            value
-            for fraction in resolved_fractions
-            for value in (fraction, fraction_gutter)
-        )
-    ]
-    results = [
-        (offset1, offset2 - offset1)
-        for offset1, offset2 in zip(offsets[::2], offsets[1::2])
-    ]
+        lengths = numerators
+
+    gutter_length = gutter * denominator
+    results: list[tuple[int, int]] = []
+    add_result = results.append
+    position = 0
+    offset = 0
+    for length in lengths:
+        position += length
+        next_offset = truncate(position, denominator)
+        add_result((offset, next_offset - offset))
+        position += gutter_length
+        offset = truncate(position, denominator)
 
     return results
 
@@ -83,9 +98,9 @@ def resolve_fraction_unit(
     widget_styles: Iterable[RenderStyles],
     size: Size,
     viewport_size: Size,
-    remaining_space: Fraction,
+    remaining_space: Rational,
     resolve_dimension: Literal["width", "height"] = "width",
-) -> Fraction:
+) -> Rational:
     """Calculate the fraction.
 
     Args:
@@ -99,13 +114,13 @@ def resolve_fraction_unit(
         The value of 1fr.
     """
     if not remaining_space or not widget_styles:
-        return Fraction(1)
+        return 1
 
     initial_space = remaining_space
 
     def resolve_scalar(
-        scalar: Scalar | None, fraction_unit: Fraction = Fraction(1)
-    ) -> Fraction | None:
+        scalar: Scalar | None, fraction_unit: Rational = 1
+    ) -> Rational | None:
         """Resolve a scalar if it is not None.
 
         Args:
@@ -113,7 +128,7 @@ def resolve_fraction_unit(
             fraction_unit: Size of 1fr.
 
         Returns:
-            Fraction if resolved, otherwise None.
+            Size if resolved, otherwise None.
         """
         return (
             None
@@ -121,7 +136,7 @@ def resolve_fraction_unit(
             else scalar.resolve(size, viewport_size, fraction_unit)
         )
 
-    resolve: list[tuple[Scalar, Fraction | None, Fraction | None]] = []
+    resolve: list[tuple[Scalar, Rational | None, Rational | None]] = []
 
     if resolve_dimension == "width":
         resolve = [
@@ -144,24 +159,24 @@ def resolve_fraction_unit(
             if styles.overlay != "screen"
         ]
 
-    resolved: list[Fraction | None] = [None] * len(resolve)
-    remaining_fraction = Fraction(sum(scalar.value for scalar, _, _ in resolve))
+    resolved: list[Rational | None] = [None] * len(resolve)
+    remaining_fraction = exact(sum(scalar.value for scalar, _, _ in resolve))
 
     while remaining_fraction > 0:
         remaining_space_changed = False
-        resolve_fraction = Fraction(remaining_space, remaining_fraction)
+        resolve_fraction = divide(remaining_space, remaining_fraction)
         for index, (scalar, min_value, max_value) in enumerate(resolve):
             value = resolved[index]
             if value is None:
                 resolved_scalar = scalar.resolve(size, viewport_size, resolve_fraction)
                 if min_value is not None and resolved_scalar < min_value:
                     remaining_space -= min_value
-                    remaining_fraction -= Fraction(scalar.value)
+                    remaining_fraction -= exact(scalar.value)
                     resolved[index] = min_value
                     remaining_space_changed = True
                 elif max_value is not None and resolved_scalar > max_value:
                     remaining_space -= max_value
-                    remaining_fraction -= Fraction(scalar.value)
+                    remaining_fraction -= exact(scalar.value)
                     resolved[index] = max_value
                     remaining_space_changed = True
 
@@ -169,7 +184,7 @@ def resolve_fraction_unit(
             break
 
     return (
-        Fraction(remaining_space, remaining_fraction)
+        divide(remaining_space, remaining_fraction)
         if remaining_fraction > 0
         else initial_space
     )
@@ -198,8 +213,8 @@ def resolve_box_models(
     """
     margin_width, margin_height = margin
 
-    fraction_width = Fraction(max(0, size.width - margin_width))
-    fraction_height = Fraction(max(0, size.height - margin_height))
+    fraction_width = max(0, size.width - margin_width)
+    fraction_height = max(0, size.height - margin_height)
 
     margin_size = size - margin
 
@@ -243,11 +258,11 @@ def resolve_box_models(
             ],
             size,
             viewport_size,
-            Fraction(remaining_space),
+            remaining_space,
             resolve_dimension,
         )
         width_fraction = fraction_unit
-        height_fraction = Fraction(margin_size.height)
+        height_fraction: Rational = margin_size.height
     else:
         total_remaining = int(
             sum(
@@ -270,10 +285,10 @@ def resolve_box_models(
             ],
             size,
             viewport_size,
-            Fraction(remaining_space),
+            remaining_space,
             resolve_dimension,
         )
-        width_fraction = Fraction(margin_size.width)
+        width_fraction = margin_size.width
         height_fraction = fraction_unit
 
     box_models = [
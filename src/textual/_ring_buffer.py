@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable, Iterator, Sequence, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class RingBuffer(Sequence[T]):
+    """A sequence with an optional maximum length, which discards the oldest items when full.
+
+    Appending and discarding items are O(1) operations, as is indexing. The number of
+    items discarded is tracked in `offset`, so that items may be referred to by an absolute
+    index (index + offset) which doesn't change as older items are discarded.
+    """
+
+    def __init__(self, items: Iterable[T] = (), maxlen: int | None = None) -> None:
+        """Initialize a ring buffer.
+
+        Args:
+            items: Initial items.
+            maxlen: Maximum number of items, or `None` for no maximum.
+        """
+        self._maxlen = maxlen
+        self._items: list[T] = []
+        self._start = 0
+        self._offset = 0
+        self.extend(items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __repr__(self) -> str:
+        return f"RingBuffer({list(self)!r}, maxlen={self._maxlen!r})"
+
+    def __iter__(self) -> Iterator[T]:
+        items = self._items
+        start = self._start
+        if not start:
+            return iter(items)
+        return iter([*islice(items, start, None), *islice(items, start)])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RingBuffer):
+            return list(self) == list(other)
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def _get_index(self, index: int) -> int:
+        """Get the index of an item in the underlying list.
+
+        Args:
+            index: Index of item (may be negative).
+
+        Raises:
+            IndexError: If the index is out of range.
+
+        Returns:
+            Index in to the list of items.
+        """
+        size = len(self._items)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("RingBuffer index out of range")
+        index += self._start
+        return index - size if index >= size else index
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            items = self._items
+            start = self._start
+            if not start:
+                return items[index]
+            size = len(items)
+            # Only copy the items in the slice
+            return [items[(position + start) % size] for position in range(size)[index]]
+        return self._items[self._get_index(index)]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        self._items[self._get_index(index)] = value
+
+    @property
+    def maxlen(self) -> int | None:
+        """Maximum number of items, or `None` for no maximum."""
+        return self._maxlen
+
+    @maxlen.setter
+    def maxlen(self, maxlen: int | None) -> None:
+        items = list(self)
+        if maxlen is not None and len(items) > maxlen:
+            discard = len(items) - maxlen
+            self._offset += discard
+            items = items[discard:]
+        self._items = items
+        self._start = 0
+        self._maxlen = maxlen
+
+    @property
+    def offset(self) -> int:
+        """The number of items that have been discarded from the start of the buffer."""
+        return self._offset
+
+    def append(self, item: T) -> None:
+        """Append an item, discarding the oldest item if the buffer is full.
+
+        Args:
+            item: Item to append.
+        """
+        maxlen = self._maxlen
+        items = self._items
+        if maxlen is None or len(items) < maxlen:
+            items.append(item)
+        elif maxlen:
+            start = self._start
+            items[start] = item
+            start += 1
+            self._start = 0 if start == maxlen else start
+            self._offset += 1
+        else:
+            self._offset += 1
+
+    def extend(self, items: Iterable[T]) -> None:
+        """Append a number of items, discarding the oldest items if required.
+
+        Args:
+            items: Items to append.
+        """
+        if self._maxlen is None:
+            self._items.extend(items)
+        else:
+            append = self.append
+            for item in items:
+                append(item)
+
+    def clear(self) -> None:
+        """Remove all items, and reset the offset."""
+        self._items.clear()
+        self._start = 0
+        self._offset = 0
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+from typing import Generic, Hashable, Iterable, Iterator, TypeVar
+
+from ._fenwick_tree import FenwickTree
+
+Key = TypeVar("Key", bound=Hashable)
+
+_COMPACT_MINIMUM = 1024
+"""Minimum number of removed rows before the slots are compacted."""
+
+
+class RowIndex(Generic[Key]):
+    """An ordered index of rows with variable heights.
+
+    Maps row keys to row indices (and back), and row indices to the line on which the
+    row starts (and back). Rows may be appended and removed without rebuilding the index.
+
+    Each row is stored in a slot numbered in the order the rows were added. Whether a
+    slot holds a row, and the height of its row, are stored in Fenwick trees, so
+    appending, removing, and every lookup are O(log n). Removed slots are compacted
+    once they outnumber the rows.
+    """
+
+    def __init__(self, rows: Iterable[tuple[Key, int]] = ()) -> None:
+        """Initialize a row index.
+
+        Args:
+            rows: An iterable of (KEY, HEIGHT) tuples, in order.
+        """
+        self._slot_keys: list[Key] = []
+        """The key of each slot. Only valid for slots which hold a row."""
+        heights: list[int] = []
+        for key, height in rows:
+            self._slot_keys.append(key)
+            heights.append(height)
+        self._slots: dict[Key, int] = {
+            key: slot for slot, key in enumerate(self._slot_keys)
+        }
+        """Maps a key on to its slot."""
+        self._alive = FenwickTree([1] * len(self._slot_keys))
+        """1 for each slot which holds a row, and 0 for each removed row."""
+        self._heights = FenwickTree(heights)
+        """The height of the row in each slot, or 0 for removed rows."""
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._slots
+
+    def __iter__(self) -> Iterator[Key]:
+        return (key for key, alive in zip(self._slot_keys, self._alive) if alive)
+
+    def _get_slot(self, index: int) -> int:
+        """Get the slot of the row at a given index.
+
+        Args:
+            index: Row index, which must be valid.
+
+        Returns:
+            Slot number.
+        """
+        return self._alive.find(index)
+
+    def get(self, key: Key) -> int | None:
+        """Get the index of a row.
+
+        Args:
+            key: Row key.
+
+        Returns:
+            The index of the row, or `None` if it doesn't exist.
+        """
+        slot = self._slots.get(key)
+        if slot is None:
+            return None
+        return self._alive.prefix_sum(slot)
+
+    def get_key(self, index: int) -> Key | None:
+        """Get the key of a row at a given index.
+
+        Args:
+            index: Row index.
+
+        Returns:
+            The row key, or `None` if there is no row at that index.
+        """
+        if 0 <= index < len(self._slots):
+            return self._slot_keys[self._get_slot(index)]
+        return None
+
+    def get_height(self, index: int) -> int:
+        """Get the height of the row at a given index.
+
+        Args:
+            index: Row index.
+
+        Returns:
+            Height of the row, in lines.
+        """
+        if not 0 <= index < len(self._slots):
+            raise IndexError(index)
+        return self._heights[self._get_slot(index)]
+
+    def append(self, key: Key, height: int) -> int:
+        """Add a row at the end.
+
+        Args:
+            key: Row key.
+            height: Height of the row, in lines.
+
+        Returns:
+            Index of the new row.
+        """
+        index = len(self._slots)
+        slot = len(self._slot_keys)
+        self._slot_keys.append(key)
+        self._slots[key] = slot
+        self._alive.replace(slot, slot, [1])
+        self._heights.replace(slot, slot, [height])
+        return index
+
+    def remove(self, key: Key) -> int:
+        """Remove a row.
+
+        Args:
+            key: Row key.
+
+        Raises:
+            KeyError: If the row doesn't exist.
+
+        Returns:
+            The index the row was at.
+        """
+        slot = self._slots.pop(key)
+        index = self._alive.prefix_sum(slot)
+        self._alive[slot] = 0
+        self._heights[slot] = 0
+        removed_count = len(self._slot_keys) - len(self._slots)
+        if removed_count >= _COMPACT_MINIMUM and removed_count > len(self._slots):
+            self._compact()
+        return index
+
+    def _compact(self) -> None:
+        """Discard the slots of removed rows."""
+        keys = list(self)
+        heights = [height for height, alive in zip(self._heights, self._alive) if alive]
+        self._slot_keys = keys
+        self._slots = {key: slot for slot, key in enumerate(keys)}
+        self._alive = FenwickTree([1] * len(keys))
+        self._heights = FenwickTree(heights)
+
+    def set_height(self, index: int, height: int) -> None:
+        """Set the height of the row at a given index.
+
+        Args:
+            index: Row index.
+            height: New height, in lines.
+        """
+        if not 0 <= index < len(self._slots):
+            raise IndexError(index)
+        self._heights[self._get_slot(index)] = height
+
+    @property
+    def total_height(self) -> int:
+        """Total height of all rows, in lines."""
+        return self._heights.total
+
+    def get_line(self, index: int) -> int:
+        """Get the line on which a row starts.
+
+        Args:
+            index: Row index, or the number of rows to get the total height.
+
+        Returns:
+            Line offset of the first line of the row.
+        """
+        if index >= len(self._slots):
+            return self._heights.total
+        if index <= 0:
+            return 0
+        return self._heights.prefix_sum(self._get_slot(index))
+
+    def get_row_at_line(self, y: int) -> tuple[int, int]:
+        """Get the row which covers a given line.
+
+        Args:
+            y: Line offset.
+
+        Raises:
+            LookupError: If there is no row at the given line.
+
+        Returns:
+            A tuple of the row index, and the line offset within the row.
+        """
+        heights = self._heights
+        if not 0 <= y < heights.total:
+            raise LookupError(f"No row at line {y!r}")
+        slot = heights.find(y)
+        return self._alive.prefix_sum(slot), y - heights.prefix_sum(slot)
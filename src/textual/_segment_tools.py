@@ -179,6 +179,82 @@ def line_pad(
     return list(segments)
 
 
+def line_diff(
+    old_segments: list[Segment], new_segments: list[Segment], total: int
+) -> tuple[int, int] | None:
+    """Find the cells that differ between two lines of the same cell length.
+
+    Identical segments are skipped from both ends of the lines, and segments with no
+    text are ignored. Where the first (or last) differing segments share a style and
+    contain only ASCII, common characters within those segments are skipped too.
+
+    Args:
+        old_segments: The line currently on screen.
+        new_segments: The line to replace it with.
+        total: Total cell length of both lines.
+
+    Returns:
+        A tuple of the start and end cell offsets of the changed cells, or `None` if the
+            lines are visually identical.
+    """
+    if old_segments == new_segments:
+        return None
+
+    # Segments with no text produce no output
+    old_segments = [segment for segment in old_segments if segment.text]
+    new_segments = [segment for segment in new_segments if segment.text]
+
+    _cell_len = cell_len
+    old_count = len(old_segments)
+    new_count = len(new_segments)
+
+    start = 0
+    index = 0
+    while (
+        index < old_count
+        and index < new_count
+        and old_segments[index] == new_segments[index]
+    ):
+        start += _cell_len(old_segments[index].text)
+        index += 1
+
+    if index < old_count and index < new_count:
+        old_text, old_style, _ = old_segments[index]
+        new_text, new_style, _ = new_segments[index]
+        if old_style == new_style and old_text.isascii() and new_text.isascii():
+            for old_character, new_character in zip(old_text, new_text):
+                if old_character != new_character:
+                    break
+                start += 1
+
+    end = total
+    old_index = old_count - 1
+    new_index = new_count - 1
+    while (
+        old_index >= index
+        and new_index >= index
+        and old_segments[old_index] == new_segments[new_index]
+    ):
+        end -= _cell_len(old_segments[old_index].text)
+        old_index -= 1
+        new_index -= 1
+
+    if old_index >= index and new_index >= index:
+        old_text, old_style, _ = old_segments[old_index]
+        new_text, new_style, _ = new_segments[new_index]
+        if old_style == new_style and old_text.isascii() and new_text.isascii():
+            for old_character, new_character in zip(
+                reversed(old_text), reversed(new_text)
+            ):
+                if old_character != new_character:
+                    break
+                end -= 1
+
+    if end <= start:
+        return None
+    return start, end
+
+
 def align_lines(
     lines: list[list[Segment]],
     style: Style,
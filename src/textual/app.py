@@ -529,7 +529,9 @@ class App(Generic[ReturnType], DOMNode):
         self.design = DEFAULT_COLORS
 
         self._css_has_errors = False
-        self.stylesheet = Stylesheet(variables=self.get_css_variables())
+        self.stylesheet = Stylesheet(
+            variables=self.get_css_variables(), cache_path=constants.CSS_CACHE
+        )
 
         css_path = css_path or self.CSS_PATH
         css_paths = [
@@ -1247,6 +1249,8 @@ class App(Generic[ReturnType], DOMNode):
         screen_render = self.screen._compositor.render_update(
             full=True, screen_stack=self.app._background_screens, simplify=True
         )
+        # The screenshot wasn't written to the terminal
+        self.screen._compositor.clear_front_buffer()
         console.print(screen_render)
         return console.export_svg(title=title or self.title)
 
@@ -1768,16 +1772,31 @@ class App(Generic[ReturnType], DOMNode):
         """
         return self.screen.get_child_by_type(expect_type)
 
-    def update_styles(self, node: DOMNode) -> None:
+    def update_styles(
+        self, node: DOMNode, selector_names: Iterable[str] | None = None
+    ) -> None:
         """Immediately update the styles of this node and all descendant nodes.
 
         Should be called whenever CSS classes / pseudo classes change.
         For example, when you hover over a button, the :hover pseudo class
         will be added, and this method is called to apply the corresponding
         :hover styles.
+
+        Args:
+            node: The node which changed.
+            selector_names: The class names (prefixed with ".") or pseudo classes
+                (prefixed with ":") which changed, or `None` if not known. If none
+                of these names are used to match ancestors in the CSS, only the
+                node itself is updated.
         """
-        descendants = node.walk_children(with_self=True)
-        self.stylesheet.update_nodes(descendants, animate=True)
+        stylesheet = self.stylesheet
+        if selector_names is not None and not stylesheet.affects_descendants(
+            selector_names
+        ):
+            stylesheet.update_nodes([node], animate=True)
+        else:
+            descendants = node.walk_children(with_self=True)
+            stylesheet.update_nodes(descendants, animate=True)
 
     def mount(
         self,
@@ -2769,6 +2788,8 @@ class App(Generic[ReturnType], DOMNode):
         if isinstance(widget._parent, Widget):
             widget._parent._nodes._remove(widget)
             widget._detach()
+        if widget._query_index is not None:
+            widget._query_index.discard(widget)
         self._registry.discard(widget)
 
     async def _disconnect_devtools(self):
@@ -2876,6 +2897,8 @@ class App(Generic[ReturnType], DOMNode):
             return self
 
         if self._screen_stack:
+            if repaint:
+                self.screen._compositor.clear_front_buffer()
             self.screen.refresh(repaint=repaint, layout=layout)
         self.check_idle()
         return self
@@ -2887,8 +2910,7 @@ class App(Generic[ReturnType], DOMNode):
             animate: Also execute CSS animations.
         """
         stylesheet = self.app.stylesheet
-        stylesheet.set_variables(self.get_css_variables())
-        stylesheet.reparse()
+        stylesheet.update_variables(self.get_css_variables())
         stylesheet.update(self.app, animate=animate)
         self.screen._refresh_layout(self.size)
         # The other screens in the stack will need to know about some style
@@ -2898,6 +2920,27 @@ class App(Generic[ReturnType], DOMNode):
             if screen != self.screen:
                 stylesheet.update(screen, animate=animate)
 
+    def refresh_css_variables(self, animate: bool = True) -> None:
+        """Update CSS variables from [get_css_variables][textual.app.App.get_css_variables].
+
+        Only widgets matched by rules which reference variables that changed are
+        updated. Call this rather than [refresh_css][textual.app.App.refresh_css] if
+        only the values of variables have changed, for example to change the accent
+        color.
+
+        Args:
+            animate: Also execute CSS animations.
+        """
+        stylesheet = self.stylesheet
+        updated_rules = stylesheet.update_variables(self.get_css_variables())
+        if not updated_rules:
+            return
+        stylesheet.update_rules(self, updated_rules, animate=animate)
+        for screen in self.screen_stack:
+            if screen != self.screen:
+                stylesheet.update_rules(screen, updated_rules, animate=animate)
+        self.screen._refresh_layout(self.size)
+
     def _display(self, screen: Screen, renderable: RenderableType | None) -> None:
         """Display a renderable within a sync.
 
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
-from fractions import Fraction
 from typing import NamedTuple
 
+from ._rational import Rational
 from .geometry import Spacing
 
 
@@ -10,6 +10,6 @@ class BoxModel(NamedTuple):
     """The result of `get_box_model`."""
 
     # Content + padding + border
-    width: Fraction
-    height: Fraction
+    width: Rational
+    height: Rational
     margin: Spacing  # Additional margin
@@ -115,3 +115,12 @@ COLOR_SYSTEM: Final[str | None] = get_environ("TEXTUAL_COLOR_SYSTEM", "auto")
 
 TEXTUAL_ANIMATIONS: AnimationLevel = _get_textual_animations()
 """Determines whether animations run or not."""
+
+SCROLL_REGIONS: Final[bool] = not _get_environ_bool("TEXTUAL_NO_SCROLL_REGIONS")
+"""Scroll regions of the terminal (with scroll margins) when widgets scroll vertically."""
+
+CSS_CACHE: Final[str | None] = get_environ("TEXTUAL_CSS_CACHE", None)
+"""Directory in which to cache parsed CSS, or `None` to disable the cache.
+
+The directory must be private to the user, as cached CSS is unpickled when read.
+"""
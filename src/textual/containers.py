@@ -7,11 +7,15 @@ With the exception of `Center` and `Middle` containers will fill all of the spac
 
 from __future__ import annotations
 
-from typing import ClassVar
+from typing import TYPE_CHECKING, Callable, ClassVar
 
+from ._fenwick_tree import FenwickTree
 from .binding import Binding, BindingType
 from .widget import Widget
 
+if TYPE_CHECKING:
+    from .app import ComposeResult
+
 
 class Container(Widget):
     """Simple container widget, with vertical layout."""
@@ -151,3 +155,251 @@ class Grid(Widget, inherit_bindings=False):
         layout: grid;
     }
     """
+
+
+class _VirtualSpacer(Widget, inherit_bindings=False):
+    """Takes the place of the items of a `VirtualScroll` which aren't mounted."""
+
+    DEFAULT_CSS = """
+    _VirtualSpacer {
+        width: 1fr;
+        height: 0;
+    }
+    """
+
+
+class VirtualScroll(VerticalScroll):
+    """A vertically scrolling container which mounts only the items in view.
+
+    Items are created on demand by a factory, with the index of the item. Only the
+    items which intersect the viewport (plus a few more above and below) are
+    mounted, and items are removed (or recycled) when they are scrolled out of view.
+    The height of an item which hasn't been mounted is estimated, and replaced with
+    its actual height once it has been mounted.
+    """
+
+    def __init__(
+        self,
+        item_count: int,
+        factory: Callable[[int], Widget],
+        *,
+        recycle: Callable[[Widget, int], None] | None = None,
+        estimated_height: int = 1,
+        overscan: int = 4,
+        name: str | None = None,
+        id: str | None = None,
+        classes: str | None = None,
+        disabled: bool = False,
+    ) -> None:
+        """Initialize a virtual scroll.
+
+        Args:
+            item_count: The number of items.
+            factory: A callable which creates a widget for the item with a given index.
+            recycle: An optional callable which updates a widget, which is no longer
+                in view, to display the item with a given index. If this is not set,
+                a new widget is created for each item scrolled in to view.
+            estimated_height: The estimated height of an item which hasn't been mounted.
+                Values below 1 are treated as 1.
+            overscan: The number of lines above and below the viewport in which items
+                are mounted.
+            name: The name of the widget.
+            id: The ID of the widget in the DOM.
+            classes: The CSS classes of the widget.
+            disabled: Whether the widget is disabled or not.
+        """
+        super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._factory = factory
+        self._recycle = recycle
+        self._estimated_height = max(1, estimated_height)
+        self._overscan = max(0, overscan)
+        self._heights = FenwickTree([self._estimated_height] * item_count)
+        """The measured or estimated height of each item."""
+        self._start = 0
+        """The index of the first mounted item."""
+        self._items: list[Widget] = []
+        """The mounted items, from `_start`."""
+        self._top_spacer = _VirtualSpacer()
+        self._bottom_spacer = _VirtualSpacer()
+
+    def compose(self) -> ComposeResult:
+        yield self._top_spacer
+        yield self._bottom_spacer
+
+    @property
+    def item_count(self) -> int:
+        """The number of items."""
+        return len(self._heights)
+
+    def set_item_count(self, item_count: int) -> None:
+        """Change the number of items.
+
+        Mounted items with an index beyond the new count are removed. Mounted items
+        which remain are not updated.
+
+        Args:
+            item_count: The new number of items.
+        """
+        heights = self._heights
+        old_count = len(heights)
+        if item_count < old_count:
+            heights.replace(item_count, old_count, ())
+            keep = max(0, item_count - self._start)
+            removed = self._items[keep:]
+            del self._items[keep:]
+            if removed:
+                self.app._remove_nodes(removed, self)
+        elif item_count > old_count:
+            heights.replace(
+                old_count,
+                old_count,
+                [self._estimated_height] * (item_count - old_count),
+            )
+        self._refresh_items()
+
+    def get_item(self, index: int) -> Widget | None:
+        """Get the widget for an item, if it is mounted.
+
+        Args:
+            index: The index of the item.
+
+        Returns:
+            A widget, or `None` if the item isn't mounted.
+        """
+        offset = index - self._start
+        if 0 <= offset < len(self._items):
+            return self._items[offset]
+        return None
+
+    def get_item_offset(self, index: int) -> int:
+        """Get the Y offset of an item, within the virtual size of the container.
+
+        Args:
+            index: The index of the item.
+
+        Returns:
+            The offset of the top of the item, which may be estimated.
+        """
+        return self._heights.prefix_sum(index)
+
+    def scroll_to_item(self, index: int, *, animate: bool = True) -> None:
+        """Scroll so that an item is at the top of the container.
+
+        Args:
+            index: The index of the item.
+            animate: Animate the scroll.
+        """
+        self.scroll_to(y=self.get_item_offset(index), animate=animate)
+
+    def _on_mount(self) -> None:
+        self._refresh_items()
+
+    def _on_resize(self) -> None:
+        self._refresh_items()
+
+    def watch_scroll_y(self, old_value: float, new_value: float) -> None:
+        super().watch_scroll_y(old_value, new_value)
+        if round(old_value) != round(new_value):
+            self._refresh_items()
+
+    def _get_item_range(self) -> tuple[int, int]:
+        """Get the range of items which should be mounted.
+
+        Returns:
+            The index of the first item, and the index after the last item.
+        """
+        heights = self._heights
+        top = round(self.scroll_y) - self._overscan
+        bottom = round(self.scroll_y) + self.size.height + self._overscan
+        start = heights.find(max(0, top))
+        end = heights.find(max(0, bottom - 1)) + 1
+        return min(start, len(heights)), min(end, len(heights))
+
+    def _refresh_items(self) -> None:
+        """Mount the items in view, and remove or recycle the items out of view."""
+        if not self.is_attached or self._top_spacer.parent is not self:
+            return
+        start, end = self._get_item_range()
+        old_start = self._start
+        old_end = old_start + len(self._items)
+        if start == old_start and end == old_end:
+            return
+
+        old_items = self._items
+        kept_items = old_items[max(0, start - old_start) : max(0, end - old_start)]
+        if start >= old_end or end <= old_start:
+            kept_items = []
+        kept_start = max(start, old_start) if kept_items else end
+        kept_end = kept_start + len(kept_items)
+        kept = set(kept_items)
+        unused = [item for item in old_items if item not in kept]
+        recycled = unused if self._recycle is not None else []
+
+        def get_items(indices: range, before: Widget) -> list[Widget]:
+            """Get the widgets for a range of items, and add them to the DOM."""
+            items: list[Widget] = []
+            new_items: list[Widget] = []
+            for index in indices:
+                if recycled:
+                    if new_items:
+                        self.mount(*new_items, before=before)
+                        new_items = []
+                    item = recycled.pop()
+                    self._recycle(item, index)  # type: ignore[misc]
+                    self.move_child(item, before=before)
+                else:
+                    item = self._factory(index)
+                    new_items.append(item)
+                items.append(item)
+            if new_items:
+                self.mount(*new_items, before=before)
+            return items
+
+        with self.app.batch_update():
+            top_items = get_items(
+                range(start, kept_start),
+                kept_items[0] if kept_items else self._bottom_spacer,
+            )
+            bottom_items = get_items(range(kept_end, end), self._bottom_spacer)
+            removed = recycled if self._recycle is not None else unused
+            if removed:
+                self.app._remove_nodes(removed, self)
+            self._start = start
+            self._items = top_items + kept_items + bottom_items
+            self._update_spacers()
+        self.call_after_refresh(self._measure_items)
+
+    def _update_spacers(self) -> None:
+        """Set the height of the spacers, to the height of the items not mounted."""
+        heights = self._heights
+        start = self._start
+        end = start + len(self._items)
+        self._top_spacer.styles.height = heights.prefix_sum(start)
+        self._bottom_spacer.styles.height = heights.total - heights.prefix_sum(end)
+
+    def _measure_items(self) -> None:
+        """Replace the estimated heights of the mounted items with their heights.
+
+        The item at the top of the viewport is kept in place, if the height of any
+        item above it has changed.
+        """
+        heights = self._heights
+        scroll_y = round(self.scroll_y)
+        anchor_index = heights.find(scroll_y)
+        anchor_offset = heights.prefix_sum(anchor_index)
+        changed = False
+        for index, item in enumerate(self._items, self._start):
+            if not item.is_mounted or item.parent is not self:
+                continue
+            height = item.outer_size.height
+            if height and heights[index] != height:
+                heights[index] = height
+                changed = True
+        if changed:
+            self._update_spacers()
+            new_anchor_offset = heights.prefix_sum(anchor_index)
+            if new_anchor_offset != anchor_offset:
+                self.scroll_to(
+                    y=scroll_y + new_anchor_offset - anchor_offset, animate=False
+                )
+            self._refresh_items()
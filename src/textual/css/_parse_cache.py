@@ -0,0 +1,167 @@
+"""
+A cache of parsed CSS, stored on disk.
+
+Each parsed source is stored in its own file, named with a hash of the CSS, the
+arguments used to parse it, the CSS variables, and the version of Textual. A change
+to any of these reads a different file, so stale entries are never loaded. Old entries
+are deleted when a new one is written, keeping the most recently used files.
+
+Cache files are unpickled, so anyone who can write to the cache directory could run
+code in the app. The directory must be private to the user: on platforms with POSIX
+permissions, files are only read (or written) if the directory and the file are owned by
+the current user, and aren't writable by the group or others.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import stat
+from contextlib import suppress
+from hashlib import sha256
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Hashable
+
+from .model import RuleSet
+
+_CACHE_FORMAT = 2
+"""Increment to ignore files written in an earlier format."""
+
+MAX_CACHE_FILES = 100
+"""Maximum number of cache files to keep in the cache directory."""
+
+_textual_version: str | None = None
+
+
+def _get_textual_version() -> str:
+    """Get the version of Textual, which is looked up on first use.
+
+    Returns:
+        The version string.
+    """
+    global _textual_version
+    if _textual_version is None:
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            _textual_version = version("textual")
+        except PackageNotFoundError:
+            _textual_version = ""
+    return _textual_version
+
+
+def _is_private(path: Path) -> bool:
+    """Check that a path is owned by the current user, and not writable by others.
+
+    Always `True` on platforms without POSIX permissions.
+
+    Args:
+        path: A path to a file or directory.
+
+    Returns:
+        `True` if the path is private, or `False` if it isn't or doesn't exist.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        path_stat = path.stat()
+    except OSError:
+        return False
+    return path_stat.st_uid == os.getuid() and not (
+        path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def get_cache_file(cache_path: str | Path, key: Hashable) -> Path:
+    """Get the path to the file which caches parsed CSS.
+
+    Args:
+        cache_path: The cache directory.
+        key: A key which identifies the CSS and the arguments used to parse it.
+
+    Returns:
+        The path to the cache file, which may not exist.
+    """
+    digest = sha256(
+        repr((_CACHE_FORMAT, _get_textual_version(), key)).encode("utf-8")
+    ).hexdigest()
+    return Path(cache_path).expanduser() / f"{digest}.rules"
+
+
+def read_rules(cache_file: Path) -> list[RuleSet] | None:
+    """Read parsed rules from a cache file.
+
+    Args:
+        cache_file: The path to the cache file.
+
+    Returns:
+        A list of rules, or `None` if the file doesn't exist, can't be read, or
+            it or its directory may be written by other users.
+    """
+    if not (_is_private(cache_file.parent) and _is_private(cache_file)):
+        return None
+    try:
+        with open(cache_file, "rb") as rules_file:
+            rules = pickle.load(rules_file)
+    except Exception:
+        return None
+    if not isinstance(rules, list):
+        return None
+    # Mark the file as recently used, so it is kept when old entries are deleted
+    with suppress(OSError):
+        os.utime(cache_file)
+    return rules
+
+
+def write_rules(cache_file: Path, rules: list[RuleSet]) -> None:
+    """Write parsed rules to a cache file, and delete the least recently used files
+    if there are more than `MAX_CACHE_FILES`.
+
+    Errors writing the file are ignored, as the cache is an optimization only. The
+    cache directory is created private to the user, and nothing is written to an
+    existing directory which isn't private.
+
+    Args:
+        cache_file: The path to the cache file.
+        rules: The rules to store.
+    """
+    data = pickle.dumps(rules, protocol=pickle.HIGHEST_PROTOCOL)
+    cache_directory = cache_file.parent
+    temp_path: str | None = None
+    try:
+        cache_directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private(cache_directory):
+            return
+        # Write to a temporary file first, so a partial file is never read
+        with NamedTemporaryFile(
+            "wb", dir=cache_directory, suffix=".tmp", delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
+            temp_file.write(data)
+        os.replace(temp_path, cache_file)
+        temp_path = None
+        _delete_old_files(cache_directory)
+    except OSError:
+        if temp_path is not None:
+            with suppress(OSError):
+                os.unlink(temp_path)
+
+
+def _delete_old_files(cache_directory: Path) -> None:
+    """Delete the least recently used cache files, keeping `MAX_CACHE_FILES`.
+
+    Args:
+        cache_directory: The cache directory.
+    """
+    cache_files: list[tuple[float, str]] = []
+    with os.scandir(cache_directory) as entries:
+        for entry in entries:
+            if entry.name.endswith(".rules"):
+                with suppress(OSError):
+                    cache_files.append((entry.stat().st_mtime, entry.path))
+    if len(cache_files) > MAX_CACHE_FILES:
+        cache_files.sort()
+        for _modified, path in cache_files[: len(cache_files) - MAX_CACHE_FILES]:
+            with suppress(OSError):
+                os.unlink(path)
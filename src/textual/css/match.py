@@ -2,11 +2,69 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Iterable
 
-from .model import CombinatorType, Selector, SelectorSet
+from .model import CombinatorType, Selector, SelectorSet, SelectorType
 
 if TYPE_CHECKING:
     from ..dom import DOMNode
 
+BLOOM_FILTER_SIZE = 256
+"""Number of bits in a bloom filter of selector names."""
+
+
+def _get_bloom_bits(selector_names: Iterable[str]) -> int:
+    """Get the bits of a bloom filter which contains selector names.
+
+    Args:
+        selector_names: Selector names, as returned by `DOMNode._selector_names`.
+
+    Returns:
+        An integer with a bit set for each name.
+    """
+    bits = 0
+    for name in selector_names:
+        bits |= 1 << (hash(name) % BLOOM_FILTER_SIZE)
+    return bits
+
+
+def _get_ancestor_selectors(selectors: list[Selector]) -> list[Selector]:
+    """Get the selectors which must match ancestors of a node.
+
+    Args:
+        selectors: A list of selectors.
+
+    Returns:
+        The selectors before the rightmost compound selector.
+    """
+    SAME = CombinatorType.SAME
+    ancestor_count = len(selectors) - 1
+    while ancestor_count > 0 and selectors[ancestor_count].combinator == SAME:
+        ancestor_count -= 1
+    return selectors[:ancestor_count]
+
+
+def _get_ancestor_bloom_bits(selectors: list[Selector]) -> int:
+    """Get the bloom filter bits for the names an ancestor must have to match selectors.
+
+    A node can only match the selectors if the bloom filter of the names of its
+    ancestors contains these bits.
+
+    Args:
+        selectors: A list of selectors.
+
+    Returns:
+        An integer with a bit set for each name required in the ancestors.
+    """
+    names: list[str] = []
+    for selector in _get_ancestor_selectors(selectors):
+        selector_type = selector.type
+        if selector_type == SelectorType.TYPE:
+            names.append(selector.name)
+        elif selector_type == SelectorType.CLASS:
+            names.append(f".{selector.name}")
+        elif selector_type == SelectorType.ID:
+            names.append(f"#{selector.name}")
+    return _get_bloom_bits(names)
+
 
 def match(selector_sets: Iterable[SelectorSet], node: DOMNode) -> bool:
     """Check if a given node matches any of the given selector sets.
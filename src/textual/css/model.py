@@ -235,6 +235,10 @@ class RuleSet:
     tie_breaker: int = 0
     selector_names: set[str] = field(default_factory=set)
     pseudo_classes: set[str] = field(default_factory=set)
+    variable_names: set[str] = field(default_factory=set)
+    """Names of the variables referenced by the declarations."""
+    declarations: list[Declaration] = field(default_factory=list)
+    """Declarations with variable references unresolved, if the rule references variables."""
 
     def __hash__(self):
         return id(self)
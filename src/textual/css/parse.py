@@ -105,12 +105,52 @@ def parse_selectors(css_selectors: str) -> tuple[SelectorSet, ...]:
     return selector_set
 
 
+def _get_unresolved_tokens(
+    declaration: Declaration, raw_variables: dict[str, list[Token]]
+) -> list[Token]:
+    """Reverse the substitution of variables in the tokens of a declaration.
+
+    Args:
+        declaration: A declaration, with variables substituted.
+        raw_variables: The tokens of variables defined in the CSS, as filled by
+            `substitute_references`.
+
+    Returns:
+        Tokens where references to variables not defined in the CSS are
+            `variable_ref` tokens.
+    """
+    unresolved_tokens: list[Token] = []
+    read_from = declaration.token.read_from
+    last_reference: ReferencedBy | None = None
+    for token in declaration.tokens:
+        reference = token.referenced_by
+        if reference is None:
+            unresolved_tokens.append(token)
+        elif reference != last_reference:
+            # The first token substituted for a reference
+            if reference.name in raw_variables:
+                unresolved_tokens.extend(raw_variables[reference.name])
+            else:
+                unresolved_tokens.append(
+                    Token(
+                        "variable_ref",
+                        f"${reference.name}",
+                        read_from,
+                        reference.code,
+                        reference.location,
+                    )
+                )
+        last_reference = reference
+    return unresolved_tokens
+
+
 def parse_rule_set(
     scope: str,
     tokens: Iterator[Token],
     token: Token,
     is_default_rules: bool = False,
     tie_breaker: int = 0,
+    raw_variables: dict[str, list[Token]] | None = None,
 ) -> Iterable[RuleSet]:
     get_selector = SELECTOR_MAP.get
     combinator: CombinatorType | None = CombinatorType.DESCENDENT
@@ -165,6 +205,7 @@ def parse_rule_set(
         rule_selectors.append(selectors[:])
 
     declaration = Declaration(token, "")
+    declarations: list[Declaration] = []
     errors: list[tuple[Token, str | HelpText]] = []
     nested_rules: list[RuleSet] = []
 
@@ -188,6 +229,7 @@ def parse_rule_set(
                     token,
                     is_default_rules=is_default_rules,
                     tie_breaker=tie_breaker,
+                    raw_variables=raw_variables,
                 )
             )
 
@@ -235,6 +277,8 @@ def parse_rule_set(
                         rule_set.errors,
                         rule_set.is_default_rules,
                         rule_set.tie_breaker + tie_breaker,
+                        variable_names=rule_set.variable_names,
+                        declarations=rule_set.declarations,
                     )
                     nested_rules.append(nested_rule_set)
             continue
@@ -245,6 +289,7 @@ def parse_rule_set(
                 errors.append((error.token, error.message))
             declaration = Declaration(token, "")
             declaration.name = token.value.rstrip(":")
+            declarations.append(declaration)
         elif token_name == "declaration_set_end":
             break
         else:
@@ -255,12 +300,40 @@ def parse_rule_set(
     except DeclarationError as error:
         errors.append((error.token, error.message))
 
+    # Keep the declarations of rules which reference variables, so that they may be
+    # resolved again if the variables change.
+    variable_names: set[str] = set()
+    unresolved_declarations: list[Declaration] = []
+    if raw_variables is not None and any(
+        token.referenced_by is not None
+        for declaration in declarations
+        for token in declaration.tokens
+    ):
+        unresolved_declarations = [
+            Declaration(
+                declaration.token,
+                declaration.name,
+                _get_unresolved_tokens(declaration, raw_variables),
+            )
+            for declaration in declarations
+        ]
+        variable_names = {
+            token.value[1:]
+            for declaration in unresolved_declarations
+            for token in declaration.tokens
+            if token.name == "variable_ref"
+        }
+        if not variable_names:
+            unresolved_declarations = []
+
     rule_set = RuleSet(
         list(SelectorSet.from_selectors(rule_selectors)),
         styles_builder.styles,
         errors,
         is_default_rules=is_default_rules,
         tie_breaker=tie_breaker,
+        variable_names=variable_names,
+        declarations=unresolved_declarations,
     )
 
     rule_set._post_parse()
@@ -345,7 +418,9 @@ def _unresolved(variable_name: str, variables: Iterable[str], token: Token) -> N
 
 
 def substitute_references(
-    tokens: Iterable[Token], css_variables: dict[str, list[Token]] | None = None
+    tokens: Iterable[Token],
+    css_variables: dict[str, list[Token]] | None = None,
+    raw_variables: dict[str, list[Token]] | None = None,
 ) -> Iterable[Token]:
     """Replace variable references with values by substituting variable reference
     tokens with the tokens representing their values.
@@ -353,6 +428,11 @@ def substitute_references(
     Args:
         tokens: Iterator of Tokens which may contain tokens
             with the name "variable_ref".
+        css_variables: Tokens of variables which may be referenced.
+        raw_variables: If not `None`, a dict which is filled with the tokens of
+            variables defined in the CSS, where references to other variables
+            defined in the CSS are expanded, and references to `css_variables` are
+            kept as "variable_ref" tokens.
 
     Returns:
         Yields Tokens such that any variable references (tokens where
@@ -371,6 +451,11 @@ def substitute_references(
         if token.name == "variable_name":
             variable_name = token.value[1:-1]  # Trim the $ and the :, i.e. "$x:" -> "x"
             variable_tokens = variables.setdefault(variable_name, [])
+            raw_tokens: list[Token] = (
+                []
+                if raw_variables is None
+                else raw_variables.setdefault(variable_name, [])
+            )
             yield token
 
             while True:
@@ -387,6 +472,7 @@ def substitute_references(
                     break
                 elif token.name == "whitespace":
                     variable_tokens.append(token)
+                    raw_tokens.append(token)
                     yield token
                 elif token.name == "variable_value_end":
                     yield token
@@ -397,6 +483,10 @@ def substitute_references(
                     if ref_name in variables:
                         reference_tokens = variables[ref_name]
                         variable_tokens.extend(reference_tokens)
+                        if raw_variables is not None and ref_name in raw_variables:
+                            raw_tokens.extend(raw_variables[ref_name])
+                        else:
+                            raw_tokens.append(token)
                         ref_location = token.location
                         ref_length = len(token.value)
                         for _token in reference_tokens:
@@ -409,6 +499,7 @@ def substitute_references(
                         _unresolved(ref_name, variables.keys(), token)
                 else:
                     variable_tokens.append(token)
+                    raw_tokens.append(token)
                     yield token
                 token = next(iter_tokens, None)
         elif token.name == "variable_ref":
@@ -452,7 +543,10 @@ def parse(
     if variable_tokens:
         reference_tokens.update(variable_tokens)
 
-    tokens = iter(substitute_references(tokenize(css, read_from), variable_tokens))
+    raw_variables: dict[str, list[Token]] = {}
+    tokens = iter(
+        substitute_references(tokenize(css, read_from), variable_tokens, raw_variables)
+    )
     while True:
         token = next(tokens, None)
         if token is None:
@@ -464,4 +558,39 @@ def parse(
                 token,
                 is_default_rules=is_default_rules,
                 tie_breaker=tie_breaker,
+                raw_variables=raw_variables,
             )
+
+
+def resolve_declarations(
+    declarations: Iterable[Declaration], variable_tokens: dict[str, list[Token]]
+) -> Styles:
+    """Build styles from declarations which reference variables.
+
+    Args:
+        declarations: Declarations, as stored in `RuleSet.declarations`.
+        variable_tokens: Tokens of the variables referenced by the declarations.
+
+    Raises:
+        DeclarationError: If a declaration is invalid.
+        UnresolvedVariableError: If a declaration references an undefined variable.
+
+    Returns:
+        A styles object.
+    """
+    styles_builder = StylesBuilder()
+    for declaration in declarations:
+        styles_builder.add_declaration(
+            Declaration(
+                declaration.token,
+                declaration.name,
+                [
+                    token
+                    for token in substitute_references(
+                        declaration.tokens, variable_tokens
+                    )
+                    if token.name != "whitespace"
+                ],
+            )
+        )
+    return styles_builder.styles
@@ -11,6 +11,7 @@ Additional methods apply actions to all nodes in the query.
 
 from __future__ import annotations
 
+from operator import itemgetter
 from typing import TYPE_CHECKING, Generic, Iterable, Iterator, TypeVar, cast, overload
 
 import rich.repr
@@ -53,6 +54,36 @@ ExpectType = TypeVar("ExpectType")
 """Type variable used to further restrict queries."""
 
 
+_MAX_SORTED_CANDIDATES = 32
+"""Maximum number of nodes from the query index to sort in to DOM order, rather than walking the DOM."""
+
+
+def _get_position(node: DOMNode, root: DOMNode) -> list[int] | None:
+    """Get the position of a node within a subtree, which may be used to sort nodes in DOM order.
+
+    Args:
+        node: A node.
+        root: The root of the subtree.
+
+    Returns:
+        The index of each ancestor (after the root) within its parent's children,
+            which is empty for the root itself, or `None` if the node isn't in the
+            subtree.
+    """
+    position: list[int] = []
+    while node is not root:
+        parent = node._parent
+        if parent is None:
+            return None
+        try:
+            position.append(parent._nodes.index(node))
+        except ValueError:
+            return None
+        node = parent  # type: ignore[assignment]
+    position.reverse()
+    return position
+
+
 @rich.repr.auto(angular=True)
 class DOMQuery(Generic[QueryType]):
     __slots__ = ["_node", "_nodes", "_filters", "_excludes", "_deep"]
@@ -116,9 +147,13 @@ class DOMQuery(Generic[QueryType]):
         from ..widget import Widget
 
         if self._nodes is None:
-            initial_nodes = list(
-                self._node.walk_children(Widget) if self._deep else self._node._nodes
-            )
+            initial_nodes = self._get_indexed_nodes() if self._deep else None
+            if initial_nodes is None:
+                initial_nodes = list(
+                    self._node.walk_children(Widget)
+                    if self._deep
+                    else self._node._nodes
+                )
             nodes = [
                 node
                 for node in initial_nodes
@@ -132,6 +167,44 @@ class DOMQuery(Generic[QueryType]):
             self._nodes = cast("list[QueryType]", nodes)
         return self._nodes
 
+    def _get_indexed_nodes(self) -> list[Widget] | None:
+        """Get the nodes which may match the query, from the index of the screen.
+
+        Returns:
+            Descendants of the node in DOM order, which include every descendant
+                that matches the filters, or `None` if the index can't be used.
+        """
+        from ..app import App
+
+        node = self._node
+        if isinstance(node, App):
+            # The app's only child is the current screen
+            if not node.children:
+                return None
+            query_index = node.children[0]._query_index
+        else:
+            query_index = node._query_index
+        if query_index is None:
+            return None
+        candidates = query_index.get_candidates(self._filters)
+        if candidates is None:
+            return None
+        if len(candidates) > _MAX_SORTED_CANDIDATES:
+            # Faster to walk the DOM than to sort the candidates
+            from ..widget import Widget
+
+            return [
+                widget for widget in node.walk_children(Widget) if widget in candidates
+            ]
+
+        positions: list[tuple[list[int], Widget]] = []
+        for widget in candidates:
+            position = _get_position(widget, node)
+            if position:
+                positions.append((position, widget))
+        positions.sort(key=itemgetter(0))
+        return [widget for _, widget in positions]
+
     def __len__(self) -> int:
         return len(self.nodes)
 
@@ -2,12 +2,12 @@ from __future__ import annotations
 
 import re
 from enum import Enum, unique
-from fractions import Fraction
 from functools import lru_cache
 from typing import Iterable, NamedTuple
 
 import rich.repr
 
+from .._rational import Rational, divide, exact
 from ..geometry import Offset, Size, clamp
 
 
@@ -53,105 +53,105 @@ _MATCH_SCALAR = re.compile(r"^(-?\d+\.?\d*)(fr|%|w|h|vw|vh)?$").match
 
 
 def _resolve_cells(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves explicit cell size, i.e. width: 10
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return Fraction(value)
+    return exact(value)
 
 
 def _resolve_fraction(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves a fraction unit i.e. width: 2fr
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return fraction_unit * Fraction(value)
+    return fraction_unit * exact(value)
 
 
 def _resolve_width(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves width unit i.e. width: 50w.
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return Fraction(value) * Fraction(size.width, 100)
+    return divide(exact(value) * size.width, 100)
 
 
 def _resolve_height(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves height unit, i.e. height: 12h.
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return Fraction(value) * Fraction(size.height, 100)
+    return divide(exact(value) * size.height, 100)
 
 
 def _resolve_view_width(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves view width unit, i.e. width: 25vw.
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return Fraction(value) * Fraction(viewport.width, 100)
+    return divide(exact(value) * viewport.width, 100)
 
 
 def _resolve_view_height(
-    value: float, size: Size, viewport: Size, fraction_unit: Fraction
-) -> Fraction:
+    value: float, size: Size, viewport: Size, fraction_unit: Rational
+) -> Rational:
     """Resolves view height unit, i.e. height: 25vh.
 
     Args:
         value: Scalar value.
         size: Size of widget.
         viewport: Size of viewport.
-        fraction_unit: Size of fraction, i.e. size of 1fr as a Fraction.
+        fraction_unit: Size of fraction, i.e. size of 1fr.
 
     Returns:
         Resolved unit.
     """
-    return Fraction(value) * Fraction(viewport.height, 100)
+    return divide(exact(value) * viewport.height, 100)
 
 
 RESOLVE_MAP = {
@@ -264,8 +264,8 @@ class Scalar(NamedTuple):
 
     @lru_cache(maxsize=4096)
     def resolve(
-        self, size: Size, viewport: Size, fraction_unit: Fraction | None = None
-    ) -> Fraction:
+        self, size: Size, viewport: Size, fraction_unit: Rational | None = None
+    ) -> Rational:
         """Resolve scalar with units in to a dimensions.
 
         Args:
@@ -283,9 +283,7 @@ class Scalar(NamedTuple):
         if unit == Unit.PERCENT:
             unit = percent_unit
         try:
-            dimension = RESOLVE_MAP[unit](
-                value, size, viewport, fraction_unit or Fraction(1)
-            )
+            dimension = RESOLVE_MAP[unit](value, size, viewport, fraction_unit or 1)
         except KeyError:
             raise ScalarResolveError(f"expected dimensions; found {str(self)!r}")
         return dimension
@@ -17,10 +17,17 @@ from rich.text import Text
 from ..cache import LRUCache
 from ..dom import DOMNode
 from ..widget import Widget
+from ._parse_cache import get_cache_file, read_rules, write_rules
 from .errors import StylesheetError
-from .match import _check_selectors
-from .model import RuleSet
-from .parse import parse
+from .match import (
+    _check_selectors,
+    _get_ancestor_bloom_bits,
+    _get_ancestor_selectors,
+    _get_bloom_bits,
+)
+from .model import RuleSet, SelectorType
+from ._styles_builder import DeclarationError
+from .parse import parse, resolve_declarations
 from .styles import RulesMap, Styles
 from .tokenize import Token, tokenize_values
 from .tokenizer import TokenError
@@ -140,15 +147,34 @@ class CssSource(NamedTuple):
 class Stylesheet:
     """A Stylesheet generated from Textual CSS."""
 
-    def __init__(self, *, variables: dict[str, str] | None = None) -> None:
+    def __init__(
+        self,
+        *,
+        variables: dict[str, str] | None = None,
+        cache_path: str | PurePath | None = None,
+    ) -> None:
+        """Initialize a stylesheet.
+
+        Args:
+            variables: CSS variables.
+            cache_path: A directory in which to cache parsed CSS between runs, or
+                `None` to only cache in memory. The directory must be private to the
+                user, as the cache is unpickled; files in a directory which other users
+                can write to are ignored.
+        """
         self._rules: list[RuleSet] = []
         self._rules_map: dict[str, list[RuleSet]] | None = None
+        self._selector_map: dict[str, list[tuple[int, int, int]]] = {}
+        self._ancestor_selector_names: set[str] = set()
+        """Selector names and pseudo classes which appear before the rightmost compound selector."""
         self._variables = variables or {}
         self.__variable_tokens: dict[str, list[Token]] | None = None
         self.source: dict[CSSLocation, CssSource] = {}
         self._require_parse = False
         self._invalid_css: set[str] = set()
         self._parse_cache: LRUCache[tuple, list[RuleSet]] = LRUCache(64)
+        self._cache_path = cache_path
+        """Directory for the on-disk cache of parsed CSS, or `None` to disable it."""
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield list(self.source.keys())
@@ -185,8 +211,83 @@ class Stylesheet:
                 for name in rule.selector_names:
                     rules_map[name].append(rule)
             self._rules_map = dict(rules_map)
+            self._selector_map = self._build_selector_map()
+            self._ancestor_selector_names = self._get_ancestor_selector_names()
         return self._rules_map
 
+    def _build_selector_map(self) -> dict[str, list[tuple[int, int, int]]]:
+        """Build a map of the selector sets in each rule, by their rightmost selector.
+
+        Returns:
+            A mapping of selector name on to tuples of the negated index of the rule,
+                the index of the selector set within the rule, and the bloom filter
+                bits of the names the selector set requires in the node's ancestors.
+        """
+        selector_map: dict[str, list[tuple[int, int, int]]] = defaultdict(list)
+        for rule_index, rule in enumerate(self.rules):
+            for selector_set_index, selector_set in enumerate(rule.selector_set):
+                selectors = selector_set.selectors
+                selector = selectors[-1]
+                selector_type = selector.type
+                if selector_type == SelectorType.TYPE:
+                    name = selector.name
+                elif selector_type == SelectorType.CLASS:
+                    name = f".{selector.name}"
+                elif selector_type == SelectorType.ID:
+                    name = f"#{selector.name}"
+                else:
+                    name = "*"
+                selector_map[name].append(
+                    (
+                        -rule_index,
+                        selector_set_index,
+                        _get_ancestor_bloom_bits(selectors),
+                    )
+                )
+        return dict(selector_map)
+
+    def _get_ancestor_selector_names(self) -> set[str]:
+        """Get the names which may be required to match an ancestor of a node.
+
+        Returns:
+            A set of type names, class names (prefixed with "."), IDs (prefixed with
+                "#"), and pseudo classes (prefixed with ":").
+        """
+        names: set[str] = set()
+        add_name = names.add
+        for rule in self.rules:
+            for selector_set in rule.selector_set:
+                for selector in _get_ancestor_selectors(selector_set.selectors):
+                    selector_type = selector.type
+                    if selector_type == SelectorType.TYPE:
+                        add_name(selector.name)
+                    elif selector_type == SelectorType.CLASS:
+                        add_name(f".{selector.name}")
+                    elif selector_type == SelectorType.ID:
+                        add_name(f"#{selector.name}")
+                    names.update(
+                        f":{pseudo_class}" for pseudo_class in selector.pseudo_classes
+                    )
+        return names
+
+    def affects_descendants(self, selector_names: Iterable[str]) -> bool:
+        """Check if a change to a node's selector names may change the styles of its descendants.
+
+        Only selectors which match an ancestor of a node can change the styles of
+        its descendants. If none of the changed names appear in those selectors, only
+        the node itself needs to be updated.
+
+        Args:
+            selector_names: Changed names, as class names prefixed with ".", or
+                pseudo classes prefixed with ":".
+
+        Returns:
+            True if descendants of the node should be updated, otherwise False.
+        """
+        # Ensure the ancestor selector names reflect the current rules
+        self.rules_map
+        return not self._ancestor_selector_names.isdisjoint(selector_names)
+
     @property
     def css(self) -> str:
         """The equivalent TCSS for this stylesheet.
@@ -201,7 +302,9 @@ class Stylesheet:
         Returns:
             New stylesheet.
         """
-        stylesheet = Stylesheet(variables=self._variables.copy())
+        stylesheet = Stylesheet(
+            variables=self._variables.copy(), cache_path=self._cache_path
+        )
         stylesheet.source = self.source.copy()
         return stylesheet
 
@@ -216,6 +319,61 @@ class Stylesheet:
         self._invalid_css = set()
         self._parse_cache.clear()
 
+    def update_variables(self, variables: dict[str, str]) -> list[RuleSet]:
+        """Set CSS variables, and update the rules which reference variables that changed.
+
+        Unlike [reparse][textual.css.stylesheet.Stylesheet.reparse], this doesn't parse
+        the CSS again. Rules keep the declarations which reference variables, and
+        only those declarations are resolved with the new values. If a declaration
+        is invalid with the new values, the CSS is parsed again to report the error.
+
+        Args:
+            variables: A mapping of name to variable.
+
+        Raises:
+            StylesheetError: If the CSS could not be read.
+            StylesheetParseError: If the CSS is invalid.
+
+        Returns:
+            The rules which were updated.
+        """
+        old_variables = self._variables
+        changed_names = {
+            name
+            for name in old_variables.keys() | variables.keys()
+            if old_variables.get(name) != variables.get(name)
+        }
+        self.set_variables(variables)
+        if not changed_names:
+            return []
+
+        updated_rules = [
+            rule
+            for rule in self.rules
+            if not changed_names.isdisjoint(rule.variable_names)
+        ]
+        # Nested rules share styles with the rule they were nested in
+        new_styles: dict[int, Styles] = {}
+        variable_tokens = self._variable_tokens
+        try:
+            for rule in updated_rules:
+                if id(rule.styles) not in new_styles:
+                    new_styles[id(rule.styles)] = resolve_declarations(
+                        rule.declarations, variable_tokens
+                    )
+        except (DeclarationError, TokenError):
+            self.reparse()
+            return list(self.rules)
+
+        for rule in updated_rules:
+            resolved_styles = new_styles.pop(id(rule.styles), None)
+            if resolved_styles is not None:
+                styles = rule.styles
+                styles.reset()
+                styles.merge(resolved_styles)
+                styles.important = resolved_styles.important
+        return updated_rules
+
     def _parse_rules(
         self,
         css: str,
@@ -244,6 +402,16 @@ class Stylesheet:
             return self._parse_cache[cache_key]
         except KeyError:
             pass
+        cache_file: Path | None = None
+        if self._cache_path is not None:
+            cache_file = get_cache_file(
+                self._cache_path,
+                (cache_key, sorted(self._variables.items())),
+            )
+            cached_rules = read_rules(cache_file)
+            if cached_rules is not None:
+                self._parse_cache[cache_key] = cached_rules
+                return cached_rules
         try:
             rules = list(
                 parse(
@@ -261,6 +429,8 @@ class Stylesheet:
             raise StylesheetError(f"failed to parse css; {error}") from None
 
         self._parse_cache[cache_key] = rules
+        if cache_file is not None:
+            write_rules(cache_file, rules)
         return rules
 
     def read(self, filename: str | PurePath) -> None:
@@ -392,7 +562,7 @@ class Stylesheet:
             StylesheetParseError: If the CSS is invalid.
         """
         # Do this in a fresh Stylesheet so if there are errors we don't break self.
-        stylesheet = Stylesheet(variables=self._variables)
+        stylesheet = Stylesheet(variables=self._variables, cache_path=self._cache_path)
         for read_from, (css, is_defaults, tie_breaker, scope) in self.source.items():
             stylesheet.add_source(
                 css,
@@ -416,21 +586,40 @@ class Stylesheet:
             self._require_parse = False
 
     @classmethod
-    def _check_rule(
-        cls, rule_set: RuleSet, css_path_nodes: list[DOMNode]
-    ) -> Iterable[Specificity3]:
-        """Check a rule set, return specificity of applicable rules.
+    def _get_css_path(
+        cls,
+        node: DOMNode,
+        selector_names: set[str],
+        path_cache: dict[DOMNode, tuple[list[DOMNode], int]] | None,
+    ) -> tuple[list[DOMNode], int]:
+        """Get the CSS path of a node, and a bloom filter of its ancestors' selector names.
 
         Args:
-            rule_set: A rule set.
-            css_path_nodes: A list of the nodes from the App to the node being checked.
+            node: A DOM node.
+            selector_names: The selector names of the node.
+            path_cache: An optional cache of paths when applying a group of nodes,
+                which maps a node on to its path and the bloom filter of the names
+                in the path.
 
-        Yields:
-            Specificity of any matching selectors.
+        Returns:
+            A list of the nodes from the App to the node, and the bloom filter bits
+                of the selector names of the ancestors.
         """
-        for selector_set in rule_set.selector_set:
-            if _check_selectors(selector_set.selectors, css_path_nodes):
-                yield selector_set.specificity
+        parent = node._parent
+        if path_cache is not None and parent in path_cache:
+            parent_path, ancestor_bits = path_cache[parent]
+            css_path_nodes = [*parent_path, node]
+        else:
+            css_path_nodes = node.css_path_nodes
+            ancestor_bits = 0
+            for ancestor in css_path_nodes[:-1]:
+                ancestor_bits |= _get_bloom_bits(ancestor._selector_names)
+        if path_cache is not None:
+            path_cache[node] = (
+                css_path_nodes,
+                ancestor_bits | _get_bloom_bits(selector_names),
+            )
+        return css_path_nodes, ancestor_bits
 
     def apply(
         self,
@@ -438,6 +627,7 @@ class Stylesheet:
         *,
         animate: bool = False,
         cache: dict[tuple, RulesMap] | None = None,
+        path_cache: dict[DOMNode, tuple[list[DOMNode], int]] | None = None,
     ) -> None:
         """Apply the stylesheet to a DOM node.
 
@@ -449,6 +639,8 @@ class Stylesheet:
                 rule will be applied.
             animate: Animate changed rules.
             cache: An optional cache when applying a group of nodes.
+            path_cache: An optional cache of CSS paths when applying a group of nodes,
+                in which parents must be applied before their children.
         """
         # Dictionary of rule attribute names e.g. "text_background" to list of tuples.
         # The tuples contain the rule specificity, and the value for that rule.
@@ -458,21 +650,32 @@ class Stylesheet:
         rule_attributes: defaultdict[str, list[tuple[Specificity6, object]]]
         rule_attributes = defaultdict(list)
 
+        all_rules = self.rules
         rules_map = self.rules_map
-
-        # Discard rules which are not applicable early
-        limit_rules = {
-            rule
-            for name in rules_map.keys() & node._selector_names
-            for rule in rules_map[name]
+        selector_map = self._selector_map
+        selector_names = node._selector_names
+
+        # Discard selectors which are not applicable early, by their rightmost selector.
+        # Sorting puts the rules in reverse order, and selector sets in order.
+        selector_sets = sorted(
+            chain.from_iterable(
+                selector_map[name] for name in selector_map.keys() & selector_names
+            )
+        )
+        rules = {
+            all_rules[-negative_rule_index]
+            for negative_rule_index, _, _ in selector_sets
         }
-        rules = list(filter(limit_rules.__contains__, reversed(self.rules)))
 
         node._has_hover_style = any("hover" in rule.pseudo_classes for rule in rules)
         node._has_focus_within = any(
             "focus-within" in rule.pseudo_classes for rule in rules
         )
 
+        css_path_nodes, ancestor_bits = self._get_css_path(
+            node, selector_names, path_cache
+        )
+
         cache_key: tuple | None
         if cache is not None:
             cache_key = (
@@ -494,27 +697,29 @@ class Stylesheet:
         else:
             cache_key = None
 
-        _check_rule = self._check_rule
-        css_path_nodes = node.css_path_nodes
-
         # Rules that may be set to the special value `initial`
         initial: set[str] = set()
         # Rules in DEFAULT_CSS set to the special value `initial`
         initial_defaults: set[str] = set()
 
-        for rule in rules:
+        for negative_rule_index, selector_set_index, required_bits in selector_sets:
+            if required_bits & ~ancestor_bits:
+                # A name required in the ancestors is not in the bloom filter
+                continue
+            rule = all_rules[-negative_rule_index]
+            selector_set = rule.selector_set[selector_set_index]
+            if not _check_selectors(selector_set.selectors, css_path_nodes):
+                continue
             is_default_rules = rule.is_default_rules
-            tie_breaker = rule.tie_breaker
-            for base_specificity in _check_rule(rule, css_path_nodes):
-                for key, rule_specificity, value in rule.styles.extract_rules(
-                    base_specificity, is_default_rules, tie_breaker
-                ):
-                    if value is None:
-                        if is_default_rules:
-                            initial_defaults.add(key)
-                        else:
-                            initial.add(key)
-                    rule_attributes[key].append((rule_specificity, value))
+            for key, rule_specificity, value in rule.styles.extract_rules(
+                selector_set.specificity, is_default_rules, rule.tie_breaker
+            ):
+                if value is None:
+                    if is_default_rules:
+                        initial_defaults.add(key)
+                    else:
+                        initial.add(key)
+                rule_attributes[key].append((rule_specificity, value))
 
         if rule_attributes:
             # For each rule declared for this node, keep only the most specific one
@@ -672,6 +877,35 @@ class Stylesheet:
 
         self.update_nodes(root.walk_children(with_self=True), animate=animate)
 
+    def update_rules(
+        self, root: DOMNode, rules: Iterable[RuleSet], animate: bool = False
+    ) -> None:
+        """Update styles on a node and its children, which may be matched by the given rules.
+
+        Args:
+            root: Root node to update.
+            rules: Rules which have changed.
+            animate: Enable CSS animation.
+        """
+        rule_names: set[str] = set()
+        for rule in rules:
+            rule_names.update(rule.selector_names)
+        if not rule_names:
+            return
+
+        def may_match(node: DOMNode) -> bool:
+            """Check if the node, or one of its component classes, may match the rules."""
+            if not rule_names.isdisjoint(node._selector_names):
+                return True
+            return any(
+                f".{component_class}" in rule_names
+                for component_class in node._get_component_classes()
+            )
+
+        self.update_nodes(
+            filter(may_match, root.walk_children(with_self=True)), animate=animate
+        )
+
     def update_nodes(self, nodes: Iterable[DOMNode], animate: bool = False) -> None:
         """Update styles for nodes.
 
@@ -680,14 +914,15 @@ class Stylesheet:
             animate: Enable CSS animation.
         """
         cache: dict[tuple, RulesMap] = {}
+        path_cache: dict[DOMNode, tuple[list[DOMNode], int]] = {}
         apply = self.apply
 
         for node in nodes:
-            apply(node, animate=animate, cache=cache)
+            apply(node, animate=animate, cache=cache, path_cache=path_cache)
             if isinstance(node, Widget) and node.is_scrollable:
                 if node.show_vertical_scrollbar:
-                    apply(node.vertical_scrollbar, cache=cache)
+                    apply(node.vertical_scrollbar, cache=cache, path_cache=path_cache)
                 if node.show_horizontal_scrollbar:
-                    apply(node.horizontal_scrollbar, cache=cache)
+                    apply(node.horizontal_scrollbar, cache=cache, path_cache=path_cache)
                 if node.show_horizontal_scrollbar and node.show_vertical_scrollbar:
-                    apply(node.scrollbar_corner, cache=cache)
+                    apply(node.scrollbar_corner, cache=cache, path_cache=path_cache)
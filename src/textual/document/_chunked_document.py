@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+import re
+from itertools import chain, islice
+from typing import Iterable, overload
+
+from textual._cells import cell_len
+from textual._fenwick_tree import FenwickTree
+from textual.document._document import (
+    VALID_NEWLINES,
+    DocumentBase,
+    EditResult,
+    Location,
+    Newline,
+    _detect_newline_style,
+)
+from textual.geometry import Size
+
+CHUNK_SIZE = 256
+"""The number of lines in a chunk created when a document is loaded or a chunk is split."""
+
+MAX_CHUNK_SIZE = CHUNK_SIZE * 2
+"""Chunks are split when they grow beyond this many lines."""
+
+_search_not_single_width = re.compile(r"[^\x20-\x7e]").search
+"""Search for a character which may not be a single cell wide."""
+
+
+def _get_max_cell_width(lines: list[str], tab_width: int) -> int:
+    """Get the maximum cell width of a number of lines.
+
+    Args:
+        lines: Lines to measure.
+        tab_width: The width to use for tab indents.
+
+    Returns:
+        The width of the widest line.
+    """
+    if _search_not_single_width("".join(lines)) is None:
+        # Printable ASCII, with no tabs
+        return max(map(len, lines), default=0)
+    return max(
+        (cell_len(line.expandtabs(tab_width)) for line in lines),
+        default=0,
+    )
+
+
+def _split_chunk(lines: list[str]) -> list[list[str]]:
+    """Split lines in to chunks.
+
+    Args:
+        lines: The lines in the chunk.
+
+    Returns:
+        A list of one or more chunks.
+    """
+    if len(lines) <= MAX_CHUNK_SIZE:
+        return [lines]
+    return [
+        lines[index : index + CHUNK_SIZE] for index in range(0, len(lines), CHUNK_SIZE)
+    ]
+
+
+class ChunkedDocument(DocumentBase):
+    """A document for very large text, which may be opened in a TextArea.
+
+    Lines are stored in chunks of a few hundred lines, so that an edit only
+    modifies the chunks which contain the edited lines. The number of lines in each
+    chunk is kept in a Fenwick tree, so finding a line is O(log n), and the width of
+    each chunk is cached, so the size of the document only measures edited lines.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._newline: Newline = _detect_newline_style(text)
+        """The type of newline used in the text."""
+        lines = text.splitlines(keepends=False)
+        if text.endswith(tuple(VALID_NEWLINES)) or not text:
+            lines.append("")
+        self._chunks: list[list[str]] = _split_chunk(lines)
+        """The lines of the document, excluding newline characters, in chunks.
+
+        There is always at least one chunk, and chunks are never empty.
+        """
+        self._chunk_line_counts = FenwickTree(len(chunk) for chunk in self._chunks)
+        """The number of lines in each chunk."""
+        self._chunk_widths: list[int | None] = [None] * len(self._chunks)
+        """The cell width of each chunk, or `None` if it must be measured."""
+        self._chunk_widths_tab_width = 0
+        """The tab width used to measure chunk widths."""
+
+    @property
+    def lines(self) -> list[str]:
+        """Get the document as a list of strings, where each string represents a line.
+
+        Newline characters are not included in at the end of the strings.
+
+        Note that the list is built on each call. Prefer indexing the document to
+        retrieve the lines you need.
+        """
+        return list(chain.from_iterable(self._chunks))
+
+    @property
+    def text(self) -> str:
+        """Get the text from the document."""
+        return self._newline.join(chain.from_iterable(self._chunks))
+
+    @property
+    def newline(self) -> Newline:
+        """Get the Newline used in this document (e.g. '\r\n', '\n'. etc.)"""
+        return self._newline
+
+    def get_size(self, tab_width: int) -> Size:
+        """The Size of the document, taking into account the tab rendering width.
+
+        Only chunks which have been edited since the last call are measured.
+
+        Args:
+            tab_width: The width to use for tab indents.
+
+        Returns:
+            The size (width, height) of the document.
+        """
+        chunk_widths = self._chunk_widths
+        if tab_width != self._chunk_widths_tab_width:
+            self._chunk_widths_tab_width = tab_width
+            chunk_widths[:] = [None] * len(chunk_widths)
+        for chunk_index, width in enumerate(chunk_widths):
+            if width is None:
+                chunk_widths[chunk_index] = _get_max_cell_width(
+                    self._chunks[chunk_index], tab_width
+                )
+        return Size(max(chunk_widths, default=0), self.line_count)  # type: ignore[type-var]
+
+    def _locate(self, row: int) -> tuple[int, int]:
+        """Find the chunk which contains a row.
+
+        Args:
+            row: A row index, from 0 up to and including the line count.
+
+        Returns:
+            A tuple of the chunk index, and the index of the row within the chunk. A
+                row equal to the line count is located after the last line of the
+                last chunk.
+        """
+        chunk_line_counts = self._chunk_line_counts
+        chunk_index = chunk_line_counts.find(row)
+        if chunk_index == len(self._chunks):
+            chunk_index -= 1
+        return chunk_index, row - chunk_line_counts.prefix_sum(chunk_index)
+
+    def _replace_lines(self, start: int, stop: int, lines: list[str]) -> None:
+        """Replace a range of lines, like assigning to a slice of a list.
+
+        Args:
+            start: The first row to replace.
+            stop: The row after the last row to replace.
+            lines: New lines to replace the range, which may not be empty.
+        """
+        line_count = self.line_count
+        start = min(start, line_count)
+        stop = max(start, min(stop, line_count))
+        chunks = self._chunks
+        first_chunk_index, start_offset = self._locate(start)
+        if stop > start:
+            last_chunk_index, last_offset = self._locate(stop - 1)
+        else:
+            last_chunk_index, last_offset = first_chunk_index, start_offset - 1
+
+        if first_chunk_index == last_chunk_index:
+            chunk = chunks[first_chunk_index]
+            chunk[start_offset : last_offset + 1] = lines
+            if len(chunk) <= MAX_CHUNK_SIZE:
+                self._chunk_line_counts[first_chunk_index] = len(chunk)
+                self._chunk_widths[first_chunk_index] = None
+                return
+            new_chunks = _split_chunk(chunk)
+        else:
+            new_chunks = _split_chunk(
+                chunks[first_chunk_index][:start_offset]
+                + lines
+                + chunks[last_chunk_index][last_offset + 1 :]
+            )
+
+        chunks[first_chunk_index : last_chunk_index + 1] = new_chunks
+        self._chunk_line_counts.replace(
+            first_chunk_index,
+            last_chunk_index + 1,
+            [len(chunk) for chunk in new_chunks],
+        )
+        self._chunk_widths[first_chunk_index : last_chunk_index + 1] = [None] * len(
+            new_chunks
+        )
+
+    def replace_range(self, start: Location, end: Location, text: str) -> EditResult:
+        """Replace text at the given range.
+
+        This is the only method by which a document may be updated.
+
+        Args:
+            start: A tuple (row, column) where the edit starts.
+            end: A tuple (row, column) where the edit ends.
+            text: The text to insert between start and end.
+
+        Returns:
+            The EditResult containing information about the completed
+                replace operation.
+        """
+        top, bottom = sorted((start, end))
+        top_row, top_column = top
+        bottom_row, bottom_column = bottom
+
+        insert_lines = text.splitlines()
+        if text.endswith(tuple(VALID_NEWLINES)):
+            # Special case where a single newline character is inserted.
+            insert_lines.append("")
+
+        line_count = self.line_count
+
+        replaced_text = self.get_text_range(top, bottom)
+        if bottom_row >= line_count:
+            after_selection = ""
+        else:
+            after_selection = self[bottom_row][bottom_column:]
+
+        if top_row >= line_count:
+            before_selection = ""
+        else:
+            before_selection = self[top_row][:top_column]
+
+        if insert_lines:
+            insert_lines[0] = before_selection + insert_lines[0]
+            destination_column = len(insert_lines[-1])
+            insert_lines[-1] = insert_lines[-1] + after_selection
+        else:
+            destination_column = len(before_selection)
+            insert_lines = [before_selection + after_selection]
+
+        self._replace_lines(top_row, bottom_row + 1, insert_lines)
+        destination_row = top_row + len(insert_lines) - 1
+
+        end_location = (destination_row, destination_column)
+        return EditResult(end_location, replaced_text)
+
+    def get_text_range(self, start: Location, end: Location) -> str:
+        """Get the text that falls between the start and end locations.
+
+        Args:
+            start: The start location of the selection.
+            end: The end location of the selection.
+
+        Returns:
+            The text between start (inclusive) and end (exclusive).
+        """
+        if start == end:
+            return ""
+
+        top, bottom = sorted((start, end))
+        top_row, top_column = top
+        bottom_row, bottom_column = bottom
+        if top_row == bottom_row:
+            return self[top_row][top_column:bottom_column]
+
+        lines = self[top_row : bottom_row + 1]
+        lines[0] = lines[0][top_column:]
+        if bottom_row < self.line_count:
+            lines[-1] = lines[-1][:bottom_column]
+        return self._newline.join(lines)
+
+    @property
+    def line_count(self) -> int:
+        """Returns the number of lines in the document."""
+        return self._chunk_line_counts.total
+
+    @property
+    def start(self) -> Location:
+        """Returns the location of the start of the document (0, 0)."""
+        return super().start
+
+    @property
+    def end(self) -> Location:
+        """Returns the location of the end of the document."""
+        last_line = self._chunks[-1][-1]
+        return (self.line_count - 1, len(last_line))
+
+    def get_line(self, index: int) -> str:
+        """Returns the line with the given index from the document.
+
+        Args:
+            index: The index of the line in the document.
+
+        Returns:
+            The string representing the line.
+        """
+        line_string = self[index]
+        return line_string
+
+    def _iter_lines(self, start: int, stop: int) -> Iterable[str]:
+        """Iterate over a range of lines.
+
+        Args:
+            start: The first row.
+            stop: The row after the last row.
+
+        Returns:
+            An iterable of lines.
+        """
+        if stop <= start:
+            return ()
+        chunk_index, offset = self._locate(start)
+        lines = chain(
+            islice(self._chunks[chunk_index], offset, None),
+            chain.from_iterable(islice(self._chunks, chunk_index + 1, None)),
+        )
+        return islice(lines, stop - start)
+
+    @overload
+    def __getitem__(self, line_index: int) -> str: ...
+
+    @overload
+    def __getitem__(self, line_index: slice) -> list[str]: ...
+
+    def __getitem__(self, line_index: int | slice) -> str | list[str]:
+        """Return the content of a line as a string, excluding newline characters.
+
+        Args:
+            line_index: The index or slice of the line(s) to retrieve.
+
+        Returns:
+            The line or list of lines requested.
+        """
+        line_count = self.line_count
+        if isinstance(line_index, slice):
+            start, stop, step = line_index.indices(line_count)
+            if step != 1:
+                return self.lines[line_index]
+            return list(self._iter_lines(start, stop))
+        if line_index < 0:
+            line_index += line_count
+        if not 0 <= line_index < line_count:
+            raise IndexError("line index out of range")
+        chunk_index, offset = self._locate(line_index)
+        return self._chunks[chunk_index][offset]
@@ -9,6 +9,7 @@ try:
 except ImportError:
     TREE_SITTER = False
 
+from textual._fenwick_tree import FenwickTree
 from textual.document._document import Document, EditResult, Location, _utf8_encode
 from textual.document._languages import BUILTIN_LANGUAGES
 
@@ -48,6 +49,12 @@ class SyntaxAwareDocument(Document):
             raise RuntimeError("SyntaxAwareDocument unavailable.")
 
         super().__init__(text)
+        newline_length = len(self.newline)
+        self._line_byte_lengths = FenwickTree(
+            len(line.encode("utf-8")) + newline_length for line in self._lines
+        )
+        """The length of each line in utf-8 bytes, including the newline."""
+
         self.language: Language | None = None
         """The tree-sitter Language or None if tree-sitter is unavailable."""
 
@@ -76,10 +83,20 @@ class SyntaxAwareDocument(Document):
         self._syntax_tree: Tree = self._parser.parse(self._read_callable)  # type: ignore
         """The tree-sitter Tree (syntax tree) built from the document."""
 
+        self._changed_rows: list[tuple[int, int]] = []
+        """Row ranges where the syntax tree changed in the most recent edit."""
+
     @property
     def language_name(self) -> str | None:
         return self.language.name if self.language else None
 
+    @property
+    def changed_rows(self) -> list[tuple[int, int]]:
+        """Row ranges (start row, end row inclusive) where the structure of the syntax
+        tree changed in the most recent edit, outside of the edited range itself.
+        """
+        return self._changed_rows
+
     def prepare_query(self, query: str) -> Query | None:
         """Prepare a tree-sitter tree query.
 
@@ -153,8 +170,6 @@ class SyntaxAwareDocument(Document):
         """
         top, bottom = sorted((start, end))
 
-        # An optimisation would be finding the byte offsets as a single operation rather
-        # than doing two passes over the document content.
         start_byte = self._location_to_byte_offset(top)
         start_point = self._location_to_point(top)
         old_end_byte = self._location_to_byte_offset(bottom)
@@ -162,6 +177,18 @@ class SyntaxAwareDocument(Document):
 
         replace_result = super().replace_range(start, end, text)
 
+        top_row = top[0]
+        end_row = replace_result.end_location[0]
+        newline_length = len(self.newline)
+        self._line_byte_lengths.replace(
+            top_row,
+            bottom[0] + 1,
+            [
+                len(_utf8_encode(line)) + newline_length
+                for line in self._lines[top_row : end_row + 1]
+            ],
+        )
+
         text_byte_length = len(_utf8_encode(text))
         end_location = replace_result.end_location
         assert self._syntax_tree is not None
@@ -175,9 +202,14 @@ class SyntaxAwareDocument(Document):
             new_end_point=self._location_to_point(end_location),
         )
         # Incrementally parse the document.
+        old_syntax_tree = self._syntax_tree
         self._syntax_tree = self._parser.parse(
-            self._read_callable, self._syntax_tree  # type: ignore[arg-type]
+            self._read_callable, old_syntax_tree  # type: ignore[arg-type]
         )
+        self._changed_rows = [
+            (changed_range.start_point[0], changed_range.end_point[0])
+            for changed_range in old_syntax_tree.changed_ranges(self._syntax_tree)
+        ]
 
         return replace_result
 
@@ -205,11 +237,7 @@ class SyntaxAwareDocument(Document):
         """
         lines = self._lines
         row, column = location
-        lines_above = lines[:row]
-        end_of_line_width = len(self.newline)
-        bytes_lines_above = sum(
-            len(_utf8_encode(line)) + end_of_line_width for line in lines_above
-        )
+        bytes_lines_above = self._line_byte_lengths.prefix_sum(row)
         if row < len(lines):
             bytes_on_left = len(_utf8_encode(lines[row][:column]))
         else:
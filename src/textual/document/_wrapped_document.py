@@ -5,12 +5,12 @@ from bisect import bisect_right
 from rich.text import Text
 
 from textual._cells import cell_len, cell_width_to_column_index
+from textual._fenwick_tree import FenwickTree
 from textual._wrap import compute_wrap_offsets
 from textual.document._document import DocumentBase, Location
 from textual.expand_tabs import expand_tabs_inline, get_tab_widths
 from textual.geometry import Offset, clamp
 
-VerticalOffset = int
 LineIndex = int
 SectionOffset = int
 
@@ -20,6 +20,10 @@ class WrappedDocument:
     width and can be queried to retrieve lines from the *wrapped* version
     of the document.
 
+    Lines are wrapped lazily, when they are first queried, so the cost of wrapping
+    is proportional to the lines which are displayed. Until a line has been wrapped,
+    its height is estimated from its length.
+
     Allows for incremental updates, ensuring that we only re-wrap ranges of the document
     that were influenced by edits.
     """
@@ -43,20 +47,22 @@ class WrappedDocument:
         self.document = document
         """The document wrapping is performed on."""
 
-        self._wrap_offsets: list[list[int]] = []
+        self._wrap_offsets: list[list[int] | None] = []
         """Maps line indices to the offsets within the line where wrapping
-        breaks should be added."""
+        breaks should be added, or `None` if the line hasn't been wrapped."""
 
-        self._tab_width_cache: list[list[int]] = []
+        self._tab_width_cache: list[list[int] | None] = []
         """Maps line indices to a list of tab widths. `[[2, 4]]` means that on line 0, the first
         tab has width 2, and the second tab has width 4."""
 
-        self._offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        """Maps y_offsets (from the top of the document) to line_index and the offset
-        of the section within the line."""
+        self._cell_lengths: list[int] = []
+        """The cell length of each line, with tabs expanded, used to estimate heights.
+        Updated for the edited lines by `wrap_range`, so resizing doesn't measure the
+        lines again."""
 
-        self._line_index_to_offsets: list[list[VerticalOffset]] = []
-        """Maps line indices to all the vertical offsets which correspond to that line."""
+        self._line_heights = FenwickTree()
+        """The number of wrapped lines (sections) for each line in the document,
+        used to map y_offsets (from the top of the document) to line indices."""
 
         self._width: int = width
         """The width the document is currently wrapped at. This will correspond with
@@ -75,10 +81,14 @@ class WrappedDocument:
 
         In other words, this is True if the length of any line in the document is greater
         than the available width."""
-        return len(self._line_index_to_offsets) == len(self._offset_to_line_info)
+        return len(self._wrap_offsets) == self._line_heights.total
 
     def wrap(self, width: int, tab_width: int | None = None) -> None:
-        """Wrap and cache all lines in the document.
+        """Discard the wrapping of all lines in the document, so that lines are wrapped
+        at a new width when they are next queried.
+
+        The heights of the lines are estimated from their cached cell lengths, which
+        are only measured again if the tab width or the number of lines has changed.
 
         Args:
             width: The width to wrap at. 0 for no wrapping.
@@ -86,46 +96,84 @@ class WrappedDocument:
                 reuse the  tab width.
         """
         self._width = width
+        line_count = self.document.line_count
+        tab_width_changed = bool(tab_width) and tab_width != self._tab_width
         if tab_width:
             self._tab_width = tab_width
+        if tab_width_changed or len(self._cell_lengths) != line_count:
+            # Measure every line again
+            self._cell_lengths = self._measure_lines(0, line_count)
+
+        self._wrap_offsets = [None] * line_count
+        self._tab_width_cache = [None] * line_count
+        self._line_heights = FenwickTree(self._estimate_heights(self._cell_lengths))
 
-        # We're starting wrapping from scratch
-        new_wrap_offsets: list[list[int]] = []
-        offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        line_index_to_offsets: list[list[VerticalOffset]] = []
-        line_tab_widths: list[list[int]] = []
+    def _estimate_heights(self, cell_lengths: list[int]) -> list[int]:
+        """Estimate the wrapped height of lines from their cell lengths.
 
-        append_wrap_offset = new_wrap_offsets.append
-        append_line_info = offset_to_line_info.append
-        append_line_offsets = line_index_to_offsets.append
-        append_line_tab_widths = line_tab_widths.append
+        Args:
+            cell_lengths: The cell length of each line, with tabs expanded.
+
+        Returns:
+            The estimated heights.
+        """
+        width = self._width
+        if width <= 0:
+            return [1] * len(cell_lengths)
+        last_column = width - 1
+        return [
+            (cell_length + last_column) // width or 1 for cell_length in cell_lengths
+        ]
+
+    def _measure_lines(self, start: int, stop: int) -> list[int]:
+        """Measure the cell length of lines, with tabs expanded.
+
+        Args:
+            start: Index of the first line.
+            stop: Index after the last line.
 
-        current_offset = 0
+        Returns:
+            The cell length of each line.
+        """
         tab_width = self._tab_width
-        for line_index, line in enumerate(self.document.lines):
-            tab_sections = get_tab_widths(line, tab_width)
-            wrap_offsets = (
-                compute_wrap_offsets(
-                    line,
-                    width,
-                    tab_size=tab_width,
-                    precomputed_tab_sections=tab_sections,
-                )
-                if width
-                else []
+        return [
+            (
+                len(line)
+                if line.isascii() and "\t" not in line
+                else cell_len(expand_tabs_inline(line, tab_width))
+            )
+            for line in self.document[start:stop]
+        ]
+
+    def _wrap_line(self, line_index: int) -> list[int]:
+        """Wrap a line, and update its height.
+
+        Args:
+            line_index: The index of the line within the document.
+
+        Returns:
+            The offsets within the line where wrapping should occur.
+        """
+        line = self.document[line_index]
+        width = self._width
+        tab_width = self._tab_width
+        tab_sections = get_tab_widths(line, tab_width)
+        wrap_offsets = (
+            compute_wrap_offsets(
+                line,
+                width,
+                tab_size=tab_width,
+                precomputed_tab_sections=tab_sections,
             )
-            append_line_tab_widths([width for _, width in tab_sections])
-            append_wrap_offset(wrap_offsets)
-            append_line_offsets([])
-            for section_y_offset in range(len(wrap_offsets) + 1):
-                append_line_info((line_index, section_y_offset))
-                line_index_to_offsets[line_index].append(current_offset)
-                current_offset += 1
-
-        self._wrap_offsets = new_wrap_offsets
-        self._offset_to_line_info = offset_to_line_info
-        self._line_index_to_offsets = line_index_to_offsets
-        self._tab_width_cache = line_tab_widths
+            if width
+            else []
+        )
+        self._wrap_offsets[line_index] = wrap_offsets
+        self._tab_width_cache[line_index] = [width for _, width in tab_sections]
+        height = len(wrap_offsets) + 1
+        if self._line_heights[line_index] != height:
+            self._line_heights[line_index] = height
+        return wrap_offsets
 
     @property
     def lines(self) -> list[list[str]]:
@@ -143,15 +191,18 @@ class WrappedDocument:
         wrapped_lines: list[list[str]] = []
         append = wrapped_lines.append
         for line_index, line in enumerate(self.document.lines):
-            divided = Text(line).divide(self._wrap_offsets[line_index])
+            divided = Text(line).divide(self.get_offsets(line_index))
             append([section.plain for section in divided])
 
         return wrapped_lines
 
     @property
     def height(self) -> int:
-        """The height of the wrapped document."""
-        return sum(len(offsets) + 1 for offsets in self._wrap_offsets)
+        """The height of the wrapped document.
+
+        Includes the estimated height of lines which have not been wrapped yet.
+        """
+        return self._line_heights.total
 
     def wrap_range(
         self,
@@ -176,7 +227,7 @@ class WrappedDocument:
         #  programmers can pass whatever they wish to the edit API, so we need to clamp
         #  the edit ranges here to ensure we only attempt to update within the bounds
         #  of the wrapped document.
-        old_max_index = len(self._line_index_to_offsets) - 1
+        old_max_index = len(self._wrap_offsets) - 1
         new_max_index = self.document.line_count - 1
 
         start_line_index = clamp(
@@ -190,89 +241,49 @@ class WrappedDocument:
         )
         new_bottom_line_index = max((start_line_index, new_end_line_index))
 
-        top_y_offset = self._line_index_to_offsets[top_line_index][0]
-        old_bottom_y_offset = self._line_index_to_offsets[old_bottom_line_index][-1]
-
-        # Get the new range of the edit from top to bottom.
-        new_lines = self.document.lines[top_line_index : new_bottom_line_index + 1]
-
-        new_wrap_offsets: list[list[int]] = []
-        new_line_index_to_offsets: list[list[VerticalOffset]] = []
-        new_offset_to_line_info: list[tuple[LineIndex, SectionOffset]] = []
-        new_tab_widths: list[list[int]] = []
-
-        append_wrap_offsets = new_wrap_offsets.append
-        append_tab_widths = new_tab_widths.append
-
-        width = self._width
-        tab_width = self._tab_width
-
-        # Add the new offsets between the top and new bottom (the new post-edit offsets)
-        current_y_offset = top_y_offset
-        for line_index, line in enumerate(new_lines, top_line_index):
-            tab_sections = get_tab_widths(line, tab_width)
-            wrap_offsets = (
-                compute_wrap_offsets(
-                    line, width, tab_width, precomputed_tab_sections=tab_sections
-                )
-                if width
-                else []
-            )
-            append_tab_widths([width for _, width in tab_sections])
-            append_wrap_offsets(wrap_offsets)
-
-            # Collect up the new y offsets for this document line
-            y_offsets_for_line: list[int] = []
-            for section_offset in range(len(wrap_offsets) + 1):
-                y_offsets_for_line.append(current_y_offset)
-                new_offset_to_line_info.append((line_index, section_offset))
-                current_y_offset += 1
-
-            # Save the new y offsets for this line
-            new_line_index_to_offsets.append(y_offsets_for_line)
-
-        # Replace the range start -> old with the new wrapped lines
-        self._offset_to_line_info[top_y_offset : old_bottom_y_offset + 1] = (
-            new_offset_to_line_info
+        # The edited lines are wrapped again when they are next queried.
+        new_line_count = new_bottom_line_index - top_line_index + 1
+        self._wrap_offsets[top_line_index : old_bottom_line_index + 1] = [
+            None
+        ] * new_line_count
+        self._tab_width_cache[top_line_index : old_bottom_line_index + 1] = [
+            None
+        ] * new_line_count
+        cell_lengths = self._measure_lines(top_line_index, new_bottom_line_index + 1)
+        self._cell_lengths[top_line_index : old_bottom_line_index + 1] = cell_lengths
+        self._line_heights.replace(
+            top_line_index,
+            old_bottom_line_index + 1,
+            self._estimate_heights(cell_lengths),
         )
 
-        self._line_index_to_offsets[top_line_index : old_bottom_line_index + 1] = (
-            new_line_index_to_offsets
-        )
+    def offset_to_line_info(
+        self, y_offset: int
+    ) -> tuple[LineIndex, SectionOffset] | None:
+        """Get the line at a y_offset in the wrapped document.
 
-        self._tab_width_cache[top_line_index : old_bottom_line_index + 1] = (
-            new_tab_widths
-        )
+        Lines are wrapped as required.
 
-        # How much did the edit/rewrap alter the offsets?
-        old_height = old_bottom_y_offset - top_y_offset + 1
-        new_height = len(new_offset_to_line_info)
-
-        offset_shift = new_height - old_height
-        line_shift = new_bottom_line_index - old_bottom_line_index
-
-        # Update the line info at all offsets below the edit region.
-        if line_shift:
-            for y_offset in range(
-                top_y_offset + new_height, len(self._offset_to_line_info)
-            ):
-                old_line_index, section_offset = self._offset_to_line_info[y_offset]
-                new_line_index = old_line_index + line_shift
-                new_line_info = (new_line_index, section_offset)
-                self._offset_to_line_info[y_offset] = new_line_info
-
-        # Update the offsets at all lines below the edit region
-        if offset_shift:
-            for line_index in range(
-                top_line_index + len(new_lines), len(self._line_index_to_offsets)
-            ):
-                old_offsets = self._line_index_to_offsets[line_index]
-                new_offsets = [offset + offset_shift for offset in old_offsets]
-                self._line_index_to_offsets[line_index] = new_offsets
-
-        self._wrap_offsets[top_line_index : old_bottom_line_index + 1] = (
-            new_wrap_offsets
-        )
+        Args:
+            y_offset: The y-offset within the document.
+
+        Returns:
+            A tuple of the line index and the offset of the section within the line,
+                or `None` if the offset is below the document.
+        """
+        if y_offset < 0:
+            return None
+        line_heights = self._line_heights
+        wrap_offsets = self._wrap_offsets
+        while True:
+            line_index = line_heights.find(y_offset)
+            if line_index >= len(wrap_offsets):
+                return None
+            if wrap_offsets[line_index] is None:
+                # Wrapping may change the height of the line, so find the line again.
+                self._wrap_line(line_index)
+            else:
+                return line_index, y_offset - line_heights.prefix_sum(line_index)
 
     def offset_to_location(self, offset: Offset) -> Location:
         """Given an offset within the wrapped/visual display of the document,
@@ -301,11 +312,11 @@ class WrappedDocument:
         # Find the line corresponding to the given y offset in the wrapped document.
         get_target_document_column = self.get_target_document_column
 
-        try:
-            offset_data = self._offset_to_line_info[y]
-        except IndexError:
-            # y-offset is too large
-            offset_data = self._offset_to_line_info[-1]
+        offset_data = self.offset_to_line_info(y)
+        if offset_data is None:
+            # y-offset is too large, so use the last section of the last line
+            last_line_index = len(self._wrap_offsets) - 1
+            offset_data = last_line_index, len(self.get_offsets(last_line_index))
 
         if offset_data is not None:
             line_index, section_y = offset_data
@@ -335,15 +346,15 @@ class WrappedDocument:
         line_index, column_index = location
 
         # Clamp the line index to the bounds of the document
-        line_index = clamp(line_index, 0, len(self._line_index_to_offsets))
+        line_index = clamp(line_index, 0, len(self._wrap_offsets))
 
         # Find the section index of this location, so that we know which y_offset to use
         wrap_offsets = self.get_offsets(line_index)
         section_start_columns = [0, *wrap_offsets]
         section_index = bisect_right(wrap_offsets, column_index)
 
-        # Get the y-offsets corresponding to this line index
-        y_offsets = self._line_index_to_offsets[line_index]
+        # Get the y-offset of the first section of this line
+        line_y_offset = self._line_heights.prefix_sum(line_index)
         section_column_index = column_index - section_start_columns[section_index]
 
         section = self.get_sections(line_index)[section_index]
@@ -351,7 +362,7 @@ class WrappedDocument:
             expand_tabs_inline(section[:section_column_index], self._tab_width)
         )
 
-        return Offset(x_offset, y_offsets[section_index])
+        return Offset(x_offset, line_y_offset + section_index)
 
     def get_target_document_column(
         self,
@@ -414,7 +425,7 @@ class WrappedDocument:
         Returns:
             The wrapped line as a list of strings.
         """
-        line_offsets = self._wrap_offsets[line_index]
+        line_offsets = self.get_offsets(line_index)
         wrapped_lines = Text(self.document[line_index], end="").divide(line_offsets)
         return [line.plain for line in wrapped_lines]
 
@@ -438,7 +449,10 @@ class WrappedDocument:
                 f"The document line index {line_index!r} is out of bounds. "
                 f"The document contains {len(wrap_offsets)!r} lines."
             )
-        return wrap_offsets[line_index]
+        line_wrap_offsets = wrap_offsets[line_index]
+        if line_wrap_offsets is None:
+            line_wrap_offsets = self._wrap_line(line_index)
+        return line_wrap_offsets
 
     def get_tab_widths(self, line_index: int) -> list[int]:
         """Return a list of the tab widths for the given line index.
@@ -449,4 +463,9 @@ class WrappedDocument:
         Returns:
             An ordered list of the expanded width of the tabs in the line.
         """
-        return self._tab_width_cache[line_index]
+        tab_widths = self._tab_width_cache[line_index]
+        if tab_widths is None:
+            self._wrap_line(line_index)
+            tab_widths = self._tab_width_cache[line_index]
+            assert tab_widths is not None
+        return tab_widths
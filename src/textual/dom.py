@@ -50,6 +50,7 @@ if TYPE_CHECKING:
     from _typeshed import SupportsRichComparison
 
     from rich.console import RenderableType
+    from ._query_index import QueryIndex
     from .app import App
     from .css.query import DOMQuery, QueryType
     from .css.types import CSSLocation
@@ -117,8 +118,12 @@ class _ClassesDescriptor:
         else:
             class_names = set(classes)
         check_identifiers("class name", *class_names)
+        old_classes = obj._classes
+        changed_classes = old_classes ^ class_names
         obj._classes = class_names
-        obj._update_styles()
+        if obj._query_index is not None:
+            obj._query_index.update_classes(obj, old_classes)
+        obj._update_styles([f".{class_name}" for class_name in changed_classes])
 
 
 @rich.repr.auto
@@ -173,6 +178,8 @@ class DOMNode(MessagePump):
         id: str | None = None,
         classes: str | None = None,
     ) -> None:
+        self._query_index: QueryIndex | None = None
+        """The index of the screen this node is mounted on, if any."""
         self._classes: set[str] = set()
         self._name = name
         self._id = None
@@ -702,6 +709,8 @@ class DOMNode(MessagePump):
                 f"Node 'id' attribute may not be changed once set (current id={self._id!r})"
             )
         self._id = new_id
+        if self._query_index is not None:
+            self._query_index.add(self)  # type: ignore[arg-type]
         return new_id
 
     @property
@@ -1410,13 +1419,18 @@ class DOMNode(MessagePump):
         self.classes = classes
         return self
 
-    def _update_styles(self) -> None:
+    def _update_styles(self, selector_names: Iterable[str] | None = None) -> None:
         """Request an update of this node's styles.
 
         Should be called whenever CSS classes / pseudo classes change.
+
+        Args:
+            selector_names: The class names (prefixed with ".") or pseudo classes
+                (prefixed with ":") which changed, or `None` to update descendants
+                unconditionally.
         """
         try:
-            self.app.update_styles(self)
+            self.app.update_styles(self, selector_names)
         except NoActiveAppError:
             pass
 
@@ -1435,8 +1449,12 @@ class DOMNode(MessagePump):
         self._classes.update(class_names)
         if old_classes == self._classes:
             return self
+        if self._query_index is not None:
+            self._query_index.update_classes(self, old_classes)
         if update:
-            self._update_styles()
+            self._update_styles(
+                [f".{class_name}" for class_name in old_classes ^ self._classes]
+            )
         return self
 
     def remove_class(self, *class_names: str, update: bool = True) -> Self:
@@ -1454,8 +1472,12 @@ class DOMNode(MessagePump):
         self._classes.difference_update(class_names)
         if old_classes == self._classes:
             return self
+        if self._query_index is not None:
+            self._query_index.update_classes(self, old_classes)
         if update:
-            self._update_styles()
+            self._update_styles(
+                [f".{class_name}" for class_name in old_classes ^ self._classes]
+            )
         return self
 
     def toggle_class(self, *class_names: str) -> Self:
@@ -1472,7 +1494,11 @@ class DOMNode(MessagePump):
         self._classes.symmetric_difference_update(class_names)
         if old_classes == self._classes:
             return self
-        self._update_styles()
+        if self._query_index is not None:
+            self._query_index.update_classes(self, old_classes)
+        self._update_styles(
+            [f".{class_name}" for class_name in old_classes ^ self._classes]
+        )
         return self
 
     def has_pseudo_class(self, class_name: str) -> bool:
@@ -7,7 +7,9 @@ This class is used by the [command palette](/guide/command_palette) to match sea
 
 from __future__ import annotations
 
-from re import IGNORECASE, compile, escape
+from heapq import nlargest
+from re import IGNORECASE, Match, Pattern, compile, escape
+from typing import Iterable, Sequence
 
 import rich.repr
 from rich.style import Style
@@ -16,6 +18,46 @@ from rich.text import Text
 from .cache import LRUCache
 
 
+def _compile_query(query: str, case_sensitive: bool) -> Pattern[str]:
+    """Compile a regular expression which matches the characters of a query in order.
+
+    Args:
+        query: A query as typed in by the user.
+        case_sensitive: Should matching be case sensitive?
+
+    Returns:
+        A regular expression with a group for each character of the query.
+    """
+    return compile(
+        ".*?".join(f"({escape(character)})" for character in query),
+        flags=0 if case_sensitive else IGNORECASE,
+    )
+
+
+def _score_match(match: Match[str], candidate: str) -> float:
+    """Score a match of a query against a candidate.
+
+    The score is reduced for every additional group of consecutive characters
+    that the query was matched in.
+
+    Args:
+        match: A match of a query regular expression.
+        candidate: The candidate that was matched.
+
+    Returns:
+        Strength of the match from 0 to 1.
+    """
+    assert match.lastindex is not None
+    offsets = [match.span(group_no)[0] for group_no in range(1, match.lastindex + 1)]
+    group_count = 0
+    last_offset = -2
+    for offset in offsets:
+        if offset > last_offset + 1:
+            group_count += 1
+        last_offset = offset
+    return 1.0 - ((group_count - 1) / len(candidate))
+
+
 @rich.repr.auto
 class Matcher:
     """A fuzzy matcher."""
@@ -36,10 +78,7 @@ class Matcher:
         """
         self._query = query
         self._match_style = Style(reverse=True) if match_style is None else match_style
-        self._query_regex = compile(
-            ".*?".join(f"({escape(character)})" for character in query),
-            flags=0 if case_sensitive else IGNORECASE,
-        )
+        self._query_regex = _compile_query(query, case_sensitive)
         self._cache: LRUCache[str, float] = LRUCache(1024 * 4)
 
     @property
@@ -75,21 +114,7 @@ class Matcher:
         if cached is not None:
             return cached
         match = self._query_regex.search(candidate)
-        if match is None:
-            score = 0.0
-        else:
-            assert match.lastindex is not None
-            offsets = [
-                match.span(group_no)[0] for group_no in range(1, match.lastindex + 1)
-            ]
-            group_count = 0
-            last_offset = -2
-            for offset in offsets:
-                if offset > last_offset + 1:
-                    group_count += 1
-                last_offset = offset
-
-            score = 1.0 - ((group_count - 1) / len(candidate))
+        score = 0.0 if match is None else _score_match(match, candidate)
         self._cache[candidate] = score
         return score
 
@@ -114,3 +139,147 @@ class Matcher:
             text.stylize(self._match_style, offset, offset + 1)
 
         return text
+
+
+def _get_bit_indexes(bits: int, size: int) -> list[int]:
+    """Get the indexes of the set bits in an integer.
+
+    Args:
+        bits: An integer used as a set of bits.
+        size: The number of bits in the set.
+
+    Returns:
+        The indexes of the set bits, in ascending order.
+    """
+    indexes: list[int] = []
+    add_index = indexes.append
+    data = bits.to_bytes((size + 7) // 8, "little")
+    for byte_match in _NON_ZERO_BYTES.finditer(data):
+        byte_index = byte_match.start()
+        byte = data[byte_index]
+        base = byte_index * 8
+        for bit in range(8):
+            if byte & (1 << bit):
+                add_index(base + bit)
+    return indexes
+
+
+_NON_ZERO_BYTES = compile(b"[^\x00]")
+
+
+@rich.repr.auto
+class FuzzyIndex:
+    """An index of candidates, which finds the best fuzzy matches for a query.
+
+    Matches are scored in the same way as [`Matcher.match`][textual.fuzzy.Matcher.match].
+    The index records the candidates which contain each character, so a search
+    only compares the query against candidates which contain every character in
+    the query. When a query extends the previous query (as it does when the user
+    types another character), only the candidates which matched the previous
+    query are compared.
+    """
+
+    def __init__(self, candidates: Iterable[str], *, case_sensitive: bool = False):
+        """Initialise the index.
+
+        Args:
+            candidates: The strings to search.
+            case_sensitive: Should matching be case sensitive?
+        """
+        self._candidates = list(candidates)
+        self._case_sensitive = case_sensitive
+        candidate_count = len(self._candidates)
+        byte_count = (candidate_count + 7) // 8
+        character_bits: dict[str, bytearray] = {}
+        # Case insensitive matching of some non-ASCII characters isn't the same
+        # as comparing lower case characters, so they are always compared.
+        unicode_bits = bytearray(byte_count)
+        for index, candidate in enumerate(self._candidates):
+            if not case_sensitive:
+                candidate = candidate.lower()
+            byte_index = index >> 3
+            bit = 1 << (index & 7)
+            if not candidate.isascii():
+                unicode_bits[byte_index] |= bit
+            for character in set(candidate):
+                bits = character_bits.get(character)
+                if bits is None:
+                    bits = character_bits[character] = bytearray(byte_count)
+                bits[byte_index] |= bit
+        self._unicode_bits = int.from_bytes(unicode_bits, "little")
+        self._character_bits = {
+            character: int.from_bytes(bits, "little")
+            for character, bits in character_bits.items()
+        }
+        self._last_query: str | None = None
+        self._last_matches: list[tuple[float, int]] = []
+
+    def __rich_repr__(self) -> rich.repr.Result:
+        yield "candidates", len(self._candidates)
+        yield "case_sensitive", self._case_sensitive, False
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    @property
+    def candidates(self) -> Sequence[str]:
+        """The strings in the index."""
+        return self._candidates
+
+    @property
+    def case_sensitive(self) -> bool:
+        """Is this index case sensitive?"""
+        return self._case_sensitive
+
+    def _get_possible_matches(self, query: str) -> list[int]:
+        """Get the indexes of candidates which may match a query.
+
+        Args:
+            query: A query which isn't empty.
+
+        Returns:
+            The indexes of candidates which contain every character of the query.
+        """
+        if self._last_query is not None and query.startswith(self._last_query):
+            # Only candidates which matched the shorter query can match
+            return [index for _score, index in self._last_matches]
+        if not self._case_sensitive:
+            query = query.lower()
+        character_bits = self._character_bits
+        unicode_bits = self._unicode_bits
+        bits = -1
+        for character in set(query):
+            bits &= character_bits.get(character, 0) | unicode_bits
+            if not bits:
+                return []
+        return _get_bit_indexes(bits, len(self._candidates))
+
+    def search(self, query: str, limit: int | None = None) -> list[tuple[float, int]]:
+        """Find the candidates which match a query.
+
+        Args:
+            query: A query as typed in by the user.
+            limit: The maximum number of matches to return, or `None` for all matches.
+
+        Returns:
+            Tuples of the score (from 0 to 1) and index of the matching candidates,
+                with the best match first. Matches with the same score are in the
+                order of the candidates.
+        """
+        candidates = self._candidates
+        if not query:
+            matches = [(1.0, index) for index in range(len(candidates))]
+        else:
+            search = _compile_query(query, self._case_sensitive).search
+            matches = []
+            add_match = matches.append
+            for index in self._get_possible_matches(query):
+                candidate = candidates[index]
+                match = search(candidate)
+                if match is not None:
+                    add_match((_score_match(match, candidate), index))
+            self._last_query = query
+            self._last_matches = matches
+        if limit is None or limit >= len(matches):
+            return sorted(matches, key=lambda match: (-match[0], match[1]))
+        return nlargest(limit, matches, key=lambda match: (match[0], -match[1]))
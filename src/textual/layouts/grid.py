@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from fractions import Fraction
 from typing import TYPE_CHECKING, Iterable
 
 from .._layout import ArrangeResult, Layout, WidgetPlacement
@@ -144,12 +143,12 @@ class GridLayout(Layout):
             if styles.min_width is not None:
                 width = max(
                     width,
-                    int(styles.min_width.resolve(size, viewport, Fraction(width))),
+                    int(styles.min_width.resolve(size, viewport, width)),
                 )
             if styles.max_width is not None:
                 width = min(
                     width,
-                    int(styles.max_width.resolve(size, viewport, Fraction(width))),
+                    int(styles.max_width.resolve(size, viewport, width)),
                 )
             return width
 
@@ -167,12 +166,12 @@ class GridLayout(Layout):
             if styles.min_height is not None:
                 height = max(
                     height,
-                    int(styles.min_height.resolve(size, viewport, Fraction(height))),
+                    int(styles.min_height.resolve(size, viewport, height)),
                 )
             if styles.max_height is not None:
                 height = min(
                     height,
-                    int(styles.max_height.resolve(size, viewport, Fraction(height))),
+                    int(styles.max_height.resolve(size, viewport, height)),
                 )
             return height
 
@@ -248,8 +247,8 @@ class GridLayout(Layout):
             width, height, margin = widget._get_box_model(
                 cell_size,
                 viewport,
-                Fraction(cell_size.width),
-                Fraction(cell_size.height),
+                cell_size.width,
+                cell_size.height,
             )
             region = (
                 Region(x, y, int(width + margin.width), int(height + margin.height))
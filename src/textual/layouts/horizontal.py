@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from fractions import Fraction
 from typing import TYPE_CHECKING
 
 from .._layout import ArrangeResult, Layout, WidgetPlacement
+from .._rational import Rational
 from .._resolve import resolve_box_models
 from ..geometry import Region, Size
 
@@ -64,13 +64,13 @@ class HorizontalLayout(Layout):
         if box_models:
             margins.append(box_models[-1].margin.right)
 
-        x = next(
+        x: Rational = next(
             (
-                Fraction(box_model.margin.left)
+                box_model.margin.left
                 for box_model, child in zip(box_models, children)
                 if child.styles.overlay != "screen"
             ),
-            Fraction(0),
+            0,
         )
 
         _Region = Region
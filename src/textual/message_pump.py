@@ -54,6 +54,11 @@ if TYPE_CHECKING:
 
 Callback: TypeAlias = "Callable[..., Any] | Callable[..., Awaitable[Any]]"
 
+# Classes in the MRO, and their handlers for a given message type
+_DispatchTable: TypeAlias = (
+    "list[tuple[type, list[tuple[Callable, dict[str, tuple[SelectorSet, ...]] | None]]]]"
+)
+
 
 class CallbackError(Exception):
     pass
@@ -85,6 +90,8 @@ class _MessagePumpMeta(type):
         ] = class_dict.get("_decorated_handlers", {})
 
         class_dict["_decorated_handlers"] = handlers
+        # Resolved handlers, populated on demand by MessagePump._get_dispatch_table
+        class_dict["_dispatch_table"] = {}
 
         for value in class_dict.values():
             if callable(value) and hasattr(value, "_textual_on"):
@@ -656,62 +663,107 @@ class MessagePump(metaclass=_MessagePumpMeta):
             if self._next_callbacks:
                 await self._flush_next_callbacks()
 
-    def _get_dispatch_methods(
-        self, method_name: str, message: Message
-    ) -> Iterable[tuple[type, Callable[[Message], Awaitable]]]:
-        """Gets handlers from the MRO
+    @classmethod
+    def _get_dispatch_table(
+        cls, method_name: str, message_type: type[Message]
+    ) -> _DispatchTable:
+        """Get the handlers for a message type, resolved from the MRO.
+
+        The result is cached on the class, so the MRO is only walked once for each
+        combination of handler name and message type.
 
         Args:
             method_name: Handler method name.
-            message: Message object.
+            message_type: Type of the message.
+
+        Returns:
+            A list of classes (in MRO order) and their handlers. Handlers are a tuple of
+                the function and the selectors from the `on` decorator, or `None` if the
+                handler was found by naming convention.
         """
-        from .widget import Widget
+        cache_key = (method_name, message_type)
+        dispatch_table = cast(
+            "dict[tuple[str, type[Message]], _DispatchTable]",
+            cls.__dict__["_dispatch_table"],
+        )
+        try:
+            return dispatch_table[cache_key]
+        except KeyError:
+            pass
 
-        methods_dispatched: set[Callable] = set()
         message_mro = [
-            _type for _type in message.__class__.__mro__ if issubclass(_type, Message)
+            _type for _type in message_type.__mro__ if issubclass(_type, Message)
         ]
-        for cls in self.__class__.__mro__:
-            if message._no_default_action:
-                break
-            # Try decorated handlers first
+        table: _DispatchTable = []
+        for base in cls.__mro__:
+            handlers: list[
+                tuple[Callable, dict[str, tuple[SelectorSet, ...]] | None]
+            ] = []
+            # Decorated handlers first
             decorated_handlers = cast(
                 "dict[type[Message], list[tuple[Callable, dict[str, tuple[SelectorSet, ...]]]]] | None",
-                cls.__dict__.get("_decorated_handlers"),
+                base.__dict__.get("_decorated_handlers"),
             )
-
             if decorated_handlers:
                 for message_class in message_mro:
-                    handlers = decorated_handlers.get(message_class, [])
-
-                    for method, selectors in handlers:
-                        if method in methods_dispatched:
-                            continue
-                        if not selectors:
-                            yield cls, method.__get__(self, cls)
-                            methods_dispatched.add(method)
-                        else:
-                            if not message._sender:
-                                continue
-                            for attribute, selector in selectors.items():
-                                node = getattr(message, attribute)
-                                if not isinstance(node, Widget):
-                                    raise OnNoWidget(
-                                        f"on decorator can't match against {attribute!r} as it is not a widget."
-                                    )
-                                if not match(selector, node):
-                                    break
-                            else:
-                                yield cls, method.__get__(self, cls)
-                                methods_dispatched.add(method)
+                    handlers.extend(decorated_handlers.get(message_class, []))
 
             # Fall back to the naming convention
             # But avoid calling the handler if it was decorated
-            method = cls.__dict__.get(f"_{method_name}") or cls.__dict__.get(
+            method = base.__dict__.get(f"_{method_name}") or base.__dict__.get(
                 method_name
             )
             if method is not None and not getattr(method, "_textual_on", None):
-                yield cls, method.__get__(self, cls)
+                handlers.append((method, None))
+
+            if handlers:
+                table.append((base, handlers))
+
+        dispatch_table[cache_key] = table
+        return table
+
+    def _get_dispatch_methods(
+        self, method_name: str, message: Message
+    ) -> Iterable[tuple[type, Callable[[Message], Awaitable]]]:
+        """Gets handlers from the MRO
+
+        Args:
+            method_name: Handler method name.
+            message: Message object.
+        """
+        dispatch_table = self._get_dispatch_table(method_name, message.__class__)
+        if not dispatch_table:
+            return
+
+        methods_dispatched: set[Callable] = set()
+        for cls, handlers in dispatch_table:
+            if message._no_default_action:
+                break
+            for method, selectors in handlers:
+                if selectors is None:
+                    yield cls, method.__get__(self, cls)
+                    continue
+                if method in methods_dispatched:
+                    continue
+                if not selectors:
+                    yield cls, method.__get__(self, cls)
+                    methods_dispatched.add(method)
+                else:
+                    if not message._sender:
+                        continue
+                    from .widget import Widget
+
+                    for attribute, selector in selectors.items():
+                        node = getattr(message, attribute)
+                        if not isinstance(node, Widget):
+                            raise OnNoWidget(
+                                f"on decorator can't match against {attribute!r} as it is not a widget."
+                            )
+                        if not match(selector, node):
+                            break
+                    else:
+                        yield cls, method.__get__(self, cls)
+                        methods_dispatched.add(method)
 
     async def on_event(self, event: events.Event) -> None:
         """Called to process an event.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable
 
 from rich.console import Console, ConsoleOptions, RenderResult
@@ -12,6 +13,32 @@ if TYPE_CHECKING:
     from ..screen import Screen
 
 
+@lru_cache(maxsize=4096)
+def _tint_style(style: Style, color: Color) -> Style:
+    """Apply a tint to a style.
+
+    Args:
+        style: A style without meta or links.
+        color: Color of tint.
+
+    Returns:
+        A new style.
+    """
+    from_rich_color = Color.from_rich_color
+    return style + Style.from_color(
+        (
+            (from_rich_color(style.color) + color).rich_color
+            if style.color is not None
+            else None
+        ),
+        (
+            (from_rich_color(style.bgcolor) + color).rich_color
+            if style.bgcolor is not None
+            else None
+        ),
+    )
+
+
 class BackgroundScreen:
     """Tints a renderable and removes links / meta."""
 
@@ -44,8 +71,7 @@ class BackgroundScreen:
         Returns:
             Segments with applied tint.
         """
-        from_rich_color = Color.from_rich_color
-        style_from_color = Style.from_color
+        tint_style = _tint_style
         _Segment = Segment
 
         NULL_STYLE = Style()
@@ -55,23 +81,11 @@ class BackgroundScreen:
             if control:
                 yield segment
             else:
-                style = NULL_STYLE if style is None else style.clear_meta_and_links()
                 yield _Segment(
                     text,
-                    (
-                        style
-                        + style_from_color(
-                            (
-                                (from_rich_color(style.color) + color).rich_color
-                                if style.color is not None
-                                else None
-                            ),
-                            (
-                                (from_rich_color(style.bgcolor) + color).rich_color
-                                if style.bgcolor is not None
-                                else None
-                            ),
-                        )
+                    tint_style(
+                        NULL_STYLE if style is None else style.clear_meta_and_links(),
+                        color,
                     ),
                     control,
                 )
@@ -79,6 +93,7 @@ class BackgroundScreen:
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
     ) -> RenderResult:
-        segments = console.render(self.screen._compositor, options)
-        color = self.color
-        return self.process_segments(segments, color)
+        new_line = Segment.line()
+        for strip in self.screen._render_background(self.color):
+            yield from strip
+            yield new_line
@@ -32,6 +32,7 @@ from ._callback import invoke
 from ._compositor import Compositor, MapGeometry
 from ._context import active_message_pump, visible_screen_stack
 from ._path import CSSPathType, _css_path_type_as_list, _make_path_object_relative
+from ._query_index import QueryIndex
 from ._types import CallbackType
 from .await_complete import AwaitComplete
 from .binding import ActiveBinding, Binding, _Bindings
@@ -45,6 +46,7 @@ from .reactive import Reactive
 from .renderables.background_screen import BackgroundScreen
 from .renderables.blank import Blank
 from .signal import Signal
+from .strip import Strip
 from .timer import Timer
 from .widget import Widget
 from .widgets import Tooltip
@@ -53,6 +55,8 @@ from .widgets._toast import ToastRack
 if TYPE_CHECKING:
     from typing_extensions import Final
 
+    from .color import Color
+
     from .command import Provider
 
     # Unused & ignored imports are needed for the docs to link to these objects:
@@ -202,8 +206,12 @@ class Screen(Generic[ScreenResultType], Widget):
         """
         self._modal = False
         super().__init__(name=name, id=id, classes=classes)
+        # Create an index of the widgets on the screen, for queries
+        QueryIndex().add(self)
         self._compositor = Compositor()
         self._dirty_widgets: set[Widget] = set()
+        self._background_cache: tuple[Size, Color, list[Strip | None]] | None = None
+        """Tinted lines, for when the screen is behind a translucent screen."""
         self.__update_timer: Timer | None = None
         self._callbacks: list[tuple[CallbackType, MessagePump]] = []
         self._result_callbacks: list[ResultCallback[ScreenResultType]] = []
@@ -375,6 +383,58 @@ class Screen(Generic[ScreenResultType], Widget):
         # Render a screen of a solid color.
         return Blank(background)
 
+    def _render_background(self, color: Color) -> list[Strip]:
+        """Render the screen with a tint, to show behind a translucent screen.
+
+        Tinted lines are cached, and only lines the compositor has updated since the
+        last render are rendered again.
+
+        Args:
+            color: Color of tint.
+
+        Returns:
+            A list of strips.
+        """
+        compositor = self._compositor
+        size = compositor.size
+        width, height = size
+        cache = self._background_cache
+        if cache is None or cache[0] != size or cache[1] != color:
+            lines: list[Strip | None] = [None] * height
+            self._background_cache = (size, color, lines)
+        else:
+            lines = cache[2]
+            self._invalidate_background(compositor._dirty_regions)
+
+        dirty_lines = [y for y, line in enumerate(lines) if line is None]
+        if dirty_lines:
+            crop = Region(
+                0, dirty_lines[0], width, dirty_lines[-1] - dirty_lines[0] + 1
+            )
+            chops = compositor._render_chops(crop, set(dirty_lines).__contains__)
+            process_segments = BackgroundScreen.process_segments
+            join = Strip.join
+            for y in dirty_lines:
+                lines[y] = Strip(
+                    process_segments(join(chops[y].values()), color), width
+                )
+        return cast("list[Strip]", lines)
+
+    def _invalidate_background(self, regions: Iterable[Region]) -> None:
+        """Invalidate cached background lines.
+
+        Args:
+            regions: Regions of the screen which have changed.
+        """
+        if self._background_cache is None:
+            return
+        lines = self._background_cache[2]
+        height = len(lines)
+        for region in regions:
+            top, bottom = region.line_span
+            for y in range(max(0, top), min(bottom, height)):
+                lines[y] = None
+
     def get_offset(self, widget: Widget) -> Offset:
         """Get the absolute offset of a given Widget.
 
@@ -800,9 +860,11 @@ class Screen(Generic[ScreenResultType], Widget):
                 app._previous_inline_height = inline_height
                 self._dirty_widgets.clear()
                 self._compositor._dirty_regions.clear()
+                self._background_cache = None
             elif (
                 self in self.app._background_screens and self._compositor._dirty_regions
             ):
+                self._invalidate_background(self._compositor._dirty_regions)
                 app.screen.refresh(*self._compositor._dirty_regions)
                 self._compositor._dirty_regions.clear()
                 self._dirty_widgets.clear()
@@ -815,10 +877,13 @@ class Screen(Generic[ScreenResultType], Widget):
                 )
                 app._display(self, update)
                 self._dirty_widgets.clear()
+                # Updates are no longer tracked by the background cache
+                self._background_cache = None
             elif (
                 self in self.app._background_screens and self._compositor._dirty_regions
             ):
                 # Background screen
+                self._invalidate_background(self._compositor._dirty_regions)
                 app.screen.refresh(*self._compositor._dirty_regions)
                 self._compositor._dirty_regions.clear()
                 self._dirty_widgets.clear()
@@ -1021,6 +1086,7 @@ class Screen(Generic[ScreenResultType], Widget):
 
     def _screen_resized(self, size: Size):
         """Called by App when the screen is resized."""
+        self._compositor.clear_front_buffer()
         self._refresh_layout(size)
         self.refresh()
 
@@ -1028,6 +1094,7 @@ class Screen(Generic[ScreenResultType], Widget):
         """Screen has resumed."""
         self.stack_updates += 1
         self.app._refresh_notifications()
+        self._compositor.clear_front_buffer()
         size = self.app.size
         self._refresh_layout(size)
         self.refresh()
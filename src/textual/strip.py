@@ -89,18 +89,25 @@ class Strip:
     ) -> None:
         self._segments = list(segments)
         self._cell_length = cell_length
-        self._divide_cache: FIFOCache[tuple[int, ...], list[Strip]] = FIFOCache(4)
-        self._crop_cache: FIFOCache[tuple[int, int], Strip] = FIFOCache(16)
-        self._style_cache: FIFOCache[Style, Strip] = FIFOCache(16)
-        self._filter_cache: FIFOCache[tuple[LineFilter, Color], Strip] = FIFOCache(4)
-        self._line_length_cache: FIFOCache[
-            tuple[int, Style | None],
-            Strip,
-        ] = FIFOCache(4)
-        self._crop_extend_cache: FIFOCache[
-            tuple[int, int, Style | None],
-            Strip,
-        ] = FIFOCache(4)
+        # Caches are created on first use, as most strips are never cropped, divided etc.
+        self._divide_cache: FIFOCache[tuple[int, ...], list[Strip]] | None = None
+        self._crop_cache: FIFOCache[tuple[int, int], Strip] | None = None
+        self._style_cache: FIFOCache[Style, Strip] | None = None
+        self._filter_cache: FIFOCache[tuple[LineFilter, Color], Strip] | None = None
+        self._line_length_cache: (
+            FIFOCache[
+                tuple[int, Style | None],
+                Strip,
+            ]
+            | None
+        ) = None
+        self._crop_extend_cache: (
+            FIFOCache[
+                tuple[int, int, Style | None],
+                Strip,
+            ]
+            | None
+        ) = None
         self._render_cache: str | None = None
         self._link_ids: set[str] | None = None
 
@@ -243,9 +250,13 @@ class Strip:
         """
 
         cache_key = (cell_length, style)
-        cached_strip = self._line_length_cache.get(cache_key)
-        if cached_strip is not None:
-            return cached_strip
+        line_length_cache = self._line_length_cache
+        if line_length_cache is None:
+            line_length_cache = self._line_length_cache = FIFOCache(4)
+        else:
+            cached_strip = line_length_cache.get(cache_key)
+            if cached_strip is not None:
+                return cached_strip
 
         new_line: list[Segment]
         line = self._segments
@@ -280,7 +291,7 @@ class Strip:
             # Strip is already the required cell length, so return self.
             strip = self
 
-        self._line_length_cache[cache_key] = strip
+        line_length_cache[cache_key] = strip
 
         return strip
 
@@ -305,12 +316,15 @@ class Strip:
         Returns:
             A new Strip.
         """
-        cached_strip = self._filter_cache.get((filter, background))
+        filter_cache = self._filter_cache
+        if filter_cache is None:
+            filter_cache = self._filter_cache = FIFOCache(4)
+        cached_strip = filter_cache.get((filter, background))
         if cached_strip is None:
             cached_strip = Strip(
                 filter.apply(self._segments, background), self._cell_length
             )
-            self._filter_cache[(filter, background)] = cached_strip
+            filter_cache[(filter, background)] = cached_strip
         return cached_strip
 
     def style_links(self, link_id: str, link_style: Style) -> Strip:
@@ -353,11 +367,15 @@ class Strip:
             New cropped Strip.
         """
         cache_key = (start, end, style)
-        cached_result = self._crop_extend_cache.get(cache_key)
-        if cached_result is not None:
-            return cached_result
+        crop_extend_cache = self._crop_extend_cache
+        if crop_extend_cache is None:
+            crop_extend_cache = self._crop_extend_cache = FIFOCache(4)
+        else:
+            cached_result = crop_extend_cache.get(cache_key)
+            if cached_result is not None:
+                return cached_result
         strip = self.extend_cell_length(end, style).crop(start, end)
-        self._crop_extend_cache[cache_key] = strip
+        crop_extend_cache[cache_key] = strip
         return strip
 
     def crop(self, start: int, end: int | None = None) -> Strip:
@@ -375,9 +393,13 @@ class Strip:
         if start == 0 and end == self.cell_length:
             return self
         cache_key = (start, end)
-        cached = self._crop_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        crop_cache = self._crop_cache
+        if crop_cache is None:
+            crop_cache = self._crop_cache = FIFOCache(16)
+        else:
+            cached = crop_cache.get(cache_key)
+            if cached is not None:
+                return cached
         _cell_len = cell_len
         pos = 0
         output_segments: list[Segment] = []
@@ -412,7 +434,7 @@ class Strip:
                     pos = end_pos
                     segment = next(iter_segments, None)
                 strip = Strip(output_segments, end - start)
-        self._crop_cache[cache_key] = strip
+        crop_cache[cache_key] = strip
         return strip
 
     def divide(self, cuts: Iterable[int]) -> Sequence[Strip]:
@@ -429,9 +451,13 @@ class Strip:
         cell_length = self.cell_length
         cuts = [cut for cut in cuts if cut <= cell_length]
         cache_key = tuple(cuts)
-        cached = self._divide_cache.get(cache_key)
-        if cached is not None:
-            return cached
+        divide_cache = self._divide_cache
+        if divide_cache is None:
+            divide_cache = self._divide_cache = FIFOCache(4)
+        else:
+            cached = divide_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
         strips: list[Strip]
         if cuts == [cell_length]:
@@ -443,7 +469,7 @@ class Strip:
                 add_strip(Strip(segments, cut - pos))
                 pos = cut
 
-        self._divide_cache[cache_key] = strips
+        divide_cache[cache_key] = strips
         return strips
 
     def apply_style(self, style: Style) -> Strip:
@@ -455,13 +481,17 @@ class Strip:
         Returns:
             A new strip.
         """
-        cached = self._style_cache.get(style)
-        if cached is not None:
-            return cached
+        style_cache = self._style_cache
+        if style_cache is None:
+            style_cache = self._style_cache = FIFOCache(16)
+        else:
+            cached = style_cache.get(style)
+            if cached is not None:
+                return cached
         styled_strip = Strip(
             Segment.apply_style(self._segments, style), self.cell_length
         )
-        self._style_cache[style] = styled_strip
+        style_cache[style] = styled_strip
         return styled_strip
 
     def render(self, console: Console) -> str:
@@ -7,7 +7,6 @@ from __future__ import annotations
 from asyncio import create_task, wait
 from collections import Counter
 from contextlib import asynccontextmanager
-from fractions import Fraction
 from itertools import islice
 from types import TracebackType
 from typing import (
@@ -51,6 +50,7 @@ from ._compose import compose
 from ._context import NoActiveAppError, active_app
 from ._easing import DEFAULT_SCROLL_EASING
 from ._layout import Layout
+from ._rational import Rational
 from ._segment_tools import align_lines
 from ._styles_cache import StylesCache
 from ._types import AnimationLevel
@@ -1143,6 +1143,29 @@ class Widget(DOMNode):
             if self.is_attached:
                 await self.mount_all(compose(self))
 
+    def _attach(self, parent: MessagePump) -> None:
+        """Set the parent, and add the widget to the query index of the parent's screen.
+
+        Args:
+            parent: Parent node.
+        """
+        super()._attach(parent)
+        query_index = getattr(parent, "_query_index", None)
+        if query_index is not None and self._query_index is not query_index:
+            # Index the widget, and any descendants attached before it was
+            query_index.add(self)
+            for widget in self.walk_children(Widget):
+                query_index.add(widget)
+
+    def _detach(self) -> None:
+        """Set the parent to None, and remove the widget from the query index."""
+        query_index = self._query_index
+        if query_index is not None and query_index is getattr(
+            self._parent, "_query_index", None
+        ):
+            query_index.discard(self)
+        super()._detach()
+
     def _post_register(self, app: App) -> None:
         """Called when the instance is registered.
 
@@ -1163,8 +1186,8 @@ class Widget(DOMNode):
         self,
         container: Size,
         viewport: Size,
-        width_fraction: Fraction,
-        height_fraction: Fraction,
+        width_fraction: Rational,
+        height_fraction: Rational,
     ) -> BoxModel:
         """Process the box model for this widget.
 
@@ -1179,8 +1202,8 @@ class Widget(DOMNode):
         """
         styles = self.styles
         _content_width, _content_height = container
-        content_width = Fraction(_content_width)
-        content_height = Fraction(_content_height)
+        content_width: Rational = _content_width
+        content_height: Rational = _content_height
         is_border_box = styles.box_sizing == "border-box"
         gutter = styles.gutter
         margin = styles.margin
@@ -1193,11 +1216,11 @@ class Widget(DOMNode):
 
         if styles.width is None:
             # No width specified, fill available space
-            content_width = Fraction(content_container.width - margin.width)
+            content_width = content_container.width - margin.width
         elif is_auto_width:
             # When width is auto, we want enough space to always fit the content
-            content_width = Fraction(
-                self.get_content_width(content_container - margin.totals, viewport)
+            content_width = self.get_content_width(
+                content_container - margin.totals, viewport
             )
             if styles.scrollbar_gutter == "stable" and styles.overflow_x == "auto":
                 content_width += styles.scrollbar_size_vertical
@@ -1205,7 +1228,7 @@ class Widget(DOMNode):
                 content_width < content_container.width
                 and self._has_relative_children_width
             ):
-                content_width = Fraction(content_container.width)
+                content_width = content_container.width
         else:
             # An explicit width
             styles_width = styles.width
@@ -1222,7 +1245,7 @@ class Widget(DOMNode):
             )
             if is_border_box:
                 min_width -= gutter.width
-            content_width = max(content_width, min_width, Fraction(0))
+            content_width = max(content_width, min_width, 0)
 
         if styles.max_width is not None and not (
             container.width == 0
@@ -1239,15 +1262,15 @@ class Widget(DOMNode):
 
             content_width = min(content_width, max_width)
 
-        content_width = max(Fraction(0), content_width)
+        content_width = max(0, content_width)
 
         if styles.height is None:
             # No height specified, fill the available space
-            content_height = Fraction(content_container.height - margin.height)
+            content_height = content_container.height - margin.height
         elif is_auto_height:
             # Calculate dimensions based on content
-            content_height = Fraction(
-                self.get_content_height(content_container, viewport, int(content_width))
+            content_height = self.get_content_height(
+                content_container, viewport, int(content_width)
             )
             if styles.scrollbar_gutter == "stable" and styles.overflow_y == "auto":
                 content_height += styles.scrollbar_size_horizontal
@@ -1255,7 +1278,7 @@ class Widget(DOMNode):
                 content_height < content_container.height
                 and self._has_relative_children_height
             ):
-                content_height = Fraction(content_container.height)
+                content_height = content_container.height
         else:
             styles_height = styles.height
             # Explicit height set
@@ -1272,7 +1295,7 @@ class Widget(DOMNode):
             )
             if is_border_box:
                 min_height -= gutter.height
-            content_height = max(content_height, min_height, Fraction(0))
+            content_height = max(content_height, min_height, 0)
 
         if styles.max_height is not None and not (
             container.height == 0
@@ -1288,7 +1311,7 @@ class Widget(DOMNode):
                 max_height -= gutter.height
             content_height = min(content_height, max_height)
 
-        content_height = max(Fraction(0), content_height)
+        content_height = max(0, content_height)
 
         model = BoxModel(
             content_width + gutter.width, content_height + gutter.height, margin
@@ -3217,11 +3240,11 @@ class Widget(DOMNode):
     def watch_mouse_over(self, value: bool) -> None:
         """Update from CSS if mouse over state changes."""
         if self._has_hover_style:
-            self._update_styles()
+            self._update_styles([":hover"])
 
     def watch_has_focus(self, value: bool) -> None:
         """Update from CSS if has focus state changes."""
-        self._update_styles()
+        self._update_styles([":focus", ":blur"])
 
     def watch_disabled(self) -> None:
         """Update the styles of the widget and its children when disabled is toggled."""
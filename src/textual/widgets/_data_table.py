@@ -2,9 +2,23 @@ from __future__ import annotations
 
 import functools
 from dataclasses import dataclass
-from itertools import chain, zip_longest
+from inspect import isawaitable
+from itertools import chain, repeat, zip_longest
 from operator import itemgetter
-from typing import Any, Callable, ClassVar, Generic, Iterable, NamedTuple, TypeVar, cast
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Generic,
+    Iterable,
+    Iterator,
+    MutableMapping,
+    NamedTuple,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 import rich.repr
 from rich.console import RenderableType
@@ -13,10 +27,11 @@ from rich.protocol import is_renderable
 from rich.segment import Segment
 from rich.style import Style
 from rich.text import Text, TextType
-from typing_extensions import Literal, Self, TypeAlias
+from typing_extensions import Literal, Protocol, Self, TypeAlias
 
 from .. import events
 from .._segment_tools import line_crop
+from .._row_index import RowIndex
 from .._two_way_dict import TwoWayDict
 from .._types import SegmentLines
 from ..binding import Binding, BindingType
@@ -45,6 +60,7 @@ CursorType = Literal["cell", "row", "column", "none"]
 """The valid types of cursors for [`DataTable.cursor_type`][textual.widgets.DataTable.cursor_type]."""
 CellType = TypeVar("CellType")
 """Type used for cells in the DataTable."""
+_T = TypeVar("_T")
 
 _DEFAULT_CELL_X_PADDING = 1
 """Default padding to use on each side of a column in the data table."""
@@ -74,6 +90,11 @@ class DuplicateKey(Exception):
     an existing row or column in the DataTable. Keys must be unique."""
 
 
+class ReadOnlyRows(Exception):
+    """Raised when attempting to modify the rows of a DataTable which reads
+    its rows from a data source."""
+
+
 @functools.total_ordering
 class StringKey:
     """An object used as a key in a mapping.
@@ -211,6 +232,248 @@ class RowRenderables(NamedTuple):
     cells: list[RenderableType]
 
 
+DataSourceRows: TypeAlias = "Sequence[Sequence[Any]]"
+"""Rows returned from a data source. Each row is a sequence of cells, in column order."""
+
+
+class DataSource(Protocol):
+    """A source of rows for a [DataTable][textual.widgets.DataTable].
+
+    Set with [DataTable.set_data_source][textual.widgets.DataTable.set_data_source], to read
+    rows as they are displayed rather than adding them all up front. Rows are read in pages,
+    and a limited number of pages are kept in memory.
+
+    A data source may also define a `get_column_widths()` method, which returns the content
+    width (or `None`) of each column. If it does, the table won't measure rows as they are read.
+    """
+
+    @property
+    def row_count(self) -> int:
+        """The number of rows in the source."""
+        ...
+
+    def get_rows(
+        self, start: int, stop: int
+    ) -> DataSourceRows | Awaitable[DataSourceRows]:
+        """Get rows from the source.
+
+        Args:
+            start: Index of the first row.
+            stop: Index after the last row.
+
+        Returns:
+            The rows between `start` and `stop`, or an awaitable that returns them.
+                The rows will be displayed empty until an awaitable is complete.
+        """
+        ...
+
+
+def _get_row_key_index(row_key: object) -> int | None:
+    """Get the row index from the key of a row in a data source.
+
+    Args:
+        row_key: A row key or string.
+
+    Returns:
+        The row index, or `None` if the key isn't a data source key.
+    """
+    value = row_key.value if isinstance(row_key, StringKey) else row_key
+    if isinstance(value, str) and value.isdecimal():
+        return int(value)
+    return None
+
+
+class _DataSourceRowIndex(RowIndex[RowKey]):
+    """Row index for rows in a data source.
+
+    Every row has a height of 1, and a key which is its index as a string.
+    """
+
+    def __init__(self, source: DataSource) -> None:
+        super().__init__()
+        self._source = source
+
+    def __len__(self) -> int:
+        return self._source.row_count
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(cast(RowKey, key)) is not None
+
+    def __iter__(self) -> Iterator[RowKey]:
+        return (RowKey(str(index)) for index in range(len(self)))
+
+    def get(self, key: RowKey) -> int | None:
+        index = _get_row_key_index(key)
+        if index is not None and index < len(self):
+            return index
+        return None
+
+    def get_key(self, index: int) -> RowKey | None:
+        if 0 <= index < len(self):
+            return RowKey(str(index))
+        return None
+
+    def get_height(self, index: int) -> int:
+        return 1
+
+    def set_height(self, index: int, height: int) -> None:
+        pass
+
+    @property
+    def total_height(self) -> int:
+        return len(self)
+
+    def get_line(self, index: int) -> int:
+        return min(max(0, index), len(self))
+
+    def get_row_at_line(self, y: int) -> tuple[int, int]:
+        if not 0 <= y < len(self):
+            raise LookupError(f"No row at line {y!r}")
+        return y, 0
+
+
+class _ReadOnlyRowsMapping(MutableMapping[RowKey, _T]):
+    """A mapping of rows in a data source, which raises `ReadOnlyRows` if modified."""
+
+    def __setitem__(self, key: RowKey, value: _T) -> None:
+        raise ReadOnlyRows("Rows can't be modified in a DataTable with a data source.")
+
+    def __delitem__(self, key: RowKey) -> None:
+        raise ReadOnlyRows("Rows can't be modified in a DataTable with a data source.")
+
+
+class _DataSourceRows(_ReadOnlyRowsMapping[Row]):
+    """Row metadata for rows in a data source, created on demand."""
+
+    def __init__(self, row_index: _DataSourceRowIndex) -> None:
+        self._row_index = row_index
+
+    def __getitem__(self, key: RowKey) -> Row:
+        index = self._row_index.get(key)
+        if index is None:
+            raise KeyError(key)
+        return Row(RowKey(str(index)), 1)
+
+    def __len__(self) -> int:
+        return len(self._row_index)
+
+    def __iter__(self) -> Iterator[RowKey]:
+        return iter(self._row_index)
+
+
+class _DataSourceData(_ReadOnlyRowsMapping["dict[ColumnKey, Any]"]):
+    """Cells for rows in a data source, read from the source a page at a time."""
+
+    def __init__(
+        self,
+        data_table: DataTable[Any],
+        source: DataSource,
+        row_index: _DataSourceRowIndex,
+        page_size: int,
+        cache_size: int,
+    ) -> None:
+        """Initialize data source data.
+
+        Args:
+            data_table: The data table displaying the rows.
+            source: The data source.
+            row_index: The row index for the data source.
+            page_size: Number of rows to read from the source at a time.
+            cache_size: Maximum number of pages to keep in memory.
+        """
+        self._data_table = data_table
+        self.source = source
+        """The data source."""
+        self._row_index = row_index
+        self._page_size = page_size
+        self._pages: LRUCache[int, DataSourceRows | None] = LRUCache(cache_size)
+        """Pages of rows, or `None` for a page which is loading."""
+        self.generation = 0
+        """Incremented when cached pages are invalidated."""
+
+    def __getitem__(self, key: RowKey) -> dict[ColumnKey, Any]:
+        index = self._row_index.get(key)
+        if index is None:
+            raise KeyError(key)
+        page_index, offset = divmod(index, self._page_size)
+        page = self._get_page(page_index)
+        cells: Sequence[Any] = (
+            page[offset] if page is not None and offset < len(page) else ()
+        )
+        column_keys = [column.key for column in self._data_table.ordered_columns]
+        return dict(zip(column_keys, chain(cells, repeat(None))))
+
+    def __len__(self) -> int:
+        return len(self._row_index)
+
+    def __iter__(self) -> Iterator[RowKey]:
+        return iter(self._row_index)
+
+    def _get_page(self, page_index: int) -> DataSourceRows | None:
+        """Get a page of rows, reading it from the source if required.
+
+        Args:
+            page_index: Index of the page.
+
+        Returns:
+            Rows in the page, or `None` if they are loading.
+        """
+        if page_index in self._pages:
+            return self._pages[page_index]
+        start = page_index * self._page_size
+        stop = min(start + self._page_size, len(self._row_index))
+        rows = self.source.get_rows(start, stop)
+        if isawaitable(rows):
+            self._pages[page_index] = None
+            self._data_table._load_data_source_page(
+                self.generation, page_index, cast(Awaitable[DataSourceRows], rows)
+            )
+            return None
+        rows = cast(DataSourceRows, rows)
+        self._pages[page_index] = rows
+        self._data_table._queue_data_source_rows(rows)
+        return rows
+
+    def set_page(self, generation: int, page_index: int, rows: DataSourceRows) -> bool:
+        """Store a page of rows which was loaded asynchronously.
+
+        Args:
+            generation: The generation when the page was requested.
+            page_index: Index of the page.
+            rows: Rows in the page.
+
+        Returns:
+            `True` if the page was stored, or `False` if it has since been invalidated.
+        """
+        if generation != self.generation:
+            return False
+        # Replace the placeholder for the loading page
+        self._pages.discard(page_index)
+        self._pages[page_index] = rows
+        return True
+
+    def invalidate(self, start: int | None = None, stop: int | None = None) -> None:
+        """Discard cached rows, so they are read again from the source.
+
+        Args:
+            start: Index of the first row to discard, or `None` for the first row.
+            stop: Index after the last row to discard, or `None` for all rows.
+        """
+        self.generation += 1
+        page_size = self._page_size
+        first_page = 0 if start is None else start // page_size
+        last_page = None if stop is None else (stop - 1) // page_size
+        pages = self._pages
+        for page_index in list(pages.keys()):
+            if pages.get(page_index) is None or (
+                page_index >= first_page
+                and (last_page is None or page_index <= last_page)
+            ):
+                # Pages which are still loading are also discarded, as the loaded
+                # rows will be ignored from a previous generation.
+                pages.discard(page_index)
+
+
 class DataTable(ScrollView, Generic[CellType], can_focus=True):
     """A tabular widget that contains data."""
 
@@ -663,8 +926,8 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         # given a row or column key, the index that row or column is currently
         # present at, and mean that rows and columns are location independent - they
         # can move around without requiring us to modify the underlying data.
-        self._row_locations: TwoWayDict[RowKey, int] = TwoWayDict({})
-        """Maps row keys to row indices which represent row order."""
+        self._row_locations: RowIndex[RowKey] = RowIndex()
+        """Maps row keys to row indices which represent row order, and rows to lines."""
         self._column_locations: TwoWayDict[ColumnKey, int] = TwoWayDict({})
         """Maps column keys to column indices which represent column order."""
 
@@ -678,9 +941,6 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         """Cache for individual cells."""
         self._line_cache: LRUCache[LineCacheKey, Strip] = LRUCache(1000)
         """Cache for lines within rows."""
-        self._offset_cache: LRUCache[int, list[tuple[RowKey, int]]] = LRUCache(1)
-        """Cached y_offset - key is update_count - see y_offsets property for more
-        information """
         self._ordered_row_cache: LRUCache[tuple[int, int], list[Row]] = LRUCache(1)
         """Caches row ordering - key is (num_rows, update_count)."""
 
@@ -696,6 +956,11 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         self._updated_cells: set[CellKey] = set()
         """Track which cells were updated, so that we can refresh them once on idle."""
 
+        self._data_source_data: _DataSourceData | None = None
+        """Cells read from a data source, if the table has one."""
+        self._unmeasured_data_source_rows: list[DataSourceRows] = []
+        """Rows read from a data source, to be measured on idle."""
+
         self._show_hover_cursor = False
         """Used to hide the mouse hover cursor when the user uses the keyboard."""
         self._update_count = 0
@@ -759,25 +1024,10 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         """The number of rows currently present in the DataTable."""
         return len(self.rows)
 
-    @property
-    def _y_offsets(self) -> list[tuple[RowKey, int]]:
-        """Contains a 2-tuple for each line (not row!) of the DataTable. Given a
-        y-coordinate, we can index into this list to find which row that y-coordinate
-        lands on, and the y-offset *within* that row. The length of the returned list
-        is therefore the total height of all rows within the DataTable."""
-        y_offsets: list[tuple[RowKey, int]] = []
-        if self._update_count in self._offset_cache:
-            y_offsets = self._offset_cache[self._update_count]
-        else:
-            for row in self.ordered_rows:
-                y_offsets += [(row.key, y) for y in range(row.height)]
-            self._offset_cache[self._update_count] = y_offsets
-        return y_offsets
-
     @property
     def _total_row_height(self) -> int:
         """The total height of all rows within the DataTable"""
-        return len(self._y_offsets)
+        return self._row_locations.total_height
 
     def update_cell(
         self,
@@ -799,7 +1049,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         Raises:
             CellDoesNotExist: When the supplied `row_key` and `column_key`
                 cannot be found in the table.
+            ReadOnlyRows: If the table reads its rows from a data source.
         """
+        self._check_no_data_source()
         if isinstance(row_key, str):
             row_key = RowKey(row_key)
         if isinstance(column_key, str):
@@ -1013,7 +1265,6 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         self._cell_render_cache.clear()
         self._line_cache.clear()
         self._styles_cache.clear()
-        self._offset_cache.clear()
         self._ordered_row_cache.clear()
         self._get_styles_to_render_cell.cache_clear()
 
@@ -1371,6 +1622,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
                     height = max(height, cell_height)
 
                 row.height = height
+                self._row_locations.set_height(row_index, height)
                 # Do surgery on the cache for cells that were rendered with the incorrect
                 # height during the first pass.
                 for cell_renderable, cell_height, column_width in rendered_cells:
@@ -1414,7 +1666,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         column_key = self._column_locations.get_key(column_index)
         width = self.columns[column_key].get_render_width(self)
         height = row.height
-        y = sum(ordered_row.height for ordered_row in self.ordered_rows[:row_index])
+        y = self._row_locations.get_line(row_index)
         if self.show_header:
             y += self.header_height
         cell_region = Region(x, y, width, height)
@@ -1432,7 +1684,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             sum(column.get_render_width(self) for column in self.columns.values())
             + self._row_label_column_width
         )
-        y = sum(ordered_row.height for ordered_row in self.ordered_rows[:row_index])
+        y = self._row_locations.get_line(row_index)
         if self.show_header:
             y += self.header_height
         row_region = Region(0, y, row_width, row.height)
@@ -1468,10 +1720,16 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             The `DataTable` instance.
         """
         self._clear_caches()
-        self._y_offsets.clear()
-        self._data.clear()
-        self.rows.clear()
-        self._row_locations = TwoWayDict({})
+        if self._data_source_data is None:
+            self._data.clear()
+            self.rows.clear()
+        else:
+            # The rows of a data source are read-only views
+            self._data = {}
+            self.rows = {}
+            self._data_source_data = None
+            self._unmeasured_data_source_rows.clear()
+        self._row_locations = RowIndex()
         if columns:
             self.columns.clear()
             self._column_locations = TwoWayDict({})
@@ -1535,9 +1793,10 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         self._column_locations[column_key] = column_index
 
         # Update pre-existing rows to account for the new column.
-        for row_key in self.rows.keys():
-            self._data[row_key][column_key] = default
-            self._updated_cells.add(CellKey(row_key, column_key))
+        if self._data_source_data is None:
+            for row_key in self.rows.keys():
+                self._data[row_key][column_key] = default
+                self._updated_cells.add(CellKey(row_key, column_key))
 
         self._require_update_dimensions = True
         self._update_count += 1
@@ -1566,7 +1825,11 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             Unique identifier for this row. Can be used to retrieve this row regardless
                 of its current location in the DataTable (it could have moved after
                 being added due to sorting or insertion/deletion of other rows).
+
+        Raises:
+            ReadOnlyRows: If the table reads its rows from a data source.
         """
+        self._check_no_data_source()
         row_key = RowKey(key)
         if row_key in self._row_locations:
             raise DuplicateKey(f"The row key {row_key!r} already exists.")
@@ -1575,9 +1838,8 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         #  If we don't do this, users will be required to call add_column(s)
         #  Before they call add_row.
 
-        row_index = self.row_count
         # Map the key of this row to its current index
-        self._row_locations[row_key] = row_index
+        self._row_locations.append(row_key, height or 0)
         self._data[row_key] = {
             column.key: cell
             for column, cell in zip_longest(self.ordered_columns, cells)
@@ -1651,23 +1913,16 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
         Raises:
             RowDoesNotExist: If the row key does not exist.
+            ReadOnlyRows: If the table reads its rows from a data source.
         """
+        self._check_no_data_source()
         if row_key not in self._row_locations:
             raise RowDoesNotExist(f"Row key {row_key!r} is not valid.")
 
         self._require_update_dimensions = True
         self.check_idle()
 
-        index_to_delete = self._row_locations.get(row_key)
-        new_row_locations = TwoWayDict({})
-        for row_location_key in self._row_locations:
-            row_index = self._row_locations.get(row_location_key)
-            if row_index > index_to_delete:
-                new_row_locations[row_location_key] = row_index - 1
-            elif row_index < index_to_delete:
-                new_row_locations[row_location_key] = row_index
-
-        self._row_locations = new_row_locations
+        self._row_locations.remove(row_key)
 
         # Prevent the removed cells from triggering dimension updates
         for column_key in self._data.get(row_key):
@@ -1710,9 +1965,10 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
         del self.columns[column_key]
 
-        for row_key in self._data:
-            self._updated_cells.discard(CellKey(row_key, column_key))
-            del self._data[row_key][column_key]
+        if self._data_source_data is None:
+            for row_key in self._data:
+                self._updated_cells.discard(CellKey(row_key, column_key))
+                del self._data[row_key][column_key]
 
         self.cursor_coordinate = self.cursor_coordinate
         self.hover_coordinate = self.hover_coordinate
@@ -1734,6 +1990,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             self._updated_cells.clear()
             self._update_column_widths(updated_cells)
 
+        if self._unmeasured_data_source_rows:
+            self._measure_data_source_rows()
+
         if self._require_update_dimensions:
             # Add the new rows *before* updating the column widths, since
             # cells in a new row may influence the final width of a column.
@@ -1743,6 +2002,157 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             self._new_rows.clear()
             self._update_dimensions(new_rows)
 
+    def set_data_source(
+        self,
+        source: DataSource | None,
+        *,
+        page_size: int = 100,
+        cache_size: int = 50,
+    ) -> Self:
+        """Read rows from a data source as they are displayed.
+
+        Any existing rows are removed. Columns should be added before setting the source,
+        and each row from the source should contain a cell for each column, in order.
+
+        While a table has a data source, rows can't be added, removed, updated, or sorted
+        through the table. Call [refresh_data_source][textual.widgets.DataTable.refresh_data_source]
+        after changing the data in the source.
+
+        Args:
+            source: A data source, or `None` to go back to adding rows to the table.
+            page_size: Number of rows to read from the source at a time.
+            cache_size: Maximum number of pages of rows to keep in memory.
+
+        Returns:
+            The `DataTable` instance.
+        """
+        self.clear()
+        if source is not None:
+            row_index = _DataSourceRowIndex(source)
+            data = _DataSourceData(self, source, row_index, page_size, cache_size)
+            self._row_locations = row_index
+            # The rows are read-only: methods which would modify them check for a source
+            self.rows = cast("dict[RowKey, Row]", _DataSourceRows(row_index))
+            self._data = cast("dict[RowKey, dict[ColumnKey, CellType]]", data)
+            self._data_source_data = data
+            self._update_data_source_column_widths()
+        self.check_idle()
+        return self
+
+    def refresh_data_source(
+        self, start: int | None = None, stop: int | None = None
+    ) -> Self:
+        """Notify the table that rows in its data source have changed.
+
+        Cached rows are read from the source again, and the row count is updated.
+
+        Args:
+            start: Index of the first changed row, or `None` for the first row.
+            stop: Index after the last changed row, or `None` for all rows.
+
+        Returns:
+            The `DataTable` instance.
+        """
+        if self._data_source_data is None:
+            return self
+        self._data_source_data.invalidate(start, stop)
+        self._update_data_source_column_widths()
+        self.cursor_coordinate = self.cursor_coordinate
+        self.hover_coordinate = self.hover_coordinate
+        self._update_count += 1
+        self._require_update_dimensions = True
+        self.check_idle()
+        self.refresh()
+        return self
+
+    def _check_no_data_source(self) -> None:
+        """Check the rows may be modified.
+
+        Raises:
+            ReadOnlyRows: If the table reads its rows from a data source.
+        """
+        if self._data_source_data is not None:
+            raise ReadOnlyRows(
+                "Rows can't be modified in a DataTable with a data source."
+            )
+
+    def _update_data_source_column_widths(self) -> None:
+        """Set the column widths from the data source, if it supplies them."""
+        assert self._data_source_data is not None
+        get_column_widths = getattr(
+            self._data_source_data.source, "get_column_widths", None
+        )
+        if get_column_widths is None:
+            return
+        console = self.app.console
+        for column, width in zip(self.ordered_columns, get_column_widths()):
+            if width is not None and column.auto_width:
+                column.content_width = max(width, measure(console, column.label, 1))
+        self._require_update_dimensions = True
+
+    def _queue_data_source_rows(self, rows: DataSourceRows) -> None:
+        """Queue rows read from a data source, to widen columns to fit them on idle.
+
+        Args:
+            rows: Rows read from the data source.
+        """
+        assert self._data_source_data is not None
+        if hasattr(self._data_source_data.source, "get_column_widths"):
+            return
+        self._unmeasured_data_source_rows.append(rows)
+        self.check_idle()
+
+    def _measure_data_source_rows(self) -> None:
+        """Widen columns to fit the rows read from a data source since the last idle."""
+        pages = self._unmeasured_data_source_rows
+        self._unmeasured_data_source_rows = []
+        console = self.app.console
+        auto_width_columns = [
+            (column_index, column)
+            for column_index, column in enumerate(self.ordered_columns)
+            if column.auto_width
+        ]
+        widened = False
+        for row in chain.from_iterable(pages):
+            for column_index, column in auto_width_columns:
+                if column_index < len(row):
+                    width = measure(
+                        console, default_cell_formatter(row[column_index]), 1
+                    )
+                    if width > column.content_width:
+                        column.content_width = width
+                        widened = True
+        if widened:
+            self._update_count += 1
+            self._require_update_dimensions = True
+            self.check_idle()
+            self.refresh()
+
+    def _load_data_source_page(
+        self, generation: int, page_index: int, rows: Awaitable[DataSourceRows]
+    ) -> None:
+        """Load a page of rows from a data source in a worker.
+
+        Args:
+            generation: Generation of the data source data when the rows were requested.
+            page_index: Index of the page.
+            rows: An awaitable which returns the rows.
+        """
+
+        data = self._data_source_data
+
+        async def load_page() -> None:
+            """Await the rows, and display them."""
+            loaded_rows = await rows
+            # Ignore the rows if the data source was replaced or refreshed
+            if data is self._data_source_data and data is not None:
+                if data.set_page(generation, page_index, loaded_rows):
+                    self._queue_data_source_rows(loaded_rows)
+                    self._update_count += 1
+                    self.refresh()
+
+        self.run_worker(load_page(), group="data-source")
+
     def refresh_coordinate(self, coordinate: Coordinate) -> Self:
         """Refresh the cell at a coordinate.
 
@@ -1859,12 +2269,8 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         if cache_key in self._ordered_row_cache:
             ordered_rows = self._ordered_row_cache[cache_key]
         else:
-            row_indices = range(num_rows)
-            ordered_rows = []
-            for row_index in row_indices:
-                row_key = self._row_locations.get_key(row_index)
-                row = self.rows[row_key]
-                ordered_rows.append(row)
+            rows = self.rows
+            ordered_rows = [rows[row_key] for row_key in self._row_locations]
             self._ordered_row_cache[cache_key] = ordered_rows
         return ordered_rows
 
@@ -2198,15 +2604,14 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             Row key and line (y) offset within cell.
         """
         header_height = self.header_height
-        y_offsets = self._y_offsets
         if self.show_header:
             if y < header_height:
                 return self._header_row_key, y
             y -= header_height
-        if y > len(y_offsets):
-            raise LookupError("Y coord {y!r} is greater than total height")
-
-        return y_offsets[y]
+        row_index, y_offset = self._row_locations.get_row_at_line(y)
+        row_key = self._row_locations.get_key(row_index)
+        assert row_key is not None
+        return row_key, y_offset
 
     def _render_line(self, y: int, x1: int, x2: int, base_style: Style) -> Strip:
         """Render a (possibly cropped) line in to a Strip (a list of segments
@@ -2370,7 +2775,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
         that is occupied by fixed rows and columns respectively. Fixed rows and columns
         are rows and columns that do not participate in scrolling."""
         top = self.header_height if self.show_header else 0
-        top += sum(row.height for row in self.ordered_rows[: self.fixed_rows])
+        top += self._row_locations.get_line(self.fixed_rows)
         left = (
             sum(
                 column.get_render_width(self)
@@ -2398,7 +2803,11 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
 
         Returns:
             The `DataTable` instance.
+
+        Raises:
+            ReadOnlyRows: If the table reads its rows from a data source.
         """
+        self._check_no_data_source()
 
         def key_wrapper(row: tuple[RowKey, dict[ColumnKey | str, CellType]]) -> Any:
             _, row_data = row
@@ -2415,8 +2824,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             key=key_wrapper,
             reverse=reverse,
         )
-        self._row_locations = TwoWayDict(
-            {row_key: new_index for new_index, (row_key, _) in enumerate(ordered_rows)}
+        rows = self.rows
+        self._row_locations = RowIndex(
+            (row_key, rows[row_key].height) for row_key, _ in ordered_rows
         )
         self._update_count += 1
         self.refresh()
@@ -2475,7 +2885,7 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             )
             self.post_message(message)
         elif is_row_label_click:
-            row = self.ordered_rows[row_index]
+            row = self.rows[self._row_locations.get_key(row_index)]
             message = DataTable.RowLabelSelected(
                 self, row.key, row_index, label=row.label
             )
@@ -2499,8 +2909,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             offset = 0
             rows_to_scroll = 0
             row_index, _ = self.cursor_coordinate
-            for ordered_row in self.ordered_rows[row_index:]:
-                offset += ordered_row.height
+            get_height = self._row_locations.get_height
+            for index in range(row_index, self.row_count):
+                offset += get_height(index)
                 rows_to_scroll += 1
                 if offset > height:
                     break
@@ -2523,8 +2934,9 @@ class DataTable(ScrollView, Generic[CellType], can_focus=True):
             offset = 0
             rows_to_scroll = 0
             row_index, _ = self.cursor_coordinate
-            for ordered_row in self.ordered_rows[: row_index + 1]:
-                offset += ordered_row.height
+            get_height = self._row_locations.get_height
+            for index in range(min(row_index + 1, self.row_count)):
+                offset += get_height(index)
                 rows_to_scroll += 1
                 if offset > height:
                     break
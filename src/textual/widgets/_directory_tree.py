@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import os
 from asyncio import Queue
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, Iterator
+from threading import Lock
+from time import time_ns
+from typing import TYPE_CHECKING, Callable, ClassVar, Iterable, NamedTuple
 
 from rich.style import Style
 from rich.text import Text, TextType
 
 from .. import work
 from ..await_complete import AwaitComplete
+from ..cache import LRUCache
 from ..message import Message
 from ..reactive import var
 from ..worker import Worker, WorkerCancelled, WorkerFailed, get_current_worker
@@ -19,6 +25,26 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
 
+_LISTING_CACHE_SIZE = 1024
+"""The maximum number of directory listings to cache."""
+_MTIME_RESOLUTION_NS = 2_000_000_000
+"""Listings of directories modified more recently than this aren't cached, as a
+change may not update the modification time on filesystems with coarse times."""
+_PREFETCH_LIMIT = 16
+"""The maximum number of subdirectories to scan after a directory is loaded."""
+_PREFETCH_WORKERS = 4
+"""The number of threads which scan subdirectories."""
+
+
+class _Listing(NamedTuple):
+    """The cached content of a directory."""
+
+    mtime_ns: int
+    """The modification time of the directory when it was scanned."""
+    entries: dict[Path, bool]
+    """Maps the paths in the directory on to `True` for directories."""
+
+
 @dataclass
 class DirEntry:
     """Attaches directory information to a [`DirectoryTree`][textual.widgets.DirectoryTree] node."""
@@ -143,6 +169,8 @@ class DirectoryTree(Tree[DirEntry]):
             disabled: Whether the directory tree is disabled or not.
         """
         self._load_queue: Queue[TreeNode[DirEntry]] = Queue()
+        self._listing_cache: LRUCache[Path, _Listing] = LRUCache(_LISTING_CACHE_SIZE)
+        self._listing_cache_lock = Lock()
         super().__init__(
             str(path),
             data=DirEntry(self.PATH(path)),
@@ -219,25 +247,16 @@ class DirectoryTree(Tree[DirEntry]):
     async def _reload(self, node: TreeNode[DirEntry]) -> None:
         """Reloads the subtree rooted at the given node while preserving state.
 
-        After reloading the subtree, nodes that were expanded and still exist
-        will remain expanded and the highlighted node will be preserved, if it
-        still exists. If it doesn't, highlighting goes up to the first parent
-        directory that still exists.
+        The content of each loaded directory is compared with the nodes in the
+        tree, so nodes are only added or removed for entries which have changed.
+        Nodes that were expanded and still exist will remain expanded and the
+        highlighted node will be preserved, if it still exists. If it doesn't,
+        highlighting goes up to the first parent directory that still exists.
 
         Args:
             node: The root of the subtree to reload.
         """
         async with self.lock:
-            # Track nodes that were expanded before reloading.
-            currently_open: set[Path] = set()
-            to_check: list[TreeNode[DirEntry]] = [node]
-            while to_check:
-                checking = to_check.pop()
-                if checking.allow_expand and checking.is_expanded:
-                    if checking.data:
-                        currently_open.add(checking.data.path)
-                    to_check.extend(checking.children)
-
             # Track node that was highlighted before reloading.
             highlighted_path: None | Path = None
             if self.cursor_line > -1:
@@ -246,27 +265,33 @@ class DirectoryTree(Tree[DirEntry]):
                     highlighted_path = highlighted_node.data.path
 
             if node.data is not None:
-                self.reset_node(
-                    node, str(node.data.path.name), DirEntry(self.PATH(node.data.path))
-                )
+                node.label = str(node.data.path.name)
 
-            # Reopen nodes that were expanded and still exist.
-            to_reopen = [node]
-            while to_reopen:
-                reopening = to_reopen.pop()
-                if not reopening.data:
+            # Update the content of the node, and of directories that are expanded.
+            to_reload = [node]
+            while to_reload:
+                reloading = to_reload.pop()
+                if not reloading.data or not reloading.allow_expand:
                     continue
-                if reopening.allow_expand and (
-                    reopening.data.path in currently_open or reopening == node
-                ):
-                    try:
-                        content = await self._load_directory(reopening).wait()
-                    except (WorkerCancelled, WorkerFailed):
+                try:
+                    content = await self._load_directory(reloading).wait()
+                except (WorkerCancelled, WorkerFailed):
+                    reloading.data.loaded = False
+                    self.clear_node(reloading)
+                    continue
+                reloading.data.loaded = True
+                self._update_node(reloading, content)
+                for child in reloading.children:
+                    if child.data is None or not child.data.loaded:
                         continue
-                    reopening.data.loaded = True
-                    self._populate_node(reopening, content)
-                    to_reopen.extend(reopening.children)
-                    reopening.expand()
+                    if child.is_expanded:
+                        to_reload.append(child)
+                    else:
+                        # Collapsed directories are loaded again when expanded.
+                        child.data.loaded = False
+                        self.clear_node(child)
+                reloading.expand()
+            self._prefetch_children(node)
 
             if highlighted_path is None:
                 return
@@ -436,58 +461,174 @@ class DirectoryTree(Tree[DirEntry]):
             # tree.
             return False
 
-    def _populate_node(self, node: TreeNode[DirEntry], content: Iterable[Path]) -> None:
+    def _populate_node(
+        self, node: TreeNode[DirEntry], content: Iterable[tuple[Path, bool]]
+    ) -> None:
         """Populate the given tree node with the given directory content.
 
         Args:
             node: The Tree node to populate.
-            content: The collection of `Path` objects to populate the node with.
+            content: The paths to populate the node with, and whether each is
+                a directory.
         """
         node.remove_children()
-        for path in content:
-            node.add(
-                path.name,
-                data=DirEntry(path),
-                allow_expand=self._safe_is_dir(path),
-            )
+        for path, is_dir in content:
+            node.add(path.name, data=DirEntry(path), allow_expand=is_dir)
         node.expand()
+        self._prefetch_children(node)
+
+    def _update_node(
+        self, node: TreeNode[DirEntry], content: list[tuple[Path, bool]]
+    ) -> None:
+        """Update the children of a tree node to match new directory content.
 
-    def _directory_content(self, location: Path, worker: Worker) -> Iterator[Path]:
-        """Load the content of a given directory.
+        Children for paths which are still in the directory are kept, along
+        with their state and descendants.
 
         Args:
-            location: The location to load from.
-            worker: The worker that the loading is taking place in.
+            node: The Tree node to update.
+            content: The paths in the directory, in order, and whether each is
+                a directory.
+        """
+        is_dir = dict(content)
+        for child in list(node.children):
+            if child.data is None or is_dir.get(child.data.path) != child.allow_expand:
+                child.remove()
+        existing = [child.data.path for child in node.children if child.data]
+        kept = set(existing)
+        if existing != [path for path, _ in content if path in kept]:
+            # The order has changed, so start again.
+            node.remove_children()
+            kept.clear()
+        for index, (path, path_is_dir) in enumerate(content):
+            if path not in kept:
+                node.add(
+                    path.name,
+                    data=DirEntry(path),
+                    before=index,
+                    allow_expand=path_is_dir,
+                )
+
+    def _scan_directory(self, location: Path, worker: Worker) -> dict[Path, bool]:
+        """Get the content of a directory, from the cache if it hasn't changed.
 
-        Yields:
-            Path: An entry within the location.
+        Args:
+            location: The location to scan.
+            worker: The worker that the scan is taking place in.
+
+        Returns:
+            A dict which maps the paths in the directory on to `True` for
+                directories, or `False` for anything else.
         """
+        entries: dict[Path, bool] = {}
+        if self.PATH is not Path:
+            # The paths may not be on a local filesystem, so can't be scanned
+            # with `os.scandir`.
+            try:
+                for path in location.iterdir():
+                    if worker.is_cancelled:
+                        break
+                    entries[path] = self._safe_is_dir(path)
+            except PermissionError:
+                pass
+            return entries
+
         try:
-            for entry in location.iterdir():
-                if worker.is_cancelled:
-                    break
-                yield entry
+            mtime_ns: int | None = location.stat().st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        with self._listing_cache_lock:
+            listing = self._listing_cache.get(location)
+        if listing is not None and listing.mtime_ns == mtime_ns:
+            return listing.entries
+
+        try:
+            with os.scandir(location) as scan:
+                for dir_entry in scan:
+                    if worker.is_cancelled:
+                        return entries
+                    try:
+                        # Uses the type from the directory listing where possible,
+                        # which avoids a `stat` for each entry.
+                        is_dir = dir_entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    entries[location / dir_entry.name] = is_dir
         except PermissionError:
-            pass
+            return entries
+
+        if mtime_ns is not None and time_ns() - mtime_ns > _MTIME_RESOLUTION_NS:
+            with self._listing_cache_lock:
+                self._listing_cache.set(location, _Listing(mtime_ns, entries))
+        return entries
 
     @work(thread=True, exit_on_error=False)
-    def _load_directory(self, node: TreeNode[DirEntry]) -> list[Path]:
+    def _load_directory(self, node: TreeNode[DirEntry]) -> list[tuple[Path, bool]]:
         """Load the directory contents for a given node.
 
         Args:
             node: The node to load the directory contents for.
 
         Returns:
-            The list of entries within the directory associated with the node.
+            The entries within the directory associated with the node, and
+                whether each is a directory.
         """
         assert node.data is not None
+        entries = self._scan_directory(node.data.path, get_current_worker())
         return sorted(
-            self.filter_paths(
-                self._directory_content(node.data.path, get_current_worker())
+            (
+                (path, entries[path] if path in entries else self._safe_is_dir(path))
+                for path in self.filter_paths(list(entries))
             ),
-            key=lambda path: (not self._safe_is_dir(path), path.name.lower()),
+            key=lambda entry: (not entry[1], entry[0].name.lower()),
         )
 
+    def _prefetch_children(self, node: TreeNode[DirEntry]) -> None:
+        """Scan the first few subdirectories of a node in the background.
+
+        The listings are cached, so the subdirectories load quickly if they are
+        expanded.
+
+        Args:
+            node: A node whose content has been loaded.
+        """
+        if self.PATH is not Path:
+            return
+        locations = list(
+            islice(
+                (
+                    child.data.path
+                    for child in node.children
+                    if child.allow_expand
+                    and child.data is not None
+                    and not child.data.loaded
+                ),
+                _PREFETCH_LIMIT,
+            )
+        )
+        if locations:
+            self._prefetch_directories(locations)
+
+    @work(thread=True, group="prefetch", exclusive=True, exit_on_error=False)
+    def _prefetch_directories(self, locations: list[Path]) -> None:
+        """Scan directories on a pool of threads, to cache their listings.
+
+        Args:
+            locations: The directories to scan.
+        """
+        worker = get_current_worker()
+
+        def prefetch(location: Path) -> None:
+            if not worker.is_cancelled:
+                try:
+                    self._scan_directory(location, worker)
+                except OSError:
+                    pass
+
+        with ThreadPoolExecutor(max_workers=_PREFETCH_WORKERS) as executor:
+            for _ in executor.map(prefetch, locations):
+                pass
+
     @work(exclusive=True)
     async def _loader(self) -> None:
         """Background loading queue processor."""
@@ -496,7 +637,7 @@ class DirectoryTree(Tree[DirEntry]):
             # Get the next node that needs loading off the queue. Note that
             # this blocks if the queue is empty.
             node = await self._load_queue.get()
-            content: list[Path] = []
+            content: list[tuple[Path, bool]] = []
             async with self.lock:
                 try:
                     # Spin up a short-lived thread that will load the content of
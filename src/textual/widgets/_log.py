@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import re
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+from time import monotonic
+from typing import TYPE_CHECKING, AsyncIterable, Iterable, Optional, Sequence, Union
 
 from rich.cells import cell_len
 from rich.highlighter import ReprHighlighter
@@ -11,6 +13,7 @@ from rich.text import Text
 
 from .. import work
 from .._line_split import line_split
+from .._ring_buffer import RingBuffer
 from ..cache import LRUCache
 from ..geometry import Size
 from ..reactive import var
@@ -22,6 +25,9 @@ if TYPE_CHECKING:
 
 _sub_escape = re.compile("[\u0000-\u0014]").sub
 
+LineSource = Union[Iterable[Union[str, bytes]], AsyncIterable[Union[str, bytes]]]
+"""A source of lines for [`Log.write_stream`][textual.widgets.Log.write_stream]."""
+
 
 class Log(ScrollView, can_focus=True):
     """A widget to log text."""
@@ -64,12 +70,17 @@ class Log(ScrollView, can_focus=True):
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
         self.highlight = highlight
         """Enable highlighting."""
+        self._lines: RingBuffer[str] = RingBuffer(maxlen=max_lines)
         self.max_lines = max_lines
         self.auto_scroll = auto_scroll
-        self._lines: list[str] = []
         self._width = 0
         self._updates = 0
+        self._unmeasured_lines: list[str] = []
+        """Lines waiting to have their width measured."""
+        self._measuring = False
+        """Is a worker currently measuring lines?"""
         self._render_line_cache: LRUCache[int, Strip] = LRUCache(1024)
+        """Rendered lines, keyed on the line number *including* lines discarded by `max_lines`."""
         self.highlighter = ReprHighlighter()
         """The Rich Highlighter object to use, if `highlight=True`"""
 
@@ -97,6 +108,7 @@ class Log(ScrollView, can_focus=True):
         if updates == self._updates:
             self._width = max(size, self._width)
             self.virtual_size = Size(self._width, self.line_count)
+        self._measure_unmeasured_lines()
 
     @property
     def line_count(self) -> int:
@@ -117,6 +129,28 @@ class Log(ScrollView, can_focus=True):
         """
         return _sub_escape("�", line.expandtabs())
 
+    def _measure_lines(self, lines: list[str]) -> None:
+        """Queue lines to have their width measured in a background thread.
+
+        Only one worker runs at a time. Lines written while it runs are measured
+        together, in a single batch, when it finishes.
+
+        Args:
+            lines: Lines that were added.
+        """
+        if lines:
+            self._unmeasured_lines.extend(lines)
+            if not self._measuring:
+                self._measure_unmeasured_lines()
+
+    def _measure_unmeasured_lines(self) -> None:
+        """Start a worker to measure any lines in the queue."""
+        lines = self._unmeasured_lines
+        self._unmeasured_lines = []
+        self._measuring = bool(lines)
+        if lines:
+            self._update_size(self._updates, lines)
+
     @work(thread=True)
     def _update_size(self, updates: int, lines: list[str]) -> None:
         """A thread worker to update the width in the background.
@@ -130,24 +164,13 @@ class Log(ScrollView, can_focus=True):
             max_length = max(cell_len(_process_line(line)) for line in lines)
             self.app.call_from_thread(self._update_maximum_width, updates, max_length)
 
-    def _prune_max_lines(self) -> None:
-        """Prune lines if there are more than the maximum."""
-        if self.max_lines is None:
-            return
-        remove_lines = len(self._lines) - self.max_lines
-        if remove_lines > 0:
-            _cache = self._render_line_cache
-            # We've removed some lines, which means the y values in the cache are out of sync
-            # Calculated a new dict of cache values
-            updated_cache = {
-                y - remove_lines: _cache[y] for y in _cache.keys() if y > remove_lines
-            }
-            # Clear the cache
-            _cache.clear()
-            # Update the cache with previously calculated values
-            for y, line in updated_cache.items():
-                _cache[y] = line
-            del self._lines[:remove_lines]
+    def _watch_max_lines(self, max_lines: int | None) -> None:
+        """Discard lines if the maximum is reduced."""
+        offset = self._lines.offset
+        self._lines.maxlen = max_lines
+        if self._lines.offset != offset:
+            self.virtual_size = Size(self._width, self.line_count)
+            self.refresh()
 
     def write(
         self,
@@ -164,7 +187,9 @@ class Log(ScrollView, can_focus=True):
             The `Log` instance.
         """
 
-        if data:
+        offset = self._lines.offset
+        # With a `max_lines` of 0 there is nowhere to write the data
+        if data and self.max_lines != 0:
             if not self._lines:
                 self._lines.append("")
             for line, ending in line_split(data):
@@ -177,8 +202,9 @@ class Log(ScrollView, can_focus=True):
                     self._lines.append("")
             self.virtual_size = Size(self._width, self.line_count)
 
-        if self.max_lines is not None and len(self._lines) > self.max_lines:
-            self._prune_max_lines()
+        if self._lines.offset != offset:
+            # Lines were discarded from the start, so everything moved up
+            self.refresh()
 
         auto_scroll = self.auto_scroll if scroll_end is None else scroll_end
         if auto_scroll and not self.is_vertical_scrollbar_grabbed:
@@ -215,19 +241,125 @@ class Log(ScrollView, can_focus=True):
         new_lines = []
         for line in lines:
             new_lines.extend(line.splitlines())
+        offset = self._lines.offset
         start_line = len(self._lines)
         self._lines.extend(new_lines)
-        if self.max_lines is not None and len(self._lines) > self.max_lines:
-            self._prune_max_lines()
         self.virtual_size = Size(self._width, len(self._lines))
-        self._update_size(self._updates, new_lines)
-        self.refresh_lines(start_line, len(new_lines))
+        self._measure_lines(new_lines)
+        if self._lines.offset != offset:
+            self.refresh()
+        else:
+            self.refresh_lines(start_line, len(new_lines))
         if auto_scroll and not self.is_vertical_scrollbar_grabbed:
             self.scroll_end(animate=False)
         else:
             self.refresh()
         return self
 
+    async def write_stream(
+        self,
+        lines: LineSource,
+        scroll_end: bool | None = None,
+        batch_interval: float = 1 / 60,
+    ) -> int:
+        """Write lines from an iterable or async iterable, such as a subprocess pipe.
+
+        Lines are collected in to batches, which are written together at most once
+        every `batch_interval` seconds. After each batch this method waits for the
+        screen to refresh before reading more lines, so a fast producer is slowed to
+        the rate at which the log can be displayed, rather than queuing work.
+
+        Bytes are decoded as UTF-8, so an `asyncio.StreamReader` (e.g. the `stdout`
+        of a process created with `asyncio.create_subprocess_exec`) may be used directly.
+        Note that a (non-async) iterable is read on the event loop, and shouldn't block.
+
+        Args:
+            lines: An iterable or async iterable of strings or bytes.
+            scroll_end: Scroll to the end after writing, or `None` to use `self.auto_scroll`.
+            batch_interval: Maximum time (in seconds) to collect lines before writing them.
+
+        Returns:
+            Number of lines read from `lines`.
+        """
+        line_count = 0
+        batch: list[str] = []
+        batch_deadline = 0.0
+
+        def add_line(line: str | bytes) -> None:
+            """Add a line to the current batch."""
+            nonlocal line_count, batch_deadline
+            if not batch:
+                batch_deadline = monotonic() + batch_interval
+            batch.append(
+                line.decode("utf-8", errors="replace")
+                if isinstance(line, bytes)
+                else line
+            )
+            line_count += 1
+
+        async def write_batch() -> bool:
+            """Write the current batch, and wait for it to be displayed.
+
+            Returns:
+                `True` if more lines may be written, or `False` if the log was removed.
+            """
+            self.write_lines(batch, scroll_end)
+            batch.clear()
+            return await self._wait_for_refresh()
+
+        if isinstance(lines, AsyncIterable):
+            iter_lines = lines.__aiter__()
+            next_line: asyncio.Future[str | bytes] | None = None
+            try:
+                while True:
+                    if next_line is None:
+                        next_line = asyncio.ensure_future(iter_lines.__anext__())
+                    timeout = max(0, batch_deadline - monotonic()) if batch else None
+                    await asyncio.wait([next_line], timeout=timeout)
+                    if next_line.done():
+                        try:
+                            line = next_line.result()
+                        except StopAsyncIteration:
+                            next_line = None
+                            break
+                        next_line = None
+                        add_line(line)
+                        if monotonic() < batch_deadline:
+                            continue
+                    # The batch interval has elapsed
+                    if not await write_batch():
+                        return line_count
+            finally:
+                if next_line is not None:
+                    next_line.cancel()
+        else:
+            for line in lines:
+                add_line(line)
+                if monotonic() >= batch_deadline and not await write_batch():
+                    return line_count
+
+        if batch:
+            self.write_lines(batch, scroll_end)
+        return line_count
+
+    async def _wait_for_refresh(self) -> bool:
+        """Wait for the screen to refresh.
+
+        Returns:
+            `True` if the screen refreshed, or `False` if the log was removed first.
+        """
+        refreshed = asyncio.Event()
+        if not self.call_after_refresh(refreshed.set):
+            return False
+        while not refreshed.is_set():
+            if not self.is_attached:
+                return False
+            try:
+                await asyncio.wait_for(refreshed.wait(), timeout=0.1)
+            except asyncio.TimeoutError:
+                pass
+        return True
+
     def clear(self) -> Self:
         """Clear the Log.
 
@@ -235,6 +367,7 @@ class Log(ScrollView, can_focus=True):
             The `Log` instance.
         """
         self._lines.clear()
+        self._unmeasured_lines.clear()
         self._width = 0
         self._render_line_cache.clear()
         self._updates += 1
@@ -284,8 +417,9 @@ class Log(ScrollView, can_focus=True):
         Returns:
             An uncropped Strip.
         """
-        if y in self._render_line_cache:
-            return self._render_line_cache[y]
+        cache_key = y + self._lines.offset
+        if cache_key in self._render_line_cache:
+            return self._render_line_cache[cache_key]
 
         _line = self._process_line(self._lines[y])
 
@@ -295,7 +429,7 @@ class Log(ScrollView, can_focus=True):
         else:
             line = Strip([Segment(_line, rich_style)], cell_len(_line))
 
-        self._render_line_cache[y] = line
+        self._render_line_cache[cache_key] = line
         return line
 
     def refresh_lines(self, y_start: int, line_count: int = 1) -> None:
@@ -305,6 +439,7 @@ class Log(ScrollView, can_focus=True):
             y_start: First line to refresh.
             line_count: Total number of lines to refresh.
         """
+        offset = self._lines.offset
         for y in range(y_start, y_start + line_count):
-            self._render_line_cache.discard(y)
+            self._render_line_cache.discard(y + offset)
         super().refresh_lines(y_start, line_count=line_count)
@@ -8,8 +8,11 @@ from rich.measure import Measurement
 from rich.padding import Padding
 from rich.rule import Rule
 from rich.style import NULL_STYLE, Style
+from rich.text import Text
 
 from .. import _widget_navigation, events
+from .._cells import cell_len
+from .._fenwick_tree import FenwickTree
 from .._widget_navigation import Direction
 from ..binding import Binding, BindingType
 from ..cache import LRUCache
@@ -291,13 +294,29 @@ class OptionList(ScrollView, can_focus=True):
             for index, option in enumerate(self._options)
             if option.id is not None
         }
-        """A dictionary of option IDs and the option indexes they relate to."""
+        """A dictionary of option IDs and the option indexes they relate to.
+
+        Removing an option doesn't update the indexes of the options after it,
+        so an index may be greater than the index of the option it relates to.
+        """
 
         self._content_render_cache: LRUCache[tuple[int, Style, int], list[Strip]]
         self._content_render_cache = LRUCache(256)
 
-        self._lines: list[tuple[int, int]] | None = None
-        self._spans: list[OptionLineSpan] | None = None
+        self._option_flags = FenwickTree(
+            int(isinstance(content, Option)) for content in self._contents
+        )
+        """1 for each item of content which is an option, or 0 for a separator."""
+
+        self._heights = FenwickTree(1 for _ in self._contents)
+        """The number of lines in each item of content."""
+
+        self._measured: list[bool] = [False] * len(self._contents)
+        """Flags which are `True` where the height of the content is known, and
+        `False` where it is an estimate."""
+
+        self._lines_width: int | None = None
+        """The width that the heights are for, or `None` if not yet calculated."""
 
         self._mouse_hovering_over: int | None = None
         """Used to track what the mouse is hovering over."""
@@ -319,66 +338,166 @@ class OptionList(ScrollView, can_focus=True):
     def _on_mount(self):
         self._populate()
 
-    def _refresh_lines(self) -> None:
-        self._lines = None
-        self._spans = None
-        self._content_render_cache.clear()
-        self.check_idle()
-
     def notify_style_update(self) -> None:
         self._content_render_cache.clear()
 
     def _on_resize(self):
-        self._refresh_lines()
+        self._populate()
 
     def on_idle(self):
-        if self._lines is None:
-            self._populate()
+        self._populate()
 
-    def _add_lines(
-        self, new_content: list[OptionListContent], width: int, option_index=0
-    ) -> None:
-        """Add new lines.
+    @property
+    def _option_width(self) -> int:
+        """The width available to render options."""
+        return self.scrollable_content_region.width - self._left_gutter_width()
+
+    def _estimate_heights(
+        self, contents: Iterable[OptionListContent], width: int
+    ) -> tuple[list[int], list[bool]]:
+        """Estimate the heights of content, without rendering options.
+
+        An option whose prompt is a single line of text which fits in the width
+        is known to be a single line. An option whose prompt is text is estimated
+        from the cell length of each line, until it is measured. Other options
+        are estimated to be a single line, and should be measured with
+        `_measure_renderables`.
 
         Args:
-            new_content: New content to add.
-            width: Width to render content.
-            option_index: Starting option index.
-        """
-        assert self._lines is not None
-        assert self._spans is not None
-        style = NULL_STYLE
+            contents: The content to estimate.
+            width: The width to render options.
 
-        for index, content in enumerate(new_content, len(self._lines)):
+        Returns:
+            The heights of the content, and flags which are `True` where the
+                height is known.
+        """
+        padding = self.get_component_styles("option-list--option").padding
+        vertical_padding = padding.top + padding.bottom
+        text_width = max(1, width - padding.left - padding.right)
+        wrap = self._wrap
+        heights: list[int] = []
+        measured: list[bool] = []
+        for content in contents:
             if isinstance(content, Option):
-                height = len(
-                    self._render_option_content(
-                        index, content, style, width - self._left_gutter_width()
+                prompt = content.prompt
+                text = prompt.plain if isinstance(prompt, Text) else prompt
+                if not isinstance(text, str):
+                    heights.append(1 + vertical_padding)
+                    measured.append(False)
+                elif not wrap:
+                    heights.append(text.count("\n") + 1 + vertical_padding)
+                    measured.append("\n" not in text)
+                elif "\n" in text or "\t" in text:
+                    heights.append(
+                        sum(
+                            max(1, -(-cell_len(line) // text_width))
+                            for line in text.expandtabs().split("\n")
+                        )
+                        + vertical_padding
                     )
-                )
-
-                self._lines.extend(
-                    (option_index, y_offset) for y_offset in range(height)
-                )
-                self._spans.append(OptionLineSpan(option_index, height))
-                option_index += 1
+                    measured.append(False)
+                else:
+                    line_count = max(1, -(-cell_len(text) // text_width))
+                    heights.append(line_count + vertical_padding)
+                    measured.append(line_count == 1)
             else:
-                self._lines.append(OptionLineSpan(-1, 0))
+                heights.append(1)
+                measured.append(True)
+        return heights, measured
 
-        self.virtual_size = Size(width, len(self._lines))
+    def _measure_content(self, index: int) -> None:
+        """Measure the height of an item of content, if it is an estimate.
 
-    def _populate(self) -> None:
-        """Populate the lines data-structure."""
-        if self._lines is not None:
+        Args:
+            index: The index of the content.
+        """
+        if self._measured[index]:
             return
-        self._lines = []
-        self._spans = []
-
-        self._add_lines(
-            self._contents,
-            self.scrollable_content_region.width - self._left_gutter_width(),
+        self._measured[index] = True
+        content = self._contents[index]
+        option_index = self._option_flags.prefix_sum(index)
+        self._heights[index] = len(
+            self._render_option_content(
+                option_index, content, NULL_STYLE, self._option_width
+            )
         )
-        self.refresh()
+
+    def _measure_renderables(self, start: int = 0, stop: int | None = None) -> None:
+        """Measure options whose prompts are renderables other than text.
+
+        The height of such a prompt can't be estimated without rendering it.
+
+        Args:
+            start: The index of the first content to measure.
+            stop: The index after the last content to measure, or `None` for the end.
+        """
+        contents = self._contents
+        measured = self._measured
+        for index in range(start, len(contents) if stop is None else stop):
+            content = contents[index]
+            if (
+                not measured[index]
+                and isinstance(content, Option)
+                and not isinstance(content.prompt, (str, Text))
+            ):
+                self._measure_content(index)
+
+    def _measure_visible_content(self) -> None:
+        """Measure the content which is in view."""
+        heights = self._heights
+        scroll_y = self.scroll_offset.y
+        bottom = scroll_y + self.scrollable_content_region.height
+        index = heights.find(scroll_y)
+        line = heights.prefix_sum(index)
+        content_count = len(self._contents)
+        while index < content_count and line < bottom:
+            self._measure_content(index)
+            line += heights[index]
+            index += 1
+        self._update_virtual_size()
+
+    def _measure_around(self, index: int) -> None:
+        """Measure the content within a screen of an item of content.
+
+        Args:
+            index: The index of the content.
+        """
+        heights = self._heights
+        height = self.scrollable_content_region.height
+        line = 0
+        before = index
+        while before >= 0 and line < height:
+            self._measure_content(before)
+            line += heights[before]
+            before -= 1
+        line = 0
+        after = index + 1
+        content_count = len(self._contents)
+        while after < content_count and line < height:
+            self._measure_content(after)
+            line += heights[after]
+            after += 1
+        self._update_virtual_size()
+
+    def _update_virtual_size(self) -> None:
+        """Update the virtual size to fit the lines of content."""
+        self.virtual_size = Size(self._option_width, self._heights.total)
+
+    def _populate(self) -> None:
+        """Populate the heights of the content if the width has changed, and
+        measure the content which is in view."""
+        width = self._option_width
+        if self._lines_width != width:
+            self._lines_width = width
+            heights, self._measured = self._estimate_heights(self._contents, width)
+            self._heights = FenwickTree(heights)
+            self._measure_renderables()
+            self.refresh()
+        self._measure_visible_content()
+
+    def _watch_scroll_y(self) -> None:
+        if self._lines_width is not None:
+            self._measure_visible_content()
 
     def get_content_width(self, container: Size, viewport: Size) -> int:
         """Get maximum width of options."""
@@ -502,13 +621,8 @@ class OptionList(ScrollView, can_focus=True):
         """
         # Only work if we have items to add; but don't make a fuss out of
         # zero items to add, just carry on like nothing happened.
-        if self._lines is None:
-            self._lines = []
-        if self._spans is None:
-            self._spans = []
         new_items = list(items)
         if new_items:
-            option_index = len(self._options)
             # Turn any incoming values into valid content for the list.
             content = [self._make_content(item) for item in new_items]
             self._duplicate_id_check(content)
@@ -524,11 +638,23 @@ class OptionList(ScrollView, can_focus=True):
                     self._option_ids[new_option.id] = new_option_index
             self._options.extend(new_options)
 
-            self._add_lines(
-                content,
-                self.scrollable_content_region.width - self._left_gutter_width(),
-                option_index=option_index,
+            content_count = len(self._heights)
+            self._option_flags.replace(
+                content_count,
+                content_count,
+                [int(isinstance(item, Option)) for item in content],
             )
+            if self._lines_width is None:
+                # The heights will be estimated when the list is populated.
+                heights = [1] * len(content)
+                measured = [False] * len(content)
+            else:
+                heights, measured = self._estimate_heights(content, self._lines_width)
+            self._heights.replace(content_count, content_count, heights)
+            self._measured.extend(measured)
+            if self._lines_width is not None:
+                self._measure_renderables(content_count)
+            self._update_virtual_size()
             self.refresh()
         return self
 
@@ -556,15 +682,21 @@ class OptionList(ScrollView, can_focus=True):
             IndexError: If there is no option of the given index.
         """
         option = self._options[index]
+        if index < 0:
+            index += len(self._options)
+        content_index = self._option_flags.find(index)
         del self._options[index]
-        del self._contents[self._contents.index(option)]
-        # Decrement index of options after the one we just removed.
-        self._option_ids = {
-            option_id: option_index - 1 if option_index > index else option_index
-            for option_id, option_index in self._option_ids.items()
-            if option_index != index
-        }
-        self._refresh_lines()
+        del self._contents[content_index]
+        del self._measured[content_index]
+        self._option_flags.replace(content_index, content_index + 1, ())
+        self._heights.replace(content_index, content_index + 1, ())
+        # The indexes of later options are corrected when they are looked up.
+        if option.id is not None:
+            del self._option_ids[option.id]
+        # Rendered content is cached by option index, which has changed.
+        self._content_render_cache.clear()
+        self._update_virtual_size()
+        self.refresh()
         # Force a re-validation of the highlight.
         self.highlighted = self.highlighted
         self._mouse_hovering_over = None
@@ -615,7 +747,19 @@ class OptionList(ScrollView, can_focus=True):
             OptionDoesNotExist: If there is no option with the given index.
         """
         self.get_option_at_index(index).set_prompt(prompt)
-        self._refresh_lines()
+        if index < 0:
+            index += len(self._options)
+        content_index = self._option_flags.find(index)
+        self._content_render_cache.clear()
+        if self._lines_width is not None:
+            heights, measured = self._estimate_heights(
+                [self._contents[content_index]], self._lines_width
+            )
+            self._heights[content_index] = heights[0]
+            self._measured[content_index] = measured[0]
+            self._measure_renderables(content_index, content_index + 1)
+        self._update_virtual_size()
+        self.refresh()
 
     def replace_option_prompt(self, option_id: str, prompt: RenderableType) -> Self:
         """Replace the prompt of the option with the given ID.
@@ -660,9 +804,14 @@ class OptionList(ScrollView, can_focus=True):
         self._contents.clear()
         self._options.clear()
         self._option_ids.clear()
+        self._option_flags = FenwickTree()
+        self._heights = FenwickTree()
+        self._measured.clear()
+        self._content_render_cache.clear()
         self.highlighted = None
         self._mouse_hovering_over = None
-        self._refresh_lines()
+        self._update_virtual_size()
+        self.refresh()
         return self
 
     def _set_option_disabled(self, index: int, disabled: bool) -> Self:
@@ -795,23 +944,33 @@ class OptionList(ScrollView, can_focus=True):
             OptionDoesNotExist: If no option has the given ID.
         """
         try:
-            return self._option_ids[option_id]
+            index = self._option_ids[option_id]
         except KeyError:
             raise OptionDoesNotExist(
                 f"There is no option with an ID of '{option_id}'"
             ) from None
+        options = self._options
+        if index >= len(options) or options[index].id != option_id:
+            # Options before this one have been removed, so it has moved up.
+            index = min(index, len(options) - 1)
+            while options[index].id != option_id:
+                index -= 1
+            self._option_ids[option_id] = index
+        return index
 
     def render_line(self, y: int) -> Strip:
-        self._populate()
-        assert self._lines is not None
-
         _scroll_x, scroll_y = self.scroll_offset
         line_number = scroll_y + y
-
-        try:
-            option_index, y_offset = self._lines[line_number]
-        except IndexError:
+        heights = self._heights
+        if not 0 <= line_number < heights.total:
             return Strip([])
+        content_index = heights.find(line_number)
+        y_offset = line_number - heights.prefix_sum(content_index)
+        option_index = (
+            self._option_flags.prefix_sum(content_index)
+            if isinstance(self._contents[content_index], Option)
+            else -1
+        )
 
         renderable = (
             Rule(style=self.get_component_rich_style("option-list--separator"))
@@ -863,16 +1022,13 @@ class OptionList(ScrollView, can_focus=True):
             top: Scroll highlight to top of the list.
         """
         highlighted = self.highlighted
-        if highlighted is None or self._spans is None:
+        if highlighted is None or self._lines_width is None:
             return
 
-        try:
-            y, height = self._spans[highlighted]
-        except IndexError:
-            # Index error means we're being asked to scroll to a highlight
-            # before all the tracking information has been worked out.
-            # That's fine; let's just NoP that.
-            return
+        # Measure the content which may be in view along with the highlighted
+        # option, so that the option doesn't move when it is displayed.
+        self._measure_around(self._option_flags.find(highlighted))
+        y, height = self._get_option_span(highlighted)
         self.scroll_to_region(
             Region(0, y, self.scrollable_content_region.width, height),
             force=True,
@@ -880,6 +1036,22 @@ class OptionList(ScrollView, can_focus=True):
             top=top,
         )
 
+    def _get_option_span(self, index: int) -> OptionLineSpan:
+        """Get the lines of an option, measuring it if necessary.
+
+        Args:
+            index: The index of the option.
+
+        Returns:
+            The line the option starts on, and its number of lines.
+        """
+        content_index = self._option_flags.find(index)
+        if not self._measured[content_index]:
+            self._measure_content(content_index)
+            self._update_virtual_size()
+        heights = self._heights
+        return OptionLineSpan(heights.prefix_sum(content_index), heights[content_index])
+
     def validate_highlighted(self, highlighted: int | None) -> int | None:
         """Validate the `highlighted` property value on access."""
         if highlighted is None or not self._options:
@@ -938,8 +1110,6 @@ class OptionList(ScrollView, can_focus=True):
         # going, we need a fallback location. Where we go will depend on the
         # direction.
         self._populate()
-        assert self._spans is not None
-        assert self._lines is not None
 
         fallback = self.action_first if direction == -1 else self.action_last
 
@@ -953,35 +1123,41 @@ class OptionList(ScrollView, can_focus=True):
             # let's start with the target line alone.
             target_line = max(
                 0,
-                self._spans[highlighted].first
+                self._get_option_span(highlighted).first
                 + (direction * self.scrollable_content_region.height),
             )
-            try:
-                # Now that we've got a target line, let's figure out the
-                # index of the target option.
-                target_option: int | None = self._lines[target_line][0]
-            except IndexError:
-                # An index error suggests we've gone out of bounds, let's
-                # settle on whatever the call thinks is a good place to wrap
-                # to.
+            # Now that we've got a target line, let's figure out the index
+            # of the target option.
+            target_option: int | None = None
+            if target_line < self._heights.total:
+                content_index = self._heights.find(target_line)
+                target_option = self._option_flags.prefix_sum(content_index)
+                if not isinstance(self._contents[content_index], Option):
+                    # A separator; head for the option on the far side of it.
+                    if direction == -1:
+                        target_option -= 1
+                    if not 0 <= target_option < len(self._options):
+                        target_option = None
+            if target_option is None:
+                # We've gone out of bounds, let's settle on whatever the
+                # call thinks is a good place to wrap to.
                 fallback()
             else:
                 # Looks like we've figured where we'd like to jump to, we
                 # just need to make sure we jump to an option that's enabled.
-                if target_option is not None:
-                    target_option = _widget_navigation.find_next_enabled_no_wrap(
-                        candidates=self._options,
-                        anchor=target_option,
-                        direction=direction,
-                        with_anchor=True,
-                    )
-                    # If we couldn't find an enabled option that's at least one page
-                    # away from the current one, we instead move less than one page
-                    # to the last enabled option in the correct direction.
-                    if target_option is None:
-                        fallback()
-                    else:
-                        self.highlighted = target_option
+                target_option = _widget_navigation.find_next_enabled_no_wrap(
+                    candidates=self._options,
+                    anchor=target_option,
+                    direction=direction,
+                    with_anchor=True,
+                )
+                # If we couldn't find an enabled option that's at least one page
+                # away from the current one, we instead move less than one page
+                # to the last enabled option in the correct direction.
+                if target_option is None:
+                    fallback()
+                else:
+                    self.highlighted = target_option
 
     def action_page_up(self) -> None:
         """Move the highlight up roughly by one page."""
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, cast
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence, cast
 
 from rich.console import RenderableType
 from rich.highlighter import Highlighter, ReprHighlighter
@@ -12,6 +12,7 @@ from rich.protocol import is_renderable
 from rich.segment import Segment
 from rich.text import Text
 
+from .._ring_buffer import RingBuffer
 from ..cache import LRUCache
 from ..geometry import Region, Size
 from ..reactive import var
@@ -69,10 +70,10 @@ class RichLog(ScrollView, can_focus=True):
             disabled: Whether the text log is disabled or not.
         """
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
+        self._lines: RingBuffer[Strip] = RingBuffer(maxlen=max_lines)
+        """Rendered lines, oldest lines are discarded when there are more than `max_lines`."""
         self.max_lines = max_lines
         """Maximum number of lines in the log or `None` for no maximum."""
-        self._start_line: int = 0
-        self.lines: list[Strip] = []
         self._line_cache: LRUCache[tuple[int, int, int, int], Strip]
         self._line_cache = LRUCache(1024)
         self.max_width: int = 0
@@ -92,9 +93,33 @@ class RichLog(ScrollView, can_focus=True):
         self._last_container_width: int = min_width
         """Record the last width we rendered content at."""
 
+    @property
+    def lines(self) -> Sequence[Strip]:
+        """The rendered lines in the log.
+
+        The lines are stored in a ring buffer, so indexing is O(1) and nothing is
+        copied. Assign a new sequence of lines to replace them.
+        """
+        return self._lines
+
+    @lines.setter
+    def lines(self, lines: Iterable[Strip]) -> None:
+        self._lines = RingBuffer(lines, maxlen=self.max_lines)
+        self._line_cache.clear()
+        self.virtual_size = Size(self.max_width, len(self._lines))
+        self.refresh()
+
     def notify_style_update(self) -> None:
         self._line_cache.clear()
 
+    def _watch_max_lines(self, max_lines: int | None) -> None:
+        """Discard lines if the maximum is reduced."""
+        offset = self._lines.offset
+        self._lines.maxlen = max_lines
+        if self._lines.offset != offset:
+            self.virtual_size = Size(self.max_width, len(self._lines))
+            self.refresh()
+
     def on_resize(self) -> None:
         self._last_container_width = self.scrollable_content_region.width
 
@@ -181,8 +206,9 @@ class RichLog(ScrollView, can_focus=True):
             renderable, render_options.update_width(render_width)
         )
         lines = list(Segment.split_lines(segments))
+        offset = self._lines.offset
         if not lines:
-            self.lines.append(Strip.blank(render_width))
+            self._lines.append(Strip.blank(render_width))
         else:
             self.max_width = max(
                 self.max_width,
@@ -191,13 +217,12 @@ class RichLog(ScrollView, can_focus=True):
             strips = Strip.from_lines(lines)
             for strip in strips:
                 strip.adjust_cell_length(render_width)
-            self.lines.extend(strips)
+            self._lines.extend(strips)
 
-            if self.max_lines is not None and len(self.lines) > self.max_lines:
-                self._start_line += len(self.lines) - self.max_lines
-                self.refresh()
-                self.lines = self.lines[-self.max_lines :]
-        self.virtual_size = Size(self.max_width, len(self.lines))
+        if self._lines.offset != offset:
+            # Lines were discarded from the start, so everything moved up
+            self.refresh()
+        self.virtual_size = Size(self.max_width, len(self._lines))
         if auto_scroll:
             self.scroll_end(animate=False)
 
@@ -209,11 +234,10 @@ class RichLog(ScrollView, can_focus=True):
         Returns:
             The `RichLog` instance.
         """
-        self.lines.clear()
+        self._lines.clear()
         self._line_cache.clear()
-        self._start_line = 0
         self.max_width = 0
-        self.virtual_size = Size(self.max_width, len(self.lines))
+        self.virtual_size = Size(self.max_width, len(self._lines))
         self.refresh()
         return self
 
@@ -236,14 +260,14 @@ class RichLog(ScrollView, can_focus=True):
         return lines
 
     def _render_line(self, y: int, scroll_x: int, width: int) -> Strip:
-        if y >= len(self.lines):
+        if y >= len(self._lines):
             return Strip.blank(width, self.rich_style)
 
-        key = (y + self._start_line, scroll_x, width, self.max_width)
+        key = (y + self._lines.offset, scroll_x, width, self.max_width)
         if key in self._line_cache:
             return self._line_cache[key]
 
-        line = self.lines[y].crop_extend(scroll_x, scroll_x + width, self.rich_style)
+        line = self._lines[y].crop_extend(scroll_x, scroll_x + width, self.rich_style)
 
         self._line_cache[key] = line
         return line
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import dataclasses
 import re
-from collections import defaultdict
 from dataclasses import dataclass
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar, Iterable, Optional, Sequence, Tuple
 
@@ -51,6 +51,10 @@ _OPENING_BRACKETS = {"{": "}", "[": "]", "(": ")"}
 _CLOSING_BRACKETS = {v: k for k, v in _OPENING_BRACKETS.items()}
 _TREE_SITTER_PATH = Path(__file__).parent / "../tree-sitter/"
 _HIGHLIGHTS_PATH = _TREE_SITTER_PATH / "highlights/"
+_QUERY_TOKEN = re.compile(
+    r';[^\n]*|"(?:\\.|[^"\\])*"|@[\w.\-]+|[()\[\]]|(?<![\w.\-])_(?![\w.\-])'
+)
+"""Matches the tokens in a tree-sitter query which delimit patterns and captures."""
 
 StartColumn = int
 EndColumn = Optional[int]
@@ -423,8 +427,9 @@ TextArea {
         cursor is currently at. If the cursor is at a bracket, or there's no matching
         bracket, this will be `None`."""
 
-        self._highlights: dict[int, list[Highlight]] = defaultdict(list)
-        """Mapping line numbers to the set of highlights for that line."""
+        self._highlights: dict[int, list[Highlight]] = {}
+        """Mapping line numbers to the set of highlights for that line.
+        Lines are added as they are rendered, and removed or moved when edited."""
 
         self._highlight_query: "Query | None" = None
         """The query that's currently being used for highlighting."""
@@ -538,33 +543,124 @@ TextArea {
         return highlight_query
 
     def _build_highlight_map(self) -> None:
-        """Query the tree for ranges to highlights, and update the internal highlights mapping."""
-        highlights = self._highlights
-        highlights.clear()
-        if not self._highlight_query:
-            return
+        """Discard all highlights, so that lines are highlighted again as they are rendered."""
+        self._highlights.clear()
+
+    def _build_line_highlights(self, start_row: int, end_row: int) -> None:
+        """Query the tree for ranges to highlight in a range of lines, and add them
+        to the internal highlights mapping.
 
-        captures = self.document.query_syntax_tree(self._highlight_query)
+        The highlights for each line are ordered by the start of the node captured,
+        then by the index of the pattern in the query, so that they don't depend on
+        the range queried.
+
+        Args:
+            start_row: First line to highlight.
+            end_row: Line after the last line to highlight.
+        """
+        end_row = min(end_row, self.document.line_count)
+        line_highlights: dict[int, list[tuple[tuple[int, int, int], Highlight]]] = {
+            row: [] for row in range(start_row, end_row)
+        }
+        if self._highlight_query:
+            captures = self.document.query_syntax_tree(
+                self._highlight_query,
+                start_point=(start_row, 0),
+                end_point=(end_row, 0),
+            )
+        else:
+            captures = []
         for capture in captures:
-            node, highlight_name = capture
+            node, numbered_name = capture
+            pattern_index, highlight_name = numbered_name.split(".", 1)
             node_start_row, node_start_column = node.start_point
             node_end_row, node_end_column = node.end_point
+            order = (node_start_row, node_start_column, int(pattern_index))
 
             if node_start_row == node_end_row:
-                highlight = (node_start_column, node_end_column, highlight_name)
-                highlights[node_start_row].append(highlight)
+                if start_row <= node_start_row < end_row:
+                    highlight = (node_start_column, node_end_column, highlight_name)
+                    line_highlights[node_start_row].append((order, highlight))
             else:
                 # Add the first line of the node range
-                highlights[node_start_row].append(
-                    (node_start_column, None, highlight_name)
-                )
+                if start_row <= node_start_row < end_row:
+                    line_highlights[node_start_row].append(
+                        (order, (node_start_column, None, highlight_name))
+                    )
 
                 # Add the middle lines - entire row of this node is highlighted
-                for node_row in range(node_start_row + 1, node_end_row):
-                    highlights[node_row].append((0, None, highlight_name))
+                for node_row in range(
+                    max(node_start_row + 1, start_row), min(node_end_row, end_row)
+                ):
+                    line_highlights[node_row].append((order, (0, None, highlight_name)))
 
                 # Add the last line of the node range
-                highlights[node_end_row].append((0, node_end_column, highlight_name))
+                if start_row <= node_end_row < end_row:
+                    line_highlights[node_end_row].append(
+                        (order, (0, node_end_column, highlight_name))
+                    )
+
+        highlights = self._highlights
+        for row, row_highlights in line_highlights.items():
+            row_highlights.sort(key=itemgetter(0))
+            highlights[row] = [highlight for _order, highlight in row_highlights]
+
+    def _get_line_highlights(self, line_index: int) -> list[Highlight]:
+        """Get the highlights for a line, querying the tree if required.
+
+        Args:
+            line_index: Index of the line.
+
+        Returns:
+            Highlights for the line.
+        """
+        highlights = self._highlights
+        if line_index not in highlights:
+            # Lines are rendered from top to bottom, so highlight the uncached lines
+            # in the rest of the viewport in a single query.
+            end_row = line_index + 1
+            viewport_end_row = line_index + max(1, self.size.height)
+            while end_row < viewport_end_row and end_row not in highlights:
+                end_row += 1
+            self._build_line_highlights(line_index, end_row)
+        return highlights.get(line_index, [])
+
+    def _update_highlight_map(
+        self, top_row: int, old_bottom_row: int, new_bottom_row: int
+    ) -> None:
+        """Update the highlights after an edit.
+
+        Highlights for edited lines, and lines where the syntax tree changed, are
+        discarded. Highlights for lines below the edit are moved if lines were
+        inserted or deleted.
+
+        Args:
+            top_row: First line of the edit.
+            old_bottom_row: Last line of the edit, before the edit.
+            new_bottom_row: Last line of the edit, after the edit.
+        """
+        highlights = self._highlights
+        if not highlights:
+            return
+        line_offset = new_bottom_row - old_bottom_row
+        if line_offset:
+            self._highlights = highlights = {
+                (row + line_offset if row > old_bottom_row else row): line_highlights
+                for row, line_highlights in highlights.items()
+                if not top_row <= row <= old_bottom_row
+            }
+        else:
+            for row in range(top_row, old_bottom_row + 1):
+                highlights.pop(row, None)
+
+        if isinstance(self.document, SyntaxAwareDocument):
+            for changed_start_row, changed_end_row in self.document.changed_rows:
+                for row in [
+                    row
+                    for row in highlights
+                    if changed_start_row <= row <= changed_end_row
+                ]:
+                    del highlights[row]
 
     def _watch_has_focus(self, focus: bool) -> None:
         self._cursor_visible = focus
@@ -854,7 +950,9 @@ TextArea {
                     f"Parser not found for language {document_language!r}. Parsing disabled."
                 )
             else:
-                self._highlight_query = document.prepare_query(highlight_query)
+                self._highlight_query = document.prepare_query(
+                    _number_query_patterns(highlight_query)
+                )
         elif language and not TREE_SITTER:
             log.warning(
                 "tree-sitter not available in this environment. Parsing disabled.\n"
@@ -865,6 +963,14 @@ TextArea {
         else:
             document = Document(text)
 
+        self._use_document(document)
+
+    def _use_document(self, document: DocumentBase) -> None:
+        """Start editing a document.
+
+        Args:
+            document: The document to edit.
+        """
         self.document = document
         self.wrapped_document = WrappedDocument(document, tab_width=self.indent_width)
         self.navigator = DocumentNavigator(self.wrapped_document)
@@ -900,6 +1006,23 @@ TextArea {
         self._set_document(text, self.language)
         self.post_message(self.Changed(self).set_sender(self))
 
+    def load_document(self, document: DocumentBase) -> None:
+        """Load a document into the TextArea.
+
+        Use this to edit a custom `DocumentBase` implementation, such as a
+        `ChunkedDocument` for very large files. Syntax highlighting is not applied,
+        and setting the language will replace the document with a new one.
+
+        This will clear the edit history.
+
+        Args:
+            document: The document to load into the TextArea.
+        """
+        self.history.clear()
+        self._highlight_query = None
+        self._use_document(document)
+        self.post_message(self.Changed(self).set_sender(self))
+
     def _on_resize(self) -> None:
         self._rewrap_and_refresh_virtual_size()
 
@@ -993,6 +1116,21 @@ TextArea {
         line_string = self.document.get_line(line_index)
         return Text(line_string, end="")
 
+    def render_lines(self, crop: Region) -> list[Strip]:
+        """Render the widget in to lines.
+
+        Args:
+            crop: Region within visible area to render.
+
+        Returns:
+            A list of list of segments.
+        """
+        strips = super().render_lines(crop)
+        if self.soft_wrap and self.wrapped_document.height != self.virtual_size.height:
+            # Lines are wrapped as they are rendered, which may change their height.
+            self.call_later(self._refresh_size)
+        return strips
+
     def render_line(self, y: int) -> Strip:
         """Render a single line of the TextArea. Called by Textual.
 
@@ -1019,11 +1157,7 @@ TextArea {
             return Strip.blank(self.size.width)
 
         # Get the line corresponding to this offset
-        try:
-            line_info = wrapped_document._offset_to_line_info[y_offset]
-        except IndexError:
-            line_info = None
-
+        line_info = wrapped_document.offset_to_line_info(y_offset)
         if line_info is None:
             return Strip.blank(self.size.width)
 
@@ -1077,12 +1211,11 @@ TextArea {
                         else:
                             line.stylize(selection_style, end=line_character_count)
 
-        highlights = self._highlights
-        if highlights and theme:
+        if self._highlight_query and theme:
             line_bytes = _utf8_encode(line.plain)
             byte_to_codepoint = build_byte_to_codepoint_dict(line_bytes)
             get_highlight_from_theme = theme.syntax_styles.get
-            line_highlights = highlights[line_index]
+            line_highlights = self._get_line_highlights(line_index)
             for highlight_start, highlight_end, highlight_name in line_highlights:
                 node_style = get_highlight_from_theme(highlight_name)
                 if node_style is not None:
@@ -1276,7 +1409,7 @@ TextArea {
 
         self._refresh_size()
         edit.after(self)
-        self._build_highlight_map()
+        self._update_highlight_map(edit.top[0], edit.bottom[0], result.end_location[0])
         self.post_message(self.Changed(self))
         return result
 
@@ -2253,3 +2386,36 @@ def build_byte_to_codepoint_dict(data: bytes) -> dict[int, int]:
     # Mapping for the end of the string
     byte_to_codepoint[current_byte_offset] = code_point_offset
     return byte_to_codepoint
+
+
+def _number_query_patterns(query: str) -> str:
+    """Prefix each capture name in a tree-sitter query with the index of its pattern.
+
+    The order of the captures returned by a query depends on the range queried, so
+    the pattern index is used to put highlights in a consistent order.
+
+    Args:
+        query: A tree-sitter query.
+
+    Returns:
+        The query, with each capture renamed to `@<pattern index>.<name>`.
+    """
+    parts: list[str] = []
+    depth = 0
+    pattern_index = -1
+    position = 0
+    for match in _QUERY_TOKEN.finditer(query):
+        token = match.group()
+        first_character = token[0]
+        if depth == 0 and first_character in '([_"':
+            pattern_index += 1
+        if first_character in "([":
+            depth += 1
+        elif first_character in ")]":
+            depth -= 1
+        elif first_character == "@":
+            parts.append(query[position : match.start()])
+            parts.append(f"@{pattern_index}.{token[1:]}")
+            position = match.end()
+    parts.append(query[position:])
+    return "".join(parts)
@@ -2,16 +2,26 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, ClassVar, Generic, Iterable, NewType, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    ClassVar,
+    Generic,
+    Iterable,
+    NewType,
+    TypeVar,
+    cast,
+    overload,
+)
 
 import rich.repr
 from rich.style import NULL_STYLE, Style
 from rich.text import Text, TextType
 
 from .. import events
+from .._fenwick_tree import FenwickTree
 from .._immutable_sequence_view import ImmutableSequenceView
-from .._loop import loop_last
 from .._segment_tools import line_pad
 from ..binding import Binding, BindingType
 from ..cache import LRUCache
@@ -79,6 +89,40 @@ class _TreeLine(Generic[TreeDataType]):
         return guides
 
 
+class _TreeLines(Generic[TreeDataType]):
+    """A sequence of the lines displayed by a tree.
+
+    Lines are created on demand, from the line index of the tree.
+    """
+
+    def __init__(self, tree: Tree[TreeDataType]) -> None:
+        self._tree = tree
+
+    def __len__(self) -> int:
+        return self._tree._get_line_count()
+
+    @overload
+    def __getitem__(self, index: int) -> _TreeLine[TreeDataType]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[_TreeLine[TreeDataType]]: ...
+
+    def __getitem__(
+        self, index: int | slice
+    ) -> _TreeLine[TreeDataType] | list[_TreeLine[TreeDataType]]:
+        tree = self._tree
+        if isinstance(index, slice):
+            return [
+                tree._get_tree_line(line) for line in range(*index.indices(len(self)))
+            ]
+        line_count = len(self)
+        if index < 0:
+            index += line_count
+        if not 0 <= index < line_count:
+            raise IndexError("tree line index out of range")
+        return tree._get_tree_line(index)
+
+
 class TreeNodes(ImmutableSequenceView["TreeNode[TreeDataType]"]):
     """An immutable collection of `TreeNode`."""
 
@@ -122,7 +166,14 @@ class TreeNode(Generic[TreeDataType]):
         self._selected_ = False
         self._allow_expand = allow_expand
         self._updates: int = 0
-        self._line: int = -1
+        self._size = 1
+        """The number of lines displayed for the node and its descendants."""
+        self._index = 0
+        """The index of the node in the children of its parent."""
+        self._child_sizes: FenwickTree | None = None
+        """The number of lines displayed for each child, created with the first child."""
+        self._width: int | None = None
+        """The width of the node's line, if it is counted in the width of the tree."""
 
     def __rich_repr__(self) -> rich.repr.Result:
         yield self._label.plain
@@ -146,7 +197,7 @@ class TreeNode(Generic[TreeDataType]):
     @property
     def line(self) -> int:
         """The line number for this node, or -1 if it is not displayed."""
-        return self._line
+        return self._tree._get_node_line(self)
 
     @property
     def _hover(self) -> bool:
@@ -206,6 +257,7 @@ class TreeNode(Generic[TreeDataType]):
     def allow_expand(self, allow_expand: bool) -> None:
         self._allow_expand = allow_expand
         self._updates += 1
+        self._tree._update_node_width(self)
 
     def _expand(self, expand_all: bool) -> None:
         """Mark the node as expanded (its children are shown).
@@ -213,7 +265,7 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             expand_all: If `True` expand all offspring at all depths.
         """
-        self._expanded = True
+        self._tree._set_expanded(self, True)
         self._updates += 1
         self._tree.post_message(Tree.NodeExpanded(self).set_sender(self._tree))
         if expand_all:
@@ -246,7 +298,7 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             collapse_all: If `True` collapse all offspring at all depths.
         """
-        self._expanded = False
+        self._tree._set_expanded(self, False)
         self._updates += 1
         self._tree.post_message(Tree.NodeCollapsed(self).set_sender(self._tree))
         if collapse_all:
@@ -315,6 +367,7 @@ class TreeNode(Generic[TreeDataType]):
         self._updates += 1
         text_label = self._tree.process_label(label)
         self._label = text_label
+        self._tree._update_node_width(self)
         self._tree.call_later(self._tree._refresh_node, self)
 
     def add(
@@ -322,6 +375,7 @@ class TreeNode(Generic[TreeDataType]):
         label: TextType,
         data: TreeDataType | None = None,
         *,
+        before: int | None = None,
         expand: bool = False,
         allow_expand: bool = True,
     ) -> TreeNode[TreeDataType]:
@@ -330,6 +384,8 @@ class TreeNode(Generic[TreeDataType]):
         Args:
             label: The new node's label.
             data: Data associated with the new node.
+            before: Index of the child to add the new node before, or `None`
+                to add it after the last child.
             expand: Node should be expanded.
             allow_expand: Allow use to expand the node via keyboard or mouse.
 
@@ -341,23 +397,29 @@ class TreeNode(Generic[TreeDataType]):
         node._expanded = expand
         node._allow_expand = allow_expand
         self._updates += 1
-        self._children.append(node)
+        self._tree._add_child(self, node, before)
         self._tree._invalidate()
         return node
 
     def add_leaf(
-        self, label: TextType, data: TreeDataType | None = None
+        self,
+        label: TextType,
+        data: TreeDataType | None = None,
+        *,
+        before: int | None = None,
     ) -> TreeNode[TreeDataType]:
         """Add a 'leaf' node (a node that can not expand).
 
         Args:
             label: Label for the node.
             data: Optional data.
+            before: Index of the child to add the new node before, or `None`
+                to add it after the last child.
 
         Returns:
             New node.
         """
-        node = self.add(label, data, expand=False, allow_expand=False)
+        node = self.add(label, data, before=before, expand=False, allow_expand=False)
         return node
 
     def _remove_children(self) -> None:
@@ -379,7 +441,7 @@ class TreeNode(Generic[TreeDataType]):
         """
         self._remove_children()
         assert self._parent is not None
-        del self._parent._children[self._parent._children.index(self)]
+        self._tree._remove_child(self._parent, self)
         del self._tree._tree_nodes[self.id]
 
     def remove(self) -> None:
@@ -401,7 +463,7 @@ class TreeNode(Generic[TreeDataType]):
     def refresh(self) -> None:
         """Initiate a refresh (repaint) of this node."""
         self._updates += 1
-        self._tree._refresh_line(self._line)
+        self._tree._refresh_line(self.line)
 
 
 class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
@@ -615,8 +677,14 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         self.root = self._add_node(None, text_label, data)
         """The root node of the tree."""
         self._line_cache: LRUCache[LineCacheKey, Strip] = LRUCache(1024)
-        self._tree_lines_cached: list[_TreeLine[TreeDataType]] | None = None
+        self._tree_lines_cached: _TreeLines[TreeDataType] | None = None
         self._cursor_node: TreeNode[TreeDataType] | None = None
+        self._line_widths: Counter[int] = Counter()
+        """The number of displayed lines with each width."""
+        self._pending_nodes: set[TreeNode[TreeDataType]] = {self.root}
+        """Nodes whose line width must be measured."""
+        self._pending_subtrees: set[TreeNode[TreeDataType]] = {self.root}
+        """Nodes whose displayed descendants must be measured."""
 
         super().__init__(name=name, id=id, classes=classes, disabled=disabled)
 
@@ -715,6 +783,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         """
         self._clear_line_cache()
         self._current_id = 0
+        self._line_widths.clear()
         root_label = self.root._label
         root_data = self.root.data
         root_expanded = self.root.is_expanded
@@ -726,6 +795,8 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             root_data,
             expanded=root_expanded,
         )
+        self._pending_nodes = {self.root}
+        self._pending_subtrees = {self.root}
         self._updates += 1
         self.refresh()
         return self
@@ -751,7 +822,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         Args:
             node: A tree node, or None to reset cursor.
         """
-        self.cursor_line = -1 if node is None else node._line
+        self.cursor_line = -1 if node is None else node.line
 
     def get_node_at_line(self, line_no: int) -> TreeNode[TreeDataType] | None:
         """Get the node for a given line.
@@ -890,10 +961,12 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             self._cursor_node = None
 
     def watch_guide_depth(self, guide_depth: int) -> None:
+        self._reset_widths()
         self._invalidate()
 
     def watch_show_root(self, show_root: bool) -> None:
         self.cursor_line = -1
+        self._reset_widths()
         self._invalidate()
 
     def scroll_to_line(self, line: int, animate: bool = True) -> None:
@@ -916,7 +989,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
             node: Node to scroll in to view.
             animate: Animate scrolling.
         """
-        line = node._line
+        line = node.line
         if line != -1:
             self.scroll_to_line(line, animate=animate)
 
@@ -948,7 +1021,7 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
                 self._refresh_line(line_no)
 
     @property
-    def _tree_lines(self) -> list[_TreeLine[TreeDataType]]:
+    def _tree_lines(self) -> _TreeLines[TreeDataType]:
         if self._tree_lines_cached is None:
             self._build()
         assert self._tree_lines_cached is not None
@@ -960,51 +1033,311 @@ class Tree(Generic[TreeDataType], ScrollView, can_focus=True):
         async with self.lock:
             self._tree_lines
 
-    def _build(self) -> None:
-        """Builds the tree by traversing nodes, and creating tree lines."""
+    def _get_line_count(self) -> int:
+        """Get the number of lines displayed by the tree.
+
+        Returns:
+            Number of lines.
+        """
+        root = self.root
+        if self.show_root:
+            return root._size
+        return 0 if root._child_sizes is None else root._child_sizes.total
+
+    def _shows_children(self, node: TreeNode[TreeDataType]) -> bool:
+        """Check if the children of a node are displayed (if the node is displayed).
 
-        TreeLine = _TreeLine
-        lines: list[_TreeLine[TreeDataType]] = []
-        add_line = lines.append
+        Args:
+            node: A tree node.
+
+        Returns:
+            `True` if the node is expanded, or is the root and the root isn't shown.
+        """
+        return node._expanded or (node is self.root and not self.show_root)
+
+    def _get_node_line(self, node: TreeNode[TreeDataType]) -> int:
+        """Get the line of a node.
 
+        Args:
+            node: A tree node.
+
+        Returns:
+            The line number, or -1 if the node is not displayed.
+        """
         root = self.root
+        if node is not root and self._tree_nodes.get(node._id) is not node:
+            # The node has been removed
+            return -1
+        line = 0
+        while node is not root:
+            parent = node._parent
+            if parent is None or not self._shows_children(parent):
+                return -1
+            assert parent._child_sizes is not None
+            line += parent._child_sizes.prefix_sum(node._index) + 1
+            node = parent
+        return line if self.show_root else line - 1
+
+    def _get_node_at_line(self, line: int) -> TreeNode[TreeDataType] | None:
+        """Get the node displayed on a line.
 
-        def add_node(
-            path: list[TreeNode[TreeDataType]], node: TreeNode[TreeDataType], last: bool
-        ) -> None:
-            child_path = [*path, node]
-            node._line = len(lines)
-            add_line(TreeLine(child_path, last))
-            if node._expanded:
-                for last, child in loop_last(node._children):
-                    add_node(child_path, child, last)
+        Args:
+            line: A line number.
 
+        Returns:
+            A tree node, or `None` if there is no node on the line.
+        """
+        if line < 0:
+            return None
+        node = self.root
         if self.show_root:
-            add_node([], root, True)
+            if not line:
+                return node
+            if not node._expanded:
+                return None
+            line -= 1
+        while True:
+            child_sizes = node._child_sizes
+            if child_sizes is None or line >= child_sizes.total:
+                return None
+            index = child_sizes.find(line)
+            node = node._children[index]
+            line -= child_sizes.prefix_sum(index)
+            if not line:
+                return node
+            # The line is within the descendants of the child
+            line -= 1
+
+    def _get_tree_line(self, line: int) -> _TreeLine[TreeDataType]:
+        """Get a tree line.
+
+        Args:
+            line: A line number, which must be displayed.
+
+        Returns:
+            A tree line.
+        """
+        node = self._get_node_at_line(line)
+        assert node is not None
+        root = self.root
+        path = [node]
+        ancestor = node._parent
+        while ancestor is not None and (ancestor is not root or self.show_root):
+            path.append(ancestor)
+            ancestor = ancestor._parent
+        path.reverse()
+        last = node is root or (node._parent is root and not self.show_root)
+        return _TreeLine(path, last or node.is_last)
+
+    def _update_size(self, node: TreeNode[TreeDataType]) -> None:
+        """Update the number of lines of a node, and its ancestors.
+
+        Args:
+            node: A tree node, whose children or expanded state have changed.
+        """
+        child_sizes = node._child_sizes
+        size = 1
+        if node._expanded and child_sizes is not None:
+            size += child_sizes.total
+        delta = size - node._size
+        node._size = size
+        while delta:
+            parent = node._parent
+            if parent is None:
+                break
+            assert parent._child_sizes is not None
+            parent._child_sizes[node._index] = node._size
+            if not parent._expanded:
+                break
+            parent._size += delta
+            node = parent
+
+    def _set_expanded(self, node: TreeNode[TreeDataType], expanded: bool) -> None:
+        """Expand or collapse a node.
+
+        Args:
+            node: A tree node.
+            expanded: `True` to expand the node, or `False` to collapse it.
+        """
+        if node._expanded == expanded:
+            return
+        if not expanded and (node is not self.root or self.show_root):
+            self._discard_child_widths(node)
+        node._expanded = expanded
+        self._update_size(node)
+        self._update_node_width(node)
+        if expanded:
+            self._pending_subtrees.add(node)
+
+    def _add_child(
+        self,
+        parent: TreeNode[TreeDataType],
+        node: TreeNode[TreeDataType],
+        index: int | None = None,
+    ) -> None:
+        """Add a node to the children of a node.
+
+        Args:
+            parent: The parent node.
+            node: The new child node.
+            index: The position of the new node, or `None` to add it at the end.
+        """
+        children = parent._children
+        if index is not None and index < 0:
+            index = max(0, len(children) + index)
+        if index is None or index >= len(children):
+            index = len(children)
         else:
-            for node in self.root._children:
-                add_node([], node, True)
-        self._tree_lines_cached = lines
+            for sibling in children[index:]:
+                sibling._index += 1
+        node._index = index
+        children.insert(index, node)
+        if parent._child_sizes is None:
+            parent._child_sizes = FenwickTree()
+        parent._child_sizes.replace(index, index, (node._size,))
+        self._update_size(parent)
+        self._pending_nodes.add(node)
+
+    def _remove_child(
+        self, parent: TreeNode[TreeDataType], node: TreeNode[TreeDataType]
+    ) -> None:
+        """Remove a node (with no children) from the children of a node.
 
-        guide_depth = self.guide_depth
+        Args:
+            parent: The parent node.
+            node: The child node to remove.
+        """
+        self._discard_width(node)
+        index = node._index
+        del parent._children[index]
+        assert parent._child_sizes is not None
+        parent._child_sizes.replace(index, index + 1, ())
+        for sibling in parent._children[index:]:
+            sibling._index -= 1
+        self._update_size(parent)
+
+    def _discard_width(self, node: TreeNode[TreeDataType]) -> None:
+        """Stop counting the line of a node in the width of the tree.
+
+        Args:
+            node: A tree node.
+        """
+        width = node._width
+        if width is not None:
+            node._width = None
+            line_widths = self._line_widths
+            line_widths[width] -= 1
+            if not line_widths[width]:
+                del line_widths[width]
+
+    def _discard_child_widths(self, node: TreeNode[TreeDataType]) -> None:
+        """Stop counting the lines of the displayed descendants of a node.
+
+        Args:
+            node: A tree node whose children are about to be hidden.
+        """
+        if not node._expanded or self._get_node_line(node) == -1:
+            return
+        discard_width = self._discard_width
+        stack = list(node._children)
+        while stack:
+            child = stack.pop()
+            discard_width(child)
+            if child._expanded:
+                stack.extend(child._children)
+
+    def _update_node_width(self, node: TreeNode[TreeDataType]) -> None:
+        """Measure the line of a node again, when the tree is next built.
+
+        Args:
+            node: A tree node whose label may have changed.
+        """
+        self._discard_width(node)
+        self._pending_nodes.add(node)
+        self._tree_lines_cached = None
+
+    def _reset_widths(self) -> None:
+        """Measure every displayed line again, when the tree is next built."""
+        self._line_widths.clear()
+        for node in self._tree_nodes.values():
+            node._width = None
+        self.root._width = None
+        self._pending_nodes = {self.root}
+        self._pending_subtrees = {self.root}
+
+    def _measure_lines(self) -> None:
+        """Count the widths of displayed lines which haven't been measured."""
+        pending_nodes = self._pending_nodes
+        pending_subtrees = self._pending_subtrees
+        if not (pending_nodes or pending_subtrees):
+            return
+        self._pending_nodes = set()
+        self._pending_subtrees = set()
+
+        root = self.root
         show_root = self.show_root
+        guide_depth = self.guide_depth
         get_label_width = self.get_label_width
+        line_widths = self._line_widths
+        shows_children = self._shows_children
+
+        def get_path_length(node: TreeNode[TreeDataType]) -> int:
+            """Get the length of the path of a node's line."""
+            length = 1 if show_root else 0
+            while node is not root:
+                length += 1
+                node = cast("TreeNode[TreeDataType]", node._parent)
+            return length
+
+        def count_width(node: TreeNode[TreeDataType], path_length: int) -> None:
+            """Count the width of a node's line, if it isn't counted."""
+            if node._width is None and (node is not root or show_root):
+                # Width of the guides, plus the label
+                width = (
+                    get_label_width(node) + 2 + max(0, path_length - 1) * guide_depth
+                )
+                node._width = width
+                line_widths[width] += 1
+
+        for node in pending_subtrees:
+            ancestor = node._parent
+            while ancestor is not None and ancestor not in pending_subtrees:
+                ancestor = ancestor._parent
+            if ancestor is not None:
+                # The node is measured along with its ancestor
+                continue
+            if node is not root and self._get_node_line(node) == -1:
+                continue
+            stack = [(node, get_path_length(node))]
+            while stack:
+                node, path_length = stack.pop()
+                count_width(node, path_length)
+                if shows_children(node):
+                    path_length += 1
+                    stack.extend((child, path_length) for child in node._children)
+
+        for node in pending_nodes:
+            if node._width is None and self._get_node_line(node) != -1:
+                count_width(node, get_path_length(node))
 
-        def get_line_width(line: _TreeLine[TreeDataType]) -> int:
-            return get_label_width(line.node) + line._get_guide_width(
-                guide_depth, show_root
-            )
+    def _build(self) -> None:
+        """Update the line index, the virtual size, and the cursor."""
+        self._measure_lines()
+        self._tree_lines_cached = lines = _TreeLines(self)
+        line_count = len(lines)
 
-        if lines:
-            width = max([get_line_width(line) for line in lines])
+        if self._line_widths:
+            width = max(self._line_widths)
         else:
             width = self.size.width
 
-        self.virtual_size = Size(width, len(lines))
+        self.virtual_size = Size(width, line_count)
         if self.cursor_line != -1:
             if self.cursor_node is not None:
-                self.cursor_line = self.cursor_node._line
-            if self.cursor_line >= len(lines):
+                cursor_line = self.cursor_node.line
+                if cursor_line != -1:
+                    self.cursor_line = cursor_line
+            if self.cursor_line >= line_count:
                 self.cursor_line = -1
         self.refresh()
 
@@ -6,7 +6,10 @@ from ._data_table import (
     ColumnDoesNotExist,
     ColumnKey,
     CursorType,
+    DataSource,
+    DataSourceRows,
     DuplicateKey,
+    ReadOnlyRows,
     Row,
     RowDoesNotExist,
     RowKey,
@@ -20,7 +23,10 @@ __all__ = [
     "ColumnDoesNotExist",
     "ColumnKey",
     "CursorType",
+    "DataSource",
+    "DataSourceRows",
     "DuplicateKey",
+    "ReadOnlyRows",
     "Row",
     "RowDoesNotExist",
     "RowKey",
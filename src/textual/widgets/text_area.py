@@ -1,4 +1,5 @@
 from textual._text_area_theme import TextAreaTheme
+from textual.document._chunked_document import ChunkedDocument
 from textual.document._document import (
     Document,
     DocumentBase,
@@ -23,6 +24,7 @@ from textual.widgets._text_area import (
 
 __all__ = [
     "BUILTIN_LANGUAGES",
+    "ChunkedDocument",
     "Document",
     "DocumentBase",
     "DocumentNavigator",
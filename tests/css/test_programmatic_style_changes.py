@@ -1,6 +1,7 @@
 import pytest
 
 from textual.app import App
+from textual.color import Color
 from textual.containers import Grid
 from textual.widgets import Label
 
@@ -92,3 +93,69 @@ async def test_programmatic_align_change_updates_children_position(
         assert offsets != [
             (lbl.region.x, lbl.region.y) for lbl in app.screen.query(Label)
         ]
+
+
+async def test_class_change_updates_descendants():
+    """Changing a class updates descendants only if it is used to match ancestors."""
+
+    class MyApp(App[None]):
+        CSS = """
+        .parent Label { color: red; }
+        .highlight { background: blue; }
+        .highlight Label.inner { color: green; }
+        """
+
+        def compose(self):
+            with Grid():
+                yield Label("one", classes="inner")
+
+    app = MyApp()
+
+    async with app.run_test() as pilot:
+        grid = app.query_one(Grid)
+        label = app.query_one(Label)
+
+        grid.add_class("parent")
+        await pilot.pause()
+        assert label.styles.color == Color.parse("red")
+
+        grid.add_class("highlight")
+        await pilot.pause()
+        assert grid.styles.background == Color.parse("blue")
+        assert label.styles.color == Color.parse("green")
+
+        grid.remove_class("highlight")
+        await pilot.pause()
+        assert not grid.styles.has_rule("background")
+        assert label.styles.color == Color.parse("red")
+
+        grid.set_classes("other")
+        await pilot.pause()
+        assert not label.styles.has_rule("color")
+
+
+async def test_refresh_css_variables():
+    """Changing the value of a variable updates widgets with rules which use it."""
+
+    class MyApp(App[None]):
+        CSS = """
+        Label { color: $my-color; }
+        """
+        my_color = "red"
+
+        def get_css_variables(self) -> dict[str, str]:
+            return {**super().get_css_variables(), "my-color": self.my_color}
+
+        def compose(self):
+            yield Label("one")
+
+    app = MyApp()
+
+    async with app.run_test() as pilot:
+        label = app.query_one(Label)
+        assert label.styles.color == Color.parse("red")
+
+        app.my_color = "blue"
+        app.refresh_css_variables(animate=False)
+        await pilot.pause()
+        assert label.styles.color == Color.parse("blue")
@@ -1,8 +1,10 @@
+import os
 from contextlib import nullcontext as does_not_raise
 
 import pytest
 
 from textual.color import Color
+from textual.css.parse import parse
 from textual.css.stylesheet import CssSource, Stylesheet, StylesheetParseError
 from textual.css.tokenizer import TokenError
 from textual.dom import DOMNode
@@ -100,6 +102,57 @@ def test_stylesheet_apply_empty_rulesets():
     stylesheet.apply(node)
 
 
+def test_stylesheet_apply_descendant_selectors():
+    """Selectors with ancestors only match nodes with matching ancestors."""
+    css = """
+    .a .b {color: red;}
+    #top > .b {background: blue;}
+    #top.a.c .b {tint: yellow;}
+    .x .b, .b.d {text-style: bold;}
+    """
+    stylesheet = _make_user_stylesheet(css)
+    top = DOMNode(id="top", classes="a c")
+    middle = DOMNode(classes="b d")
+    middle._attach(top)
+    bottom = DOMNode(classes="b")
+    bottom._attach(middle)
+    other = DOMNode(classes="b")
+
+    stylesheet.update_nodes([top, middle, bottom, other])
+
+    assert middle.styles.color == Color(255, 0, 0)
+    assert middle.styles.background == Color(0, 0, 255)
+    assert middle.styles.tint == Color(255, 255, 0)
+    assert middle.styles.text_style.bold
+
+    assert bottom.styles.color == Color(255, 0, 0)
+    assert not bottom.styles.has_rule("background")
+    assert bottom.styles.tint == Color(255, 255, 0)
+    assert not bottom.styles.has_rule("text_style")
+
+    for node in (top, other):
+        stylesheet.apply(node)
+        assert not node.styles.has_rule("color")
+        assert not node.styles.has_rule("tint")
+
+
+def test_stylesheet_affects_descendants():
+    """Only names used to match ancestors affect descendants."""
+    css = """
+    .a .b {color: red;}
+    #top:hover > Widget {background: blue;}
+    .c.d:focus {tint: yellow;}
+    """
+    stylesheet = _make_user_stylesheet(css)
+
+    assert stylesheet.affects_descendants([".a"])
+    assert stylesheet.affects_descendants([":hover", ".x"])
+    assert not stylesheet.affects_descendants([".b"])
+    assert not stylesheet.affects_descendants([".c", ".d"])
+    assert not stylesheet.affects_descendants([":focus", ":blur"])
+    assert not stylesheet.affects_descendants([])
+
+
 def test_stylesheet_apply_user_css_over_widget_css():
     user_css = ".a {color: red; tint: yellow;}"
 
@@ -295,3 +348,153 @@ def test_did_you_mean_for_color_names(
         expected_error_summary += f". Did you mean '{expected_color_suggestion}'?"
 
     assert help_text.summary == expected_error_summary
+
+
+def test_stylesheet_cache_path(tmp_path, monkeypatch):
+    """Parsed CSS is cached on disk, and the cache is invalidated by changes."""
+    css = ".a {color: $accent;}"
+
+    stylesheet = Stylesheet(variables={"accent": "red"}, cache_path=tmp_path)
+    stylesheet.add_source(css, read_from=("test.tcss", ""))
+    stylesheet.parse()
+    assert len(list(tmp_path.glob("*.rules"))) == 1
+
+    def fail_parse(*args, **kwargs):
+        raise AssertionError("CSS should be read from the cache")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("textual.css.stylesheet.parse", fail_parse)
+        cached_stylesheet = Stylesheet(variables={"accent": "red"}, cache_path=tmp_path)
+        cached_stylesheet.add_source(css, read_from=("test.tcss", ""))
+        cached_stylesheet.parse()
+    node = DOMNode(classes="a")
+    cached_stylesheet.apply(node)
+    assert node.styles.color == Color(255, 0, 0)
+
+    changed_stylesheet = Stylesheet(variables={"accent": "blue"}, cache_path=tmp_path)
+    changed_stylesheet.add_source(css, read_from=("test.tcss", ""))
+    changed_stylesheet.parse()
+    changed_stylesheet.add_source(".a {color: green;}", read_from=("test.tcss", ""))
+    changed_stylesheet.parse()
+    assert len(list(tmp_path.glob("*.rules"))) == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="requires POSIX permissions")
+def test_stylesheet_cache_path_must_be_private(tmp_path, monkeypatch):
+    """Cached CSS isn't read from a directory which other users can write to."""
+    css = ".a {color: red;}"
+    stylesheet = Stylesheet(cache_path=tmp_path)
+    stylesheet.add_source(css, read_from=("test.tcss", ""))
+    stylesheet.parse()
+    assert len(list(tmp_path.glob("*.rules"))) == 1
+
+    tmp_path.chmod(0o777)
+    parsed = []
+
+    def record_parse(*args, **kwargs):
+        parsed.append(args)
+        return parse(*args, **kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr("textual.css.stylesheet.parse", record_parse)
+        cached_stylesheet = Stylesheet(cache_path=tmp_path)
+        cached_stylesheet.add_source(css, read_from=("test.tcss", ""))
+        cached_stylesheet.parse()
+    assert parsed
+
+
+def test_stylesheet_cache_path_deletes_old_files(tmp_path, monkeypatch):
+    """The least recently used cache files are deleted when new files are written."""
+    monkeypatch.setattr("textual.css._parse_cache.MAX_CACHE_FILES", 3)
+    written = []
+    for index in range(5):
+        cache_files = set(tmp_path.glob("*.rules"))
+        stylesheet = Stylesheet(cache_path=tmp_path)
+        stylesheet.add_source(f".a{index} {{color: red;}}", read_from=("test.tcss", ""))
+        stylesheet.parse()
+        (new_file,) = set(tmp_path.glob("*.rules")) - cache_files
+        os.utime(new_file, (index, index))
+        written.append(new_file)
+    assert set(tmp_path.glob("*.rules")) == set(written[-3:])
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_stylesheet_cache_path_write_error(tmp_path, monkeypatch):
+    """A temporary file isn't left behind if the cache file can't be written."""
+
+    def fail_replace(*args):
+        raise OSError("replace failed")
+
+    monkeypatch.setattr("textual.css._parse_cache.os.replace", fail_replace)
+    stylesheet = Stylesheet(cache_path=tmp_path)
+    stylesheet.add_source(".a {color: red;}", read_from=("test.tcss", ""))
+    stylesheet.parse()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stylesheet_update_variables():
+    """Updating variables resolves declarations again, without parsing the CSS."""
+    css = """
+    $border: tall $primary;
+    .a {color: $primary; background: red;}
+    .b {border: $border; color: blue;}
+    .c {color: green; &:hover {background: $secondary 50%;}}
+    .d {color: yellow;}
+    """
+    stylesheet = Stylesheet(variables={"primary": "red", "secondary": "blue"})
+    stylesheet.add_source(css, read_from=("test.tcss", ""))
+    stylesheet.parse()
+
+    new_variables = {"primary": "lime", "secondary": "blue"}
+    expected_stylesheet = stylesheet.copy()
+    expected_stylesheet.set_variables(new_variables)
+    expected_stylesheet.parse()
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr("textual.css.stylesheet.parse", None)
+        updated_rules = stylesheet.update_variables(new_variables)
+
+    assert {rule.selector_set[0].css for rule in updated_rules} == {".a", ".b"}
+    assert [rule.styles.get_rules() for rule in stylesheet.rules] == [
+        rule.styles.get_rules() for rule in expected_stylesheet.rules
+    ]
+
+    updated_rules = stylesheet.update_variables({"primary": "lime", "secondary": "red"})
+    assert [rule.selector_set[0].css for rule in updated_rules] == [".c:hover"]
+    assert updated_rules[0].styles.background == Color(255, 0, 0, 0.5)
+
+
+def test_stylesheet_update_variables_invalid():
+    """If a variable is invalid, updating variables raises the parse error."""
+    stylesheet = Stylesheet(variables={"primary": "red"})
+    stylesheet.add_source(".a {color: $primary;}", read_from=("test.tcss", ""))
+    stylesheet.parse()
+
+    with pytest.raises(StylesheetParseError):
+        stylesheet.update_variables({"primary": "not-a-color"})
+
+
+def test_stylesheet_update_rules():
+    """Only nodes which may match the updated rules are updated."""
+    css = ".a {color: $primary;} .b {color: blue;}"
+    stylesheet = Stylesheet(variables={"primary": "red"})
+    stylesheet.add_source(css, read_from=("test.tcss", ""))
+    stylesheet.parse()
+    root = DOMNode(classes="a")
+    child = DOMNode(classes="b")
+    child._attach(root)
+    stylesheet.update(root)
+
+    updated_rules = stylesheet.update_variables({"primary": "lime"})
+    updated_nodes = []
+    apply = stylesheet.apply
+
+    def record_apply(node, *args, **kwargs):
+        updated_nodes.append(node)
+        apply(node, *args, **kwargs)
+
+    stylesheet.apply = record_apply
+    stylesheet.update_rules(root, updated_rules)
+
+    assert updated_nodes == [root]
+    assert root.styles.color == Color.parse("lime")
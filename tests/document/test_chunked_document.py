@@ -0,0 +1,67 @@
+import pytest
+
+from textual.document import _chunked_document
+from textual.widgets.text_area import ChunkedDocument, Document
+
+TEXT = """I must not fear.
+Fear is the mind-killer.
+Fear is the little-death that brings total obliteration.
+I will face my fear.
+"""
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    """Use small chunks so that edits span several chunks."""
+    monkeypatch.setattr(_chunked_document, "CHUNK_SIZE", 2)
+    monkeypatch.setattr(_chunked_document, "MAX_CHUNK_SIZE", 3)
+
+
+@pytest.mark.parametrize("text", [TEXT, TEXT.replace("\n", "\r\n"), "", "\n"])
+def test_text(text):
+    document = ChunkedDocument(text)
+    assert document.text == text
+    assert document.lines == Document(text).lines
+
+
+@pytest.mark.parametrize(
+    ["start", "end", "text"],
+    [
+        ((0, 0), (0, 0), "Hello"),
+        ((1, 4), (1, 4), "\n\n\n\n\n\n"),
+        ((0, 2), (3, 5), ""),
+        ((0, 2), (3, 5), "a\nb\nc\nd\ne\nf\ng"),
+        ((2, 0), (4, 0), "x"),
+        ((4, 0), (4, 0), "The end\n"),
+    ],
+)
+def test_replace_range(start, end, text):
+    document = ChunkedDocument(TEXT)
+    expected = Document(TEXT)
+    assert document.replace_range(start, end, text) == expected.replace_range(
+        start, end, text
+    )
+    assert document.text == expected.text
+    assert document.line_count == expected.line_count
+    assert document.end == expected.end
+    assert document[1:-1] == expected[1:-1]
+    assert document.get_text_range((0, 3), document.end) == expected.get_text_range(
+        (0, 3), expected.end
+    )
+
+
+def test_get_size():
+    document = ChunkedDocument(TEXT)
+    assert document.get_size(4) == Document(TEXT).get_size(4)
+    document.replace_range((4, 0), (4, 0), "\t\t💩")
+    document.replace_range((0, 0), (1, 0), "")
+    expected = Document(document.text)
+    assert document.get_size(4) == expected.get_size(4)
+    assert document.get_size(8) == expected.get_size(8)
+
+
+def test_index_out_of_range():
+    document = ChunkedDocument(TEXT)
+    assert document[-1] == ""
+    with pytest.raises(IndexError):
+        document[5]
@@ -0,0 +1,52 @@
+import pytest
+
+from textual.document._document import _utf8_encode
+from textual.document._syntax_aware_document import SyntaxAwareDocument
+
+TEXT = """\
+def hello(name):
+    print(f"héllo {name} 🐍")
+
+hello("world")
+"""
+
+
+def get_byte_offset(document: SyntaxAwareDocument, location: tuple[int, int]) -> int:
+    row, column = location
+    text_above = "".join(line + document.newline for line in document.lines[:row])
+    return len(_utf8_encode(text_above + document.lines[row][:column]))
+
+
+def get_nodes(node) -> list:
+    nodes = [(node.type, node.start_byte, node.end_byte)]
+    for child in node.children:
+        nodes.extend(get_nodes(child))
+    return nodes
+
+
+@pytest.mark.syntax
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+@pytest.mark.parametrize(
+    ["start", "end", "text"],
+    [
+        ((1, 4), (1, 4), "x = 'ü'\n    "),
+        ((1, 10), (1, 16), "🐍"),
+        ((0, 0), (2, 0), ""),
+        ((3, 0), (3, 14), "a\nb\nc"),
+        ((4, 0), (4, 0), "# end"),
+    ],
+)
+def test_location_to_byte_offset_after_edit(newline, start, end, text):
+    document = SyntaxAwareDocument(TEXT.replace("\n", newline), "python")
+    document.replace_range(start, end, text.replace("\n", newline))
+    for row, line in enumerate(document.lines):
+        for column in (0, len(line) // 2, len(line)):
+            location = (row, column)
+            assert document._location_to_byte_offset(location) == get_byte_offset(
+                document, location
+            )
+    # The incrementally parsed tree matches a tree parsed from scratch
+    parsed_document = SyntaxAwareDocument(document.text, "python")
+    assert get_nodes(document._syntax_tree.root_node) == get_nodes(
+        parsed_document._syntax_tree.root_node
+    )
@@ -202,3 +202,81 @@ def test_get_offsets_invalid_line_index(line_index):
 
     with pytest.raises(ValueError):
         wrapped_document.get_offsets(line_index)
+
+
+def test_lines_wrapped_when_queried():
+    document = Document(SIMPLE_TEXT)
+    wrapped_document = WrappedDocument(document, width=4)
+
+    assert wrapped_document.offset_to_line_info(1) == (0, 1)
+    assert wrapped_document._wrap_offsets[0] == [4]
+    assert wrapped_document._wrap_offsets[2] is None
+
+    assert wrapped_document.offset_to_line_info(6) == (2, 2)
+    assert wrapped_document.offset_to_line_info(7) == (3, 0)
+    assert wrapped_document.offset_to_line_info(8) is None
+    assert wrapped_document.height == 8
+
+
+def test_height_after_lines_are_wrapped():
+    document = Document("a bcde f\n" * 10)
+    wrapped_document = WrappedDocument(document, width=4)
+
+    # The height of lines which haven't been wrapped is estimated
+    assert wrapped_document.height == 21
+    wrapped_lines = wrapped_document.lines
+    assert wrapped_lines[0] == ["a ", "bcde", " f"]
+    assert wrapped_document.height == sum(len(line) for line in wrapped_lines)
+
+
+def test_height_estimate_expands_tabs_and_wide_characters():
+    document = Document("\t\tab\n💩💩💩💩\nabcdefgh")
+    wrapped_document = WrappedDocument(document, width=4, tab_width=4)
+
+    # Estimates use the cell length of lines, with tabs expanded
+    assert wrapped_document.height == 3 + 2 + 2
+    assert wrapped_document.height == sum(len(line) for line in wrapped_document.lines)
+
+    # Lines are measured again when the tab width changes
+    wrapped_document.wrap(4, tab_width=2)
+    assert wrapped_document.height == 2 + 2 + 2
+
+
+def test_wrap_uses_cached_cell_lengths():
+    """Wrapping at a new width estimates heights without reading the document."""
+
+    class CountingDocument(Document):
+        reads = 0
+
+        def __getitem__(self, line_index):
+            self.reads += 1
+            return super().__getitem__(line_index)
+
+    document = CountingDocument("\t\tab\n💩💩💩💩\nabcdefgh")
+    wrapped_document = WrappedDocument(document, width=4, tab_width=4)
+    reads = document.reads
+    wrapped_document.wrap(2)
+    assert wrapped_document.height == 5 + 4 + 4
+    wrapped_document.wrap(8)
+    assert wrapped_document.height == 2 + 1 + 1
+    assert document.reads == reads
+
+
+def test_location_to_offset_after_edits():
+    document = Document(SIMPLE_TEXT * 20)
+    wrapped_document = WrappedDocument(document, width=4)
+    assert wrapped_document.location_to_offset((30, 0)) == Offset(0, 70)
+
+    edit_result = document.replace_range((2, 0), (5, 3), "1 2 3 4 5\n6")
+    wrapped_document.wrap_range((2, 0), (5, 3), edit_result.end_location)
+
+    expected_document = WrappedDocument(Document(document.text), width=4)
+    expected_document.lines
+    for line_index in range(0, document.line_count, 7):
+        location = (line_index, 1)
+        offset = expected_document.location_to_offset(location)
+        # Lines above the location are wrapped when their offsets are queried
+        for y in range(offset.y + 1):
+            wrapped_document.offset_to_line_info(y)
+        assert wrapped_document.location_to_offset(location) == offset
+        assert wrapped_document.offset_to_location(offset) == location
@@ -0,0 +1,100 @@
+"""Test measuring the heights of options in an option list."""
+
+from __future__ import annotations
+
+from rich.table import Table
+
+from textual.app import App, ComposeResult
+from textual.widgets import OptionList
+from textual.widgets.option_list import Option, Separator
+
+
+class OptionListApp(App[None]):
+    """Test option list application."""
+
+    CSS = "OptionList { height: 10; }"
+
+    def __init__(self, *content: Option | Separator | str) -> None:
+        super().__init__()
+        self._content = content
+
+    def compose(self) -> ComposeResult:
+        yield OptionList(*self._content)
+
+
+async def test_single_line_options_are_not_rendered_to_measure() -> None:
+    """Options with a single line of text should be measured without rendering them."""
+    async with OptionListApp(*[str(n) for n in range(10_000)]).run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        assert option_list.virtual_size.height == 10_000
+        assert len(option_list._content_render_cache) < 20
+
+
+async def test_multi_line_options_are_measured_when_displayed() -> None:
+    """Options with several lines should be measured as they are displayed."""
+    prompts = [f"Option {n}\nSecond line" for n in range(100)]
+    async with OptionListApp(*prompts).run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        # The lines are estimated, and only the options in view have been measured
+        assert option_list.virtual_size.height == 2 * 100
+        assert sum(option_list._measured) < 20
+        assert option_list._get_option_span(0) == (0, 2)
+        assert option_list._get_option_span(99).line_count == 2
+
+        option_list.action_last()
+        await pilot.pause()
+        assert option_list.highlighted == 99
+        assert option_list.scroll_y == option_list.max_scroll_y
+        first, line_count = option_list._get_option_span(99)
+        assert first + line_count == option_list.virtual_size.height
+
+
+async def test_wrapped_options_are_estimated_from_their_width() -> None:
+    """Options which wrap should be estimated from their cell length."""
+    async with OptionListApp(*["hello world " * 20] * 100).run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        line_count = option_list._get_option_span(0).line_count
+        assert line_count > 1
+        assert option_list.virtual_size.height == line_count * 100
+
+
+async def test_renderable_options_are_measured() -> None:
+    """Options with renderables other than text should be measured up front."""
+    tables = [Table("Column") for _ in range(20)]
+    for table in tables:
+        table.add_row("Row")
+    async with OptionListApp(*[Option(table) for table in tables]).run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        assert all(option_list._measured)
+        assert option_list.virtual_size.height == 5 * 20
+
+
+async def test_separators_and_removal() -> None:
+    """Removing options should keep the lines and IDs of the other options."""
+    async with OptionListApp(
+        Option("zero", id="zero"),
+        Separator(),
+        Option("one\nline", id="one"),
+        Separator(),
+        Option("two", id="two"),
+        Option("three", id="three"),
+    ).run_test() as pilot:
+        option_list = pilot.app.query_one(OptionList)
+        await pilot.pause()
+        assert option_list.virtual_size.height == 7
+        assert option_list._get_option_span(2) == (5, 1)
+
+        option_list.remove_option("one")
+        await pilot.pause()
+        assert option_list.virtual_size.height == 5
+        assert option_list.get_option_index("two") == 1
+        assert option_list.get_option_index("three") == 2
+        assert option_list._get_option_span(1) == (3, 1)
+
+        option_list.remove_option("zero")
+        assert option_list.get_option_index("three") == 1
+        assert option_list.get_option("two").id == "two"
@@ -0,0 +1,164 @@
+from textual._compositor import Compositor, ScrollUpdate
+from textual.app import App, ComposeResult
+from textual.containers import Horizontal, VerticalScroll
+from textual.geometry import Region
+from textual.widgets import Log, Static
+
+
+class FrontBufferApp(App):
+    CSS = """
+    Static {
+        width: 20;
+        height: 1;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        yield Static("Hello, World")
+
+
+async def test_partial_update_skips_unchanged_content():
+    """A repaint which produces the same content should not write anything."""
+    app = FrontBufferApp()
+    async with app.run_test():
+        compositor = app.screen._compositor
+        compositor.render_update(full=True)
+        static = app.query_one(Static)
+
+        static.refresh()
+        compositor.update_widgets({static})
+        update = compositor.render_update()
+        assert update is not None
+        assert update.spans == []
+        assert update.render_segments(app.console) == ""
+
+
+async def test_partial_update_narrows_to_changed_cells():
+    """Only the changed cells should be included in an update."""
+    app = FrontBufferApp()
+    async with app.run_test():
+        compositor = app.screen._compositor
+        compositor.render_update(full=True)
+        static = app.query_one(Static)
+
+        static.update("Hello, Earth")
+        compositor.update_widgets({static})
+        update = compositor.render_update()
+        assert update is not None
+        assert update.spans == [(0, 7, 12)]
+        assert compositor._front_buffer[0].text.startswith("Hello, Earth ")
+
+
+async def test_front_buffer_reset_on_full_update():
+    app = FrontBufferApp()
+    async with app.run_test():
+        compositor = app.screen._compositor
+        compositor._front_buffer = None
+        compositor.render_update(full=True)
+        assert compositor._front_buffer is not None
+        assert len(compositor._front_buffer) == app.screen.size.height
+
+
+def _calculate_cuts(compositor: Compositor) -> list[list[int]]:
+    """Calculate cuts from scratch, for comparison with incremental cuts."""
+    width, height = compositor.size
+    cuts = [{0, width} for _ in range(height)]
+    for region, clip in compositor.visible_widgets.values():
+        x, y, region_width, region_height = region.intersection(clip)
+        if region_width and region_height:
+            for line_cuts in cuts[y : y + region_height]:
+                line_cuts.update((x, x + region_width))
+    return [sorted(line_cuts) for line_cuts in cuts]
+
+
+class ScrollingApp(App):
+    CSS = """
+    VerticalScroll {
+        width: 1fr;
+    }
+    #sidebar {
+        width: 10;
+    }
+    VerticalScroll Static {
+        width: 10;
+        height: 3;
+    }
+    VerticalScroll Static.odd {
+        width: 20;
+    }
+    """
+
+    def compose(self) -> ComposeResult:
+        with Horizontal():
+            yield Static("Sidebar", id="sidebar")
+            with VerticalScroll():
+                for index in range(100):
+                    yield Static(str(index), classes="odd" if index % 2 else "")
+
+
+async def test_cuts_updated_incrementally():
+    """Incrementally updated cuts should match cuts calculated from scratch."""
+    app = ScrollingApp()
+    async with app.run_test(size=(80, 24)) as pilot:
+        compositor = app.screen._compositor
+        assert compositor.cuts == _calculate_cuts(compositor)
+
+        scroll = app.query_one(VerticalScroll)
+        for _ in range(5):
+            scroll.scroll_relative(y=4, animate=False)
+            await pilot.pause()
+            assert compositor.cuts == _calculate_cuts(compositor)
+
+        app.query_one("#sidebar").styles.width = 15
+        await pilot.pause()
+        assert compositor.cuts == _calculate_cuts(compositor)
+
+        await pilot.resize_terminal(60, 20)
+        await pilot.pause()
+        assert compositor.cuts == _calculate_cuts(compositor)
+
+
+def test_scroll_update_render_segments():
+    update = ScrollUpdate([(Region(0, 2, 80, 10), 3)], [], [], [])
+    assert update.render_segments(None) == "\x1b[3;12r\x1b[3S\x1b[r"
+    update = ScrollUpdate([(Region(0, 0, 80, 10), -2)], [], [], [])
+    assert update.render_segments(None) == "\x1b[1;10r\x1b[2T\x1b[r"
+
+
+class LogApp(App):
+    def compose(self) -> ComposeResult:
+        yield Log()
+
+    def on_mount(self) -> None:
+        self.query_one(Log).write_lines(
+            [f"Line {index}" for index in range(100)], scroll_end=False
+        )
+
+
+async def test_scroll_uses_terminal_scroll():
+    """Scrolling a full width widget should scroll the terminal, and write only exposed lines."""
+    app = LogApp()
+    async with app.run_test(size=(40, 10)) as pilot:
+        await pilot.pause()
+        updates = []
+        app._display = lambda screen, update: updates.append(update)
+        compositor = app.screen._compositor
+        log = app.query_one(Log)
+
+        log.scroll_y = 3
+        await pilot.pause()
+
+        assert len(updates) == 1
+        update = updates[0]
+        assert isinstance(update, ScrollUpdate)
+        # Log is 9 lines high (last line is the horizontal scrollbar)
+        assert update.scrolls == [(Region(0, 0, 40, 9), 3)]
+        # Exposed lines, and the vertical scrollbar
+        assert {y for y, x1, x2 in update.spans if x2 - x1 == 40} == {6, 7, 8}
+        assert all(x1 >= 38 for y, x1, x2 in update.spans if y < 6)
+
+        # The front buffer should match the screen
+        assert [strip.text for strip in compositor._front_buffer] == [
+            strip.text for strip in compositor.render_strips()
+        ]
+        assert compositor._front_buffer[0].text.startswith("Line 3 ")
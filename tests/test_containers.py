@@ -8,7 +8,9 @@ from textual.containers import (
     Middle,
     Vertical,
     VerticalScroll,
+    VirtualScroll,
 )
+from textual.widget import Widget
 from textual.widgets import Label
 
 
@@ -119,3 +121,98 @@ async def test_scrollbar_zero_thickness():
     app = ScrollbarZero()
     async with app.run_test(size=(8, 6)):
         pass
+
+
+async def test_virtual_scroll():
+    """Check that `VirtualScroll` only mounts the items in view."""
+
+    created: list[int] = []
+
+    def make_item(index: int) -> Label:
+        created.append(index)
+        return Label(f"Item {index}" + "\n" * (index % 2))
+
+    class VirtualScrollApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield VirtualScroll(1000, make_item, overscan=2)
+
+    app = VirtualScrollApp()
+    async with app.run_test(size=(20, 10)) as pilot:
+        await pilot.pause()
+        virtual_scroll = app.query_one(VirtualScroll)
+        assert virtual_scroll.item_count == 1000
+        assert len(virtual_scroll.query(Label)) < 20
+        # Odd items are two lines high
+        assert virtual_scroll.virtual_size.height > 1000
+
+        virtual_scroll.scroll_to(y=500, animate=False)
+        await pilot.pause()
+        await pilot.pause()
+        virtual_scroll.scroll_to_item(340, animate=False)
+        await pilot.pause()
+        await pilot.pause()
+        # Measured heights above the item replace estimates, without moving the item
+        assert virtual_scroll.scroll_y == virtual_scroll.get_item_offset(340)
+        item = virtual_scroll.get_item(340)
+        assert item is not None
+        assert item.region.y == virtual_scroll.region.y
+        labels = virtual_scroll.query(Label)
+        assert len(labels) < 20
+        assert sorted(labels, key=lambda label: label.region.y) == list(labels)
+        assert virtual_scroll.get_item(0) is None
+
+        virtual_scroll.set_item_count(10)
+        await pilot.pause()
+        await pilot.pause()
+        assert virtual_scroll.item_count == 10
+        assert virtual_scroll.virtual_size.height == 15
+        assert virtual_scroll.get_item(9) is not None
+        assert len(virtual_scroll.query(Label)) <= 10
+
+
+async def test_virtual_scroll_recycle():
+    """Check that `VirtualScroll` recycles items scrolled out of view."""
+
+    created: list[int] = []
+
+    def make_item(index: int) -> Label:
+        created.append(index)
+        return Label(f"Item {index}")
+
+    def recycle_item(label: Widget, index: int) -> None:
+        assert isinstance(label, Label)
+        label.update(f"Item {index}")
+
+    class VirtualScrollApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield VirtualScroll(1000, make_item, recycle=recycle_item, overscan=2)
+
+    app = VirtualScrollApp()
+    async with app.run_test(size=(20, 10)) as pilot:
+        await pilot.pause()
+        virtual_scroll = app.query_one(VirtualScroll)
+        for y in range(0, 200, 5):
+            virtual_scroll.scroll_to(y=y, animate=False)
+            await pilot.pause()
+        assert len(created) < 20
+        item = virtual_scroll.get_item(199)
+        assert isinstance(item, Label)
+        assert str(item.renderable) == "Item 199"
+
+
+async def test_virtual_scroll_zero_estimated_height():
+    """Check that `VirtualScroll` mounts items with an estimated height of zero."""
+
+    class VirtualScrollApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield VirtualScroll(
+                100, lambda index: Label(f"{index}"), estimated_height=0
+            )
+
+    app = VirtualScrollApp()
+    async with app.run_test(size=(20, 10)) as pilot:
+        await pilot.pause()
+        virtual_scroll = app.query_one(VirtualScroll)
+        assert virtual_scroll.virtual_size.height == 100
+        assert virtual_scroll.get_item(0) is not None
+        assert 0 < len(virtual_scroll.query(Label)) < 20
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 from rich.panel import Panel
 from rich.text import Text
@@ -18,6 +20,7 @@ from textual.widgets.data_table import (
     ColumnDoesNotExist,
     ColumnKey,
     DuplicateKey,
+    ReadOnlyRows,
     Row,
     RowDoesNotExist,
     RowKey,
@@ -309,6 +312,29 @@ async def test_remove_row():
         assert len(table.rows) == 2
 
 
+async def test_remove_row_updates_row_positions():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_column("A", width=5)
+        table.add_row("a", key="a")
+        table.add_row("b\nb\nb", key="b", height=None)
+        table.add_row("c", key="c", height=2)
+        table.add_row("d", key="d")
+        await pilot.pause()
+        assert table.virtual_size.height == 1 + 1 + 3 + 2 + 1
+        assert table._get_offsets(3) == ("b", 1)
+        assert table._get_offsets(5) == ("c", 0)
+
+        table.remove_row("b")
+        assert table.get_row_index("d") == 2
+        assert table._get_offsets(2) == ("c", 0)
+        assert table._get_offsets(4) == ("d", 0)
+        with pytest.raises(LookupError):
+            table._get_offsets(5)
+        assert table._get_row_region(2).y == 1 + 1 + 2
+
+
 async def test_remove_row_and_update():
     """Regression test for https://github.com/Textualize/textual/issues/3470 -
     Crash when attempting to remove and update the same cell."""
@@ -1448,3 +1474,95 @@ async def test_clicking_border_link_doesnt_crash():
         # Test clicking the link in the border doesn't crash with KeyError: 'row'
         await pilot.click(DataTable, offset=(5, 0))
         assert app.link_clicked is True
+
+
+class NumbersSource:
+    """A data source with a million rows, which records the rows read."""
+
+    def __init__(self, row_count: int = 1_000_000) -> None:
+        self.row_count = row_count
+        self.requests: list[tuple[int, int]] = []
+
+    def get_rows(self, start: int, stop: int) -> list[list[str]]:
+        self.requests.append((start, stop))
+        return [[str(index), str(index * 2)] for index in range(start, stop)]
+
+
+async def test_data_source_reads_visible_rows():
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_columns("A", "B")
+        source = NumbersSource()
+        table.set_data_source(source, page_size=50)
+        await pilot.pause()
+
+        assert table.row_count == 1_000_000
+        assert table.virtual_size.height == 1_000_000 + 1
+        assert source.requests == [(0, 50)]
+        assert table.get_row_at(3) == ["3", "6"]
+        assert table.get_cell_at(Coordinate(3, 1)) == "6"
+        assert table.ordered_columns[1].content_width == 2
+
+        table.move_cursor(row=999_999)
+        await pilot.pause()
+        assert table.cursor_row == 999_999
+        assert source.requests[-1] == (999_950, 1_000_000)
+        assert len(source.requests) <= 4
+
+        with pytest.raises(ReadOnlyRows):
+            table.add_row("x", "y")
+        with pytest.raises(ReadOnlyRows):
+            table.sort()
+        with pytest.raises(ReadOnlyRows):
+            del table.rows[table.coordinate_to_cell_key(Coordinate(0, 0)).row_key]
+
+        source.row_count = 10
+        table.refresh_data_source()
+        assert table.cursor_row == 9
+        assert table.get_row_at(9) == ["9", "18"]
+
+        table.set_data_source(None)
+        assert table.row_count == 0
+        table.add_row("x", "y")
+        assert table.get_row_at(0) == ["x", "y"]
+
+
+async def test_clear_keeps_rows_mapping():
+    """Clearing a table without a data source clears the rows in place."""
+    app = DataTableApp()
+    async with app.run_test():
+        table = app.query_one(DataTable)
+        table.add_columns("A", "B")
+        table.add_row("x", "y")
+        rows = table.rows
+        table.clear()
+        assert rows == {}
+        assert table.rows is rows
+        table.add_row("z", "w")
+        assert len(rows) == 1
+
+
+async def test_async_data_source():
+    class AsyncSource:
+        row_count = 100
+
+        async def get_rows(self, start: int, stop: int) -> list[list[int]]:
+            await asyncio.sleep(0)
+            return [[index] for index in range(start, stop)]
+
+        def get_column_widths(self) -> list[int]:
+            return [8]
+
+    app = DataTableApp()
+    async with app.run_test() as pilot:
+        table = app.query_one(DataTable)
+        table.add_column("Number")
+        table.set_data_source(AsyncSource())
+        # Placeholder cells while the rows load
+        assert table.get_row_at(5) == [None]
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert table.get_row_at(5) == [5]
+        assert table.ordered_columns[0].content_width == 8
+        assert "5" in table.render_line(6).text
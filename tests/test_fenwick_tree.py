@@ -0,0 +1,82 @@
+from itertools import accumulate
+
+from textual._fenwick_tree import FenwickTree
+
+
+def check_sums(tree: FenwickTree, values: list[int]) -> None:
+    assert list(tree) == values
+    assert [tree.prefix_sum(index) for index in range(len(values) + 1)] == list(
+        accumulate(values, initial=0)
+    )
+    assert tree.total == sum(values)
+
+
+def test_prefix_sum():
+    tree = FenwickTree([3, 1, 4, 1, 5, 9, 2, 6])
+    check_sums(tree, [3, 1, 4, 1, 5, 9, 2, 6])
+    assert tree.prefix_sum(-1) == 0
+    assert tree.prefix_sum(100) == 31
+
+
+def test_empty():
+    tree = FenwickTree()
+    assert len(tree) == 0
+    assert tree.total == 0
+
+
+def test_set_value():
+    values = list(range(20))
+    tree = FenwickTree(values)
+    tree.prefix_sum(10)
+    tree[3] = 100
+    tree[15] = -5
+    tree[-1] = 7
+    values[3] = 100
+    values[15] = -5
+    values[-1] = 7
+    assert tree[3] == 100
+    check_sums(tree, values)
+
+
+def test_replace():
+    values = list(range(1, 30))
+    tree = FenwickTree(values)
+    check_sums(tree, values)
+
+    for start, stop, new_values in [
+        (2, 4, [10, 20]),
+        (5, 5, [1, 2, 3]),
+        (0, 7, []),
+        (20, 100, [8]),
+        (10, 11, [4, 4, 4, 4, 4, 4, 4, 4]),
+    ]:
+        tree.replace(start, stop, new_values)
+        values[start:stop] = new_values
+        # Sum only part of the tree, so that later edits apply to a partial tree
+        assert tree.prefix_sum(start + 1) == sum(values[: start + 1])
+        check_sums(tree, values)
+
+
+def test_find():
+    values = [3, 0, 1, 4, 0, 0, 2]
+    tree = FenwickTree(values)
+    totals = list(accumulate(values, initial=0))
+    for target in range(sum(values)):
+        index = tree.find(target)
+        assert totals[index] <= target < totals[index + 1]
+    assert tree.find(sum(values)) == len(values)
+    tree.replace(1, 3, [5])
+    assert tree.find(3) == 1
+    assert tree.find(8) == 2
+
+
+def test_find_repairs_lazily():
+    """Finding a value in a tree which isn't repaired gives the same result."""
+    values = [index % 3 for index in range(1000)]
+    totals = list(accumulate(values, initial=0))
+    for target in (0, 5, 100, 654, sum(values) - 1, sum(values)):
+        tree = FenwickTree(values)
+        index = tree.find(target)
+        assert index == len(values) or totals[index] <= target < totals[index + 1]
+        assert len(tree._tree) <= max(2 * (index + 1), 17)
+        check_sums(tree, values)
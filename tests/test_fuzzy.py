@@ -1,7 +1,7 @@
 from rich.style import Style
 from rich.text import Span
 
-from textual.fuzzy import Matcher
+from textual.fuzzy import FuzzyIndex, Matcher
 
 
 def test_match():
@@ -38,3 +38,34 @@ def test_highlight():
         Span(9, 10, Style(reverse=True)),
         Span(10, 11, Style(reverse=True)),
     ]
+
+
+def test_fuzzy_index_matches_matcher():
+    candidates = ["foo.bar", "egg", "foo egg.bar", "Foo", "foo .ba egg r", "bar"]
+    index = FuzzyIndex(candidates)
+    for query in ["f", "fo", "foo", "foo.bar", "FB", "b", "x", "eg"]:
+        matcher = Matcher(query)
+        expected = sorted(
+            (
+                (matcher.match(candidate), candidate_index)
+                for candidate_index, candidate in enumerate(candidates)
+                if matcher.match(candidate) > 0
+            ),
+            key=lambda match: (-match[0], match[1]),
+        )
+        assert index.search(query) == expected
+
+
+def test_fuzzy_index_limit():
+    index = FuzzyIndex(["a.b", "ab", "xab", "a..b", "b"])
+    assert index.search("ab", 2) == [(1.0, 1), (1.0, 2)]
+    assert index.search("ab") == [(1.0, 1), (1.0, 2), (1 - 1 / 4, 3), (1 - 1 / 3, 0)]
+    assert index.search("", 2) == [(1.0, 0), (1.0, 1)]
+
+
+def test_fuzzy_index_case_sensitive():
+    index = FuzzyIndex(["Foo", "foo", "ſ"], case_sensitive=True)
+    assert index.search("F") == [(1.0, 0)]
+    assert FuzzyIndex(["Foo", "foo"]).search("F") == [(1.0, 0), (1.0, 1)]
+    # Case insensitive matching of the long s
+    assert FuzzyIndex(["ſ"]).search("s") == [(1.0, 0)]
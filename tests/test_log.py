@@ -1,3 +1,6 @@
+import asyncio
+
+from textual.app import App, ComposeResult
 from textual.widgets import Log
 
 
@@ -6,3 +9,65 @@ def test_process_line():
     assert log._process_line("foo") == "foo"
     assert log._process_line("foo\t") == "foo     "
     assert log._process_line("\0foo") == "�foo"
+
+
+async def test_max_lines():
+    class LogApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Log(max_lines=3)
+
+    app = LogApp()
+    async with app.run_test() as pilot:
+        log = app.query_one(Log)
+        log.write_lines(["one", "two", "three", "four"])
+        assert list(log.lines) == ["two", "three", "four"]
+        await pilot.pause()
+        assert log.render_line(0).text.startswith("two")
+        log.write_line("five")
+        assert list(log.lines) == ["three", "four", "five"]
+        await pilot.pause()
+        assert log.render_line(0).text.startswith("three")
+        log.max_lines = 1
+        assert list(log.lines) == ["five"]
+        log.clear()
+        assert list(log.lines) == []
+
+
+async def test_write_stream():
+    class LogApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Log()
+
+    async def produce_lines():
+        for line_no in range(100):
+            yield f"line {line_no}"
+            if line_no % 10 == 0:
+                await asyncio.sleep(0)
+        yield b"bytes\n"
+
+    app = LogApp()
+    async with app.run_test() as pilot:
+        log = app.query_one(Log)
+        assert await log.write_stream(produce_lines()) == 101
+        assert await log.write_stream(["one", "two"]) == 2
+        assert log.lines[0] == "line 0"
+        assert log.lines[99] == "line 99"
+        assert list(log.lines[100:]) == ["bytes", "one", "two"]
+        await pilot.pause()
+        assert log.virtual_size.width == len("line 99")
+
+
+async def test_measure_lines_in_one_worker():
+    class LogApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield Log()
+
+    app = LogApp()
+    async with app.run_test() as pilot:
+        log = app.query_one(Log)
+        for line_no in range(50):
+            log.write_line("." * line_no)
+        assert len(app.workers) <= 1
+        await app.workers.wait_for_complete()
+        await pilot.pause()
+        assert log.virtual_size.width == 49
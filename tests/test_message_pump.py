@@ -143,3 +143,28 @@ async def test_prevent_with_call_next() -> None:
         app.call_next(app.change_input)
         await pilot.pause()
         assert hits == 2
+
+
+async def test_dispatch_table_cached() -> None:
+    """Handlers should be resolved from the MRO once per message type."""
+
+    class BaseWidget(Widget):
+        def on_key(self, event: Key) -> None:
+            pass
+
+    class SubWidget(BaseWidget):
+        def _on_key(self, event: Key) -> None:
+            pass
+
+    widget = SubWidget()
+    table = SubWidget._get_dispatch_table("on_key", Key)
+    assert [cls for cls, _ in table][:2] == [SubWidget, BaseWidget]
+    assert table[0][1] == [(SubWidget.__dict__["_on_key"], None)]
+    assert SubWidget._get_dispatch_table("on_key", Key) is table
+    # Cached on the class it was resolved for
+    assert "_dispatch_table" in BaseWidget.__dict__
+    assert ("on_key", Key) not in BaseWidget.__dict__["_dispatch_table"]
+
+    methods = list(widget._get_dispatch_methods("on_key", Key(key="x", character="x")))
+    assert methods[0] == (SubWidget, widget._on_key)
+    assert methods[1] == (BaseWidget, widget.on_key)
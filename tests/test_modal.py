@@ -1,7 +1,7 @@
 from textual.app import App, ComposeResult
 from textual.containers import Grid
 from textual.screen import ModalScreen
-from textual.widgets import Button, Footer, Header, Label
+from textual.widgets import Button, Footer, Header, Input, Label
 
 TEXT = """I must not fear.
 Fear is the mind-killer.
@@ -92,3 +92,45 @@ async def test_modal_pop_screen():
         # Check activating the quit button exits the app
         await pilot.press("enter")
         assert pilot.app._exit
+
+
+class InputScreen(ModalScreen):
+    def compose(self) -> ComposeResult:
+        yield Input()
+
+
+class BackgroundApp(App):
+    def compose(self) -> ComposeResult:
+        yield Label("Hello", id="greeting")
+        yield Label(TEXT)
+
+
+async def test_modal_background_is_cached():
+    """Regression test for the tinted background being rendered on every repaint."""
+    app = BackgroundApp()
+    async with app.run_test() as pilot:
+        base_screen = app.screen
+        await app.push_screen(InputScreen())
+        await pilot.pause()
+        assert base_screen._background_cache is not None
+        lines = base_screen._background_cache[2]
+        background = lines[:]
+        assert all(line is not None for line in background)
+
+        # Changes to the modal screen don't render the background again
+        await pilot.press("a", "b", "c")
+        assert app.query_one(Input).value == "abc"
+        assert base_screen._background_cache[2] is lines
+        assert all(line is old for line, old in zip(lines, background))
+
+        # Changes to the background screen only render the lines which changed
+        base_screen.query_one("#greeting", Label).update("World")
+        await pilot.pause()
+        assert base_screen._background_cache[2] is lines
+        assert "World" in lines[0].text
+        assert all(line is old for line, old in zip(lines[1:], background[1:]))
+
+        # The cache is discarded when the screen is no longer in the background
+        app.pop_screen()
+        await pilot.pause()
+        assert base_screen._background_cache is None
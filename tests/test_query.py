@@ -3,6 +3,8 @@ import pytest
 from textual.app import App, ComposeResult
 from textual.color import Color
 from textual.containers import Container
+from textual.css.match import match
+from textual.css.parse import parse_selectors
 from textual.css.query import (
     DeclarationError,
     InvalidQueryFormat,
@@ -10,6 +12,7 @@ from textual.css.query import (
     TooManyMatches,
     WrongType,
 )
+from textual.screen import Screen
 from textual.widget import Widget
 from textual.widgets import Input, Label
 
@@ -348,3 +351,90 @@ async def test_query_focus_blur():
         # Focus non existing
         app.query("#egg").focus()
         assert app.focused.id == "bar"
+
+
+async def test_query_index():
+    """Queries which use the screen's index match a walk of the DOM."""
+
+    class QueryApp(App[None]):
+        def compose(self) -> ComposeResult:
+            with Container(id="outer", classes="box"):
+                yield Label("one", id="one", classes="item")
+                with Container(classes="box"):
+                    for index in range(40):
+                        yield Label(f"{index}", classes="item many")
+                yield Label("two", id="two", classes="item")
+            yield Input(id="input")
+
+    def walk_query(node: Widget, selector: str) -> list[Widget]:
+        selector_sets = parse_selectors(selector)
+        return [
+            widget
+            for widget in node.walk_children(Widget)
+            if match(selector_sets, widget)
+        ]
+
+    app = QueryApp()
+    async with app.run_test():
+        outer = app.query_one("#outer")
+        selectors = [
+            "#one",
+            "#two",
+            ".item",
+            ".many",
+            "Label",
+            "Container .item",
+            "Container > #two",
+            "Label.item#one",
+            "#one, #two, Input",
+            ".box",
+            "#missing",
+        ]
+        for node in (app, app.screen, outer):
+            for selector in selectors:
+                assert list(node.query(selector)) == walk_query(node, selector)
+
+        assert app.query("#two")._get_indexed_nodes() == [app.query_one("#two")]
+        assert app.query("*")._get_indexed_nodes() is None
+        assert list(outer.query("#outer")) == []
+
+        # The index is updated when classes change
+        label = app.query_one("#one")
+        label.add_class("new")
+        assert list(app.query(".new")) == [label]
+        label.remove_class("item")
+        assert label not in app.query(".item")
+        label.toggle_class("new")
+        assert list(app.query(".new")) == []
+        label.set_classes("other")
+        assert app.query_one(".other") is label
+
+        # The index is updated when widgets are mounted and removed
+        new_label = Label("new", id="new", classes="item")
+        await outer.mount(new_label, before=0)
+        assert app.query(".item").first() is new_label
+        await new_label.remove()
+        assert list(app.query("#new")) == []
+        with pytest.raises(NoMatches):
+            app.query_one("#new")
+
+        await outer.remove()
+        assert list(app.query(".item")) == []
+        assert app.query_one("#input") is app.query_one(Input)
+
+
+async def test_query_index_attached_children():
+    """Children attached without being registered are added to the index."""
+    app = App()
+    app._set_active()
+    app.push_screen(Screen())
+    screen = app.screen
+
+    container = Container(Label(id="nested", classes="item"), id="container")
+    screen._add_children(container, Label(id="label"))
+    assert screen.query_one("#nested") is container.children[0]
+    assert list(screen.query(".item")) == [container.children[0]]
+    assert screen.query_one("#label").id == "label"
+
+    container._detach()
+    assert screen.query("#container")._get_indexed_nodes() == []
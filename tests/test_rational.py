@@ -0,0 +1,47 @@
+from fractions import Fraction
+
+import pytest
+
+from textual._rational import divide, exact, truncate
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (0.0, 0),
+        (3.0, 3),
+        (-2.0, -2),
+        (0.5, Fraction(1, 2)),
+        (Fraction(6, 3), 2),
+        (Fraction(1, 3), Fraction(1, 3)),
+    ],
+)
+def test_exact(value, expected):
+    result = exact(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "numerator,denominator,expected",
+    [
+        (10, 5, 2),
+        (10, 4, Fraction(5, 2)),
+        (Fraction(1, 2), 2, Fraction(1, 4)),
+        (3, Fraction(1, 2), 6),
+        (Fraction(3, 2), Fraction(1, 2), 3),
+        (Fraction(-3, 2), Fraction(1, 4), -6),
+    ],
+)
+def test_divide(numerator, denominator, expected):
+    result = divide(numerator, denominator)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+@pytest.mark.parametrize(
+    "numerator,denominator",
+    [(7, 2), (-7, 2), (6, 3), (-6, 3), (0, 5), (1, 3), (-1, 3)],
+)
+def test_truncate(numerator, denominator):
+    assert truncate(numerator, denominator) == int(Fraction(numerator, denominator))
@@ -46,6 +46,25 @@ def test_resolve_empty():
             1,
             [(0, 3), (4, 46), (51, 47), (99, 1)],
         ),
+        (
+            ["1fr", "1fr", "1fr"],
+            100,
+            1,
+            [(0, 32), (33, 33), (67, 33)],
+        ),
+        (
+            ["25%", "1fr", "1.5fr"],
+            100,
+            1,
+            [(0, 10), (11, 35), (47, 53)],
+        ),
+        (
+            # Fraction units which aren't exact floats still fill the total
+            ["1fr", "0.3fr"],
+            122,
+            3,
+            [(0, 91), (94, 28)],
+        ),
     ],
 )
 def test_resolve(scalars, total, gutter, result):
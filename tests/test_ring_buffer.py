@@ -0,0 +1,98 @@
+import pytest
+
+from textual._ring_buffer import RingBuffer
+
+
+def test_unbounded():
+    buffer = RingBuffer([1, 2, 3])
+    buffer.append(4)
+    buffer.extend([5, 6])
+    assert len(buffer) == 6
+    assert list(buffer) == [1, 2, 3, 4, 5, 6]
+    assert buffer.offset == 0
+    assert buffer.maxlen is None
+
+
+def test_discard_oldest():
+    buffer = RingBuffer(range(5), maxlen=3)
+    assert list(buffer) == [2, 3, 4]
+    assert buffer.offset == 2
+    buffer.append(5)
+    assert list(buffer) == [3, 4, 5]
+    assert buffer.offset == 3
+    buffer.extend(range(6, 11))
+    assert list(buffer) == [8, 9, 10]
+    assert buffer.offset == 8
+
+
+def test_index():
+    buffer = RingBuffer(range(5), maxlen=3)
+    assert buffer[0] == 2
+    assert buffer[2] == 4
+    assert buffer[-1] == 4
+    assert buffer[-3] == 2
+    with pytest.raises(IndexError):
+        buffer[3]
+    with pytest.raises(IndexError):
+        buffer[-4]
+
+
+def test_slice():
+    buffer = RingBuffer(range(5), maxlen=3)
+    assert buffer[:] == [2, 3, 4]
+    assert buffer[1:] == [3, 4]
+    assert buffer[-2:] == [3, 4]
+    assert buffer[::-1] == [4, 3, 2]
+    assert buffer[1:2] == [3]
+
+
+def test_set_item():
+    buffer = RingBuffer(range(5), maxlen=3)
+    buffer[-1] += 10
+    buffer[0] = 100
+    assert list(buffer) == [100, 3, 14]
+
+
+def test_equality():
+    assert RingBuffer(range(5), maxlen=3) == [2, 3, 4]
+    assert RingBuffer(range(5), maxlen=3) == RingBuffer([2, 3, 4])
+    assert RingBuffer([1]) != [2]
+
+
+def test_zero_maxlen():
+    buffer = RingBuffer([1, 2], maxlen=0)
+    assert len(buffer) == 0
+    assert buffer.offset == 2
+    buffer.append(3)
+    assert list(buffer) == []
+    assert buffer.offset == 3
+
+
+def test_set_maxlen():
+    buffer = RingBuffer(range(5), maxlen=4)
+    buffer.append(5)
+    buffer.maxlen = 2
+    assert list(buffer) == [4, 5]
+    assert buffer.offset == 4
+    buffer.maxlen = None
+    buffer.extend([6, 7])
+    assert list(buffer) == [4, 5, 6, 7]
+    assert buffer.offset == 4
+
+
+def test_clear():
+    buffer = RingBuffer(range(5), maxlen=3)
+    buffer.clear()
+    assert len(buffer) == 0
+    assert not buffer
+    assert buffer.offset == 0
+    buffer.extend([1, 2])
+    assert list(buffer) == [1, 2]
+
+
+def test_sequence_methods():
+    buffer = RingBuffer(range(5), maxlen=3)
+    assert 3 in buffer
+    assert 1 not in buffer
+    assert buffer.index(4) == 2
+    assert list(reversed(buffer)) == [4, 3, 2]
@@ -0,0 +1,118 @@
+import pytest
+
+from textual._row_index import RowIndex
+
+
+@pytest.fixture
+def row_index():
+    return RowIndex([("a", 1), ("b", 2), ("c", 0), ("d", 3)])
+
+
+def test_keys(row_index):
+    assert len(row_index) == 4
+    assert list(row_index) == ["a", "b", "c", "d"]
+    assert "c" in row_index
+    assert "z" not in row_index
+    assert row_index.get("d") == 3
+    assert row_index.get("z") is None
+    assert row_index.get_key(1) == "b"
+    assert row_index.get_key(4) is None
+    assert row_index.get_key(-1) is None
+
+
+def test_lines(row_index):
+    assert row_index.total_height == 6
+    assert [row_index.get_line(index) for index in range(5)] == [0, 1, 3, 3, 6]
+    assert [row_index.get_row_at_line(y) for y in range(6)] == [
+        (0, 0),
+        (1, 0),
+        (1, 1),
+        (3, 0),
+        (3, 1),
+        (3, 2),
+    ]
+    with pytest.raises(LookupError):
+        row_index.get_row_at_line(6)
+    with pytest.raises(LookupError):
+        row_index.get_row_at_line(-1)
+
+
+def test_append(row_index):
+    assert row_index.total_height == 6
+    assert row_index.append("e", 2) == 4
+    assert row_index.get("e") == 4
+    assert row_index.total_height == 8
+    assert row_index.get_row_at_line(7) == (4, 1)
+
+
+def test_remove(row_index):
+    assert row_index.total_height == 6
+    assert row_index.remove("b") == 1
+    assert list(row_index) == ["a", "c", "d"]
+    assert "b" not in row_index
+    assert row_index.get("d") == 2
+    assert row_index.get("c") == 1
+    assert row_index.total_height == 4
+    assert row_index.get_row_at_line(1) == (2, 0)
+    with pytest.raises(KeyError):
+        row_index.remove("b")
+
+
+def test_set_height(row_index):
+    assert row_index.total_height == 6
+    row_index.set_height(2, 5)
+    assert row_index.get_height(2) == 5
+    assert row_index.total_height == 11
+    assert row_index.get_line(3) == 8
+    assert row_index.get_row_at_line(3) == (2, 0)
+
+
+def test_matches_brute_force():
+    row_index = RowIndex()
+    rows = []
+    for number in range(200):
+        key = f"row{number}"
+        height = number % 4
+        row_index.append(key, height)
+        rows.append((key, height))
+        if number % 7 == 3:
+            remove_key = rows.pop(len(rows) // 2)[0]
+            row_index.remove(remove_key)
+        if number % 11 == 5:
+            row_index.set_height(len(rows) // 3, 2)
+            rows[len(rows) // 3] = (rows[len(rows) // 3][0], 2)
+        if number % 5 == 0:
+            middle = len(rows) // 2
+            assert row_index.get(rows[middle][0]) == middle
+            assert row_index.get_line(middle) == sum(
+                height for _, height in rows[:middle]
+            )
+
+    assert list(row_index) == [key for key, _ in rows]
+    for index, (key, _) in enumerate(rows):
+        assert row_index.get(key) == index
+    lines = [
+        (index, offset)
+        for index, (_, height) in enumerate(rows)
+        for offset in range(height)
+    ]
+    assert row_index.total_height == len(lines)
+    assert [row_index.get_row_at_line(y) for y in range(len(lines))] == lines
+
+
+def test_streaming_drop_oldest():
+    """Removing the oldest row while appending new rows keeps the index correct."""
+    row_count = 100
+    row_index = RowIndex((number, number % 3 + 1) for number in range(row_count))
+    for number in range(row_count, 5000):
+        oldest = number - row_count
+        assert row_index.remove(oldest) == 0
+        assert row_index.append(number, number % 3 + 1) == row_count - 1
+        assert row_index.get(number) == row_count - 1
+        assert row_index.get_key(0) == oldest + 1
+        last_line = row_index.total_height - 1
+        assert row_index.get_row_at_line(last_line) == (row_count - 1, number % 3)
+        assert row_index.get_line(row_count - 1) == last_line - number % 3
+    assert len(row_index) == row_count
+    assert list(row_index) == list(range(5000 - row_count, 5000))
+    assert len(row_index._slot_keys) < 2 * row_count + 1024
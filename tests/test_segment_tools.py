@@ -1,7 +1,13 @@
 from rich.segment import Segment
 from rich.style import Style
 
-from textual._segment_tools import align_lines, line_crop, line_pad, line_trim
+from textual._segment_tools import (
+    align_lines,
+    line_crop,
+    line_diff,
+    line_pad,
+    line_trim,
+)
 from textual.geometry import Size
 
 
@@ -113,6 +119,34 @@ def test_line_pad():
     assert line_pad(segments, 0, 0, style) == segments
 
 
+def test_line_diff_identical():
+    bold = Style(bold=True)
+    segments = [Segment("Hello", bold), Segment(" World", None)]
+    assert line_diff(segments, list(segments), 11) is None
+
+
+def test_line_diff_segments():
+    bold = Style(bold=True)
+    italic = Style(italic=True)
+    old = [Segment("Hello", bold), Segment(" ", None), Segment("World", italic)]
+    new = [Segment("Hello", bold), Segment(" ", None), Segment("World", bold)]
+    assert line_diff(old, new, 11) == (6, 11)
+
+
+def test_line_diff_characters():
+    bold = Style(bold=True)
+    old = [Segment("[", None), Segment("Progress: 45%", bold), Segment("]", None)]
+    new = [Segment("[", None), Segment("Progress: 46%", bold), Segment("]", None)]
+    assert line_diff(old, new, 15) == (12, 13)
+
+
+def test_line_diff_wide_characters():
+    old = [Segment("ab💩cd", None)]
+    new = [Segment("ab💩ce", None)]
+    # Not ASCII, so the whole segment is considered changed
+    assert line_diff(old, new, 6) == (0, 6)
+
+
 def test_align_lines_vertical_middle():
     """Regression test for an issue found while working on
     https://github.com/Textualize/textual/issues/3628 - an extra vertical line
@@ -196,3 +196,33 @@ def test_text():
     assert Strip([]).text == ""
     assert Strip([Segment("foo")]).text == "foo"
     assert Strip([Segment("foo"), Segment("bar")]).text == "foobar"
+
+
+def test_caches_created_on_demand() -> None:
+    strip = Strip([Segment("Hello, World!")], 13)
+    assert strip._crop_cache is None
+    assert strip._divide_cache is None
+    assert strip._style_cache is None
+
+    cropped = strip.crop(0, 5)
+    assert cropped.text == "Hello"
+    assert strip._crop_cache is not None
+    assert strip.crop(0, 5) is cropped
+    assert strip._divide_cache is None
+
+
+def test_strip_memory() -> None:
+    """Benchmark the memory used by strips that are never cropped, divided etc."""
+    import tracemalloc
+
+    segments = [Segment("Hello, World!")]
+    tracemalloc.start()
+    try:
+        start_memory, _ = tracemalloc.get_traced_memory()
+        strips = [Strip(segments, 13) for _ in range(10_000)]
+        end_memory, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(strips) == 10_000
+    bytes_per_strip = (end_memory - start_memory) / 10_000
+    assert bytes_per_strip < 300
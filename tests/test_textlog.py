@@ -1,5 +1,6 @@
 from rich.text import Text
 
+from textual.app import App, ComposeResult
 from textual.widgets import RichLog
 
 
@@ -9,3 +10,47 @@ def test_make_renderable_expand_tabs():
     renderable = text_log._make_renderable("\tfoo")
     assert isinstance(renderable, Text)
     assert renderable.plain == "        foo"
+
+
+async def test_max_lines():
+    class RichLogApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield RichLog(max_lines=3)
+
+    app = RichLogApp()
+    async with app.run_test() as pilot:
+        rich_log = app.query_one(RichLog)
+        for word in ["one", "two", "three", "four"]:
+            rich_log.write(word)
+        assert [line.text.rstrip() for line in rich_log.lines] == [
+            "two",
+            "three",
+            "four",
+        ]
+        assert rich_log._lines.offset == 1
+        await pilot.pause()
+        assert rich_log.render_line(0).text.startswith("two")
+        rich_log.clear()
+        assert len(rich_log.lines) == 0
+        assert rich_log._lines.offset == 0
+
+
+async def test_lines_is_the_ring_buffer():
+    class RichLogApp(App[None]):
+        def compose(self) -> ComposeResult:
+            yield RichLog(max_lines=2)
+
+    app = RichLogApp()
+    async with app.run_test():
+        rich_log = app.query_one(RichLog)
+        for word in ["one", "two", "three"]:
+            rich_log.write(word)
+        lines = rich_log.lines
+        # The lines aren't copied
+        assert lines is rich_log.lines
+        assert len(lines) == 2
+        assert [line.text.rstrip() for line in lines] == ["two", "three"]
+        assert lines[-1].text.rstrip() == "three"
+        # Assigning replaces the lines
+        rich_log.lines = rich_log.lines[1:]
+        assert [line.text.rstrip() for line in rich_log.lines] == ["three"]
@@ -10,7 +10,7 @@ import pytest
 
 from textual.app import App, ComposeResult
 from textual.widgets import TextArea
-from textual.widgets.text_area import EditResult, Selection
+from textual.widgets.text_area import ChunkedDocument, EditResult, Selection
 
 TEXT = """\
 I must not fear.
@@ -569,3 +569,19 @@ async def test_edits_on_read_only_mode():
 
         text_area.delete((0, 0), (0, 2))
         assert text_area.text == "X56789"
+
+
+async def test_edit_chunked_document():
+    """A ChunkedDocument can be loaded and edited in a TextArea."""
+    app = TextAreaApp()
+    async with app.run_test():
+        text_area = app.query_one(TextArea)
+        text_area.load_document(ChunkedDocument(TEXT))
+        assert isinstance(text_area.document, ChunkedDocument)
+        text_area.insert("Hello\n", location=(1, 0))
+        text_area.delete((3, 0), (4, 0))
+        assert text_area.text == (
+            "I must not fear.\nHello\nFear is the mind-killer.\nI will face my fear.\n"
+        )
+        text_area.undo()
+        assert text_area.text == "I must not fear.\nHello\n" + TEXT.split("\n", 1)[1]
@@ -0,0 +1,159 @@
+import pytest
+
+from textual.app import App, ComposeResult
+from textual.widgets import TextArea
+from textual.widgets._text_area import _number_query_patterns
+
+TEXT = '''\
+import os
+
+
+def hello(name):
+    # Say hello
+    message = f"hello {name}"
+    print(message)
+    return len(message)
+
+
+class Greeter:
+    def greet(self):
+        hello("world")
+
+
+DOCS = """
+def not_code(): pass
+"""
+'''
+
+
+class HighlightApp(App):
+    def compose(self) -> ComposeResult:
+        yield TextArea(TEXT, language="python")
+
+
+def get_all_highlights(text_area: TextArea) -> dict:
+    return {
+        line_index: text_area._get_line_highlights(line_index)
+        for line_index in range(text_area.document.line_count)
+    }
+
+
+def get_expected_highlights(text_area: TextArea) -> dict:
+    """Get the highlights from a query of the whole document."""
+    text_area._build_highlight_map()
+    text_area._build_line_highlights(0, text_area.document.line_count)
+    return get_all_highlights(text_area)
+
+
+@pytest.mark.syntax
+@pytest.mark.parametrize(
+    ["start", "end", "text"],
+    [
+        ((4, 4), (4, 4), "x = 1\n    "),
+        ((5, 14), (5, 19), "goodbye"),
+        ((1, 0), (1, 0), '"""\n'),
+        ((3, 0), (6, 0), ""),
+        ((10, 0), (12, 0), "def f():\n    pass\n\n\n"),
+        ((0, 0), (13, 0), ""),
+        ((15, 7), (15, 10), "1"),
+        ((15, 7), (15, 7), "1 #"),
+    ],
+)
+async def test_highlights_after_edit(start, end, text):
+    app = HighlightApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        # Highlight every line before the edit
+        get_all_highlights(text_area)
+        text_area.replace(text, start, end)
+        await pilot.pause()
+        highlights = get_all_highlights(text_area)
+        assert highlights == get_expected_highlights(text_area)
+
+
+@pytest.mark.syntax
+async def test_highlights_only_visible_lines():
+    class TallApp(App):
+        def compose(self) -> ComposeResult:
+            yield TextArea(TEXT * 100, language="python")
+
+    app = TallApp()
+    async with app.run_test() as pilot:
+        text_area = app.query_one(TextArea)
+        await pilot.pause()
+        highlighted_lines = len(text_area._highlights)
+        assert 0 < highlighted_lines < text_area.document.line_count
+        text_area.insert("x = 1\n", (0, 0))
+        await pilot.pause()
+        assert len(text_area._highlights) <= highlighted_lines + 1
+
+
+BROKEN_TEXT = """\
+def f(x):
+    return [x, {1[: (2,
+ 3)}]
+
+class A(B):
+    y = ('a' + "b"
+def f(x):
+    return [x, {1: (2,
+ 3)}]
+
+class A(B):
+    y = 'a' + "b"
+"""
+
+
+@pytest.mark.syntax
+async def test_highlights_order_does_not_depend_on_query_range():
+    """Overlapping highlights, such as errors, keep their order in any query range."""
+
+    class BrokenApp(App):
+        def compose(self) -> ComposeResult:
+            yield TextArea(BROKEN_TEXT, language="python")
+
+    app = BrokenApp()
+    async with app.run_test():
+        text_area = app.query_one(TextArea)
+        expected = get_expected_highlights(text_area)
+        line_count = text_area.document.line_count
+        assert any(
+            start == other_start and name != other_name
+            for line_highlights in expected.values()
+            for start, _, name in line_highlights
+            for other_start, _, other_name in line_highlights
+        )
+        for start_row in range(line_count):
+            for window in (1, 5, 12):
+                text_area._build_highlight_map()
+                text_area._build_line_highlights(start_row, start_row + window)
+                for row in range(start_row, min(start_row + window, line_count)):
+                    assert text_area._highlights[row] == expected[row]
+
+
+def test_number_query_patterns():
+    query = """\
+; Comment with @not_a_capture
+(identifier) @variable
+((identifier) @constant
+ (#match? @constant "^[A-Z_@]+$"))
+"def" @keyword
+[
+  "(" ")"
+] @punctuation.bracket
+(call function: (_) @function.call)
+"""
+    assert (
+        _number_query_patterns(query)
+        == """\
+; Comment with @not_a_capture
+(identifier) @0.variable
+((identifier) @1.constant
+ (#match? @1.constant "^[A-Z_@]+$"))
+"def" @2.keyword
+[
+  "(" ")"
+] @3.punctuation.bracket
+(call function: (_) @4.function.call)
+"""
+    )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+import time
 from pathlib import Path
 
 from rich.text import Text
@@ -201,3 +203,63 @@ async def test_directory_tree_reloading_preserves_state(tmp_path: Path) -> None:
         directory_tree.clear_node(directory_tree.root)
         await pilot.pause()
         assert not directory_tree.root.children
+
+
+async def test_directory_tree_reload_keeps_existing_nodes(tmp_path: Path) -> None:
+    """Reloading should only add and remove nodes for entries which have changed."""
+
+    subdir = tmp_path / "subdir"
+    subdir.mkdir()
+    (subdir / "log.txt").touch()
+    (tmp_path / "hello.txt").touch()
+
+    async with DirectoryTreeApp(tmp_path).run_test() as pilot:
+        tree = pilot.app.query_one(DirectoryTree)
+        await pilot.pause()
+        node = tree.root.children[0]
+        assert node.label == Text("subdir")
+        node.expand()
+        await pilot.pause()
+        assert [child.label for child in node.children] == [Text("log.txt")]
+
+        (tmp_path / "hello.txt").unlink()
+        (tmp_path / "world.txt").touch()
+        (tmp_path / "another").mkdir()
+        (subdir / "new.txt").touch()
+        await tree.reload()
+        await pilot.pause()
+
+        assert [child.label for child in tree.root.children] == [
+            Text("another"),
+            Text("subdir"),
+            Text("world.txt"),
+        ]
+        assert tree.root.children[1] is node
+        assert node.is_expanded
+        assert [child.label for child in node.children] == [
+            Text("log.txt"),
+            Text("new.txt"),
+        ]
+        assert [child.line for child in tree.root.children] == [1, 2, 5]
+
+
+async def test_directory_tree_caches_listings(tmp_path: Path) -> None:
+    """Listings should be cached until the directory is modified."""
+
+    (tmp_path / "hello.txt").touch()
+    # Make the directory look older, so its listing may be cached.
+    os.utime(tmp_path, (time.time() - 60, time.time() - 60))
+
+    async with DirectoryTreeApp(tmp_path).run_test() as pilot:
+        tree = pilot.app.query_one(DirectoryTree)
+        await pilot.pause()
+        assert [child.label for child in tree.root.children] == [Text("hello.txt")]
+        assert tree._listing_cache.get(tmp_path) is not None
+
+        (tmp_path / "world.txt").touch()
+        await tree.reload()
+        await pilot.pause()
+        assert [child.label for child in tree.root.children] == [
+            Text("hello.txt"),
+            Text("world.txt"),
+        ]
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from textual.app import App, ComposeResult
+from textual.widgets import Tree
+from textual.widgets.tree import TreeNode
+
+
+class TreeApp(App[None]):
+    def compose(self) -> ComposeResult:
+        yield Tree[None]("Root")
+
+
+def get_displayed_nodes(tree: Tree[None]) -> list[TreeNode[None]]:
+    """Walk the tree to get the displayed nodes, in order."""
+    nodes: list[TreeNode[None]] = []
+
+    def add_node(node: TreeNode[None]) -> None:
+        nodes.append(node)
+        if node.is_expanded:
+            for child in node.children:
+                add_node(child)
+
+    if tree.show_root:
+        add_node(tree.root)
+    else:
+        for child in tree.root.children:
+            add_node(child)
+    return nodes
+
+
+def check_lines(tree: Tree[None]) -> None:
+    """Check the line index against the displayed nodes."""
+    nodes = get_displayed_nodes(tree)
+    assert tree.last_line == len(nodes) - 1
+    for line, node in enumerate(nodes):
+        assert node.line == line
+        assert tree.get_node_at_line(line) is node
+    assert tree.get_node_at_line(len(nodes)) is None
+
+
+async def test_tree_lines_update_incrementally() -> None:
+    """Lines and node positions should follow expanding, collapsing, adding and removing."""
+    async with TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(Tree)
+        tree.root.expand()
+        fruits = tree.root.add("Fruits", expand=True)
+        apple = fruits.add_leaf("Apple")
+        fruits.add_leaf("Banana")
+        vegetables = tree.root.add("Vegetables")
+        vegetables.add_leaf("Carrot")
+        await pilot.pause()
+        check_lines(tree)
+        assert tree.virtual_size.height == 5
+
+        vegetables.expand()
+        await pilot.pause()
+        check_lines(tree)
+        assert vegetables.children[0].line == 5
+
+        fruits.collapse()
+        await pilot.pause()
+        check_lines(tree)
+        assert apple.line == -1
+
+        fruits.expand()
+        apple.remove()
+        await pilot.pause()
+        check_lines(tree)
+        assert apple.line == -1
+
+        fruits.add_leaf("Apricot", before=0)
+        await pilot.pause()
+        check_lines(tree)
+        assert [str(child.label) for child in fruits.children] == ["Apricot", "Banana"]
+
+        tree.show_root = False
+        await pilot.pause()
+        check_lines(tree)
+        assert tree.root.line == -1
+
+
+async def test_tree_virtual_width() -> None:
+    """The virtual width should be the widest displayed line."""
+    async with TreeApp().run_test() as pilot:
+        tree = pilot.app.query_one(Tree)
+        tree.root.expand()
+        node = tree.root.add("Node", expand=True)
+        wide = node.add_leaf("W" * 100)
+        await pilot.pause()
+        # Guides, label prefix and label
+        wide_line_width = 2 + 2 * tree.guide_depth + 100
+        assert tree.virtual_size.width == wide_line_width
+
+        node.collapse()
+        await pilot.pause()
+        assert tree.virtual_size.width < wide_line_width
+
+        node.expand()
+        wide.set_label("W" * 120)
+        await pilot.pause()
+        assert tree.virtual_size.width == wide_line_width + 20
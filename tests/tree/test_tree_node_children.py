@@ -32,3 +32,14 @@ def test_tree_node_children() -> None:
         del tree.root.children[0]
     with pytest.raises(TypeError):
         del tree.root.children[0:2]
+
+
+def test_tree_node_add_before() -> None:
+    """It should be possible to add a node before an existing child."""
+    tree = Tree[None]("Root")
+    tree.root.add("b")
+    tree.root.add("d")
+    tree.root.add("a", before=0)
+    tree.root.add("c", before=2)
+    tree.root.add("e", before=10)
+    assert [label_of(node) for node in tree.root.children] == ["a", "b", "c", "d", "e"]
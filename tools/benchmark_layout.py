@@ -0,0 +1,102 @@
+"""
+Benchmark the arrangement of deep and wide widget trees.
+
+This mounts a wide grid of widgets, a wide vertical container of containers, and a
+deep chain of nested containers, then arranges every container over a range of
+widths, as happens when the terminal is resized.
+
+Run with:
+
+    python tools/benchmark_layout.py [--profile]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import pstats
+import sys
+from time import perf_counter
+
+from textual.app import App, ComposeResult
+from textual.containers import Container, Grid, Vertical
+from textual.geometry import Size
+from textual.widget import Widget
+from textual.widgets import Label
+
+WIDGET_COUNT = 1000
+"""Number of widgets in the grid, and in the vertical container."""
+DEPTH = 20
+"""Number of nested containers in the deep tree."""
+WIDTHS = range(150, 200)
+"""Widths to arrange the containers at."""
+HEIGHT = 60
+"""Height to arrange the containers at."""
+
+
+class LayoutBenchmarkApp(App[None]):
+    CSS = """
+    Grid { grid-size: 25; grid-columns: 1fr 2fr; }
+    Label { width: 1fr; height: 1fr; }
+    .nested { height: auto; padding: 0 1; }
+    """
+
+    def compose(self) -> ComposeResult:
+        with Grid():
+            for index in range(WIDGET_COUNT):
+                yield Label(str(index))
+        with Vertical(id="wide"):
+            for index in range(WIDGET_COUNT):
+                with Vertical():
+                    yield Label(str(index))
+        yield self._nest(DEPTH)
+
+    def _nest(self, depth: int) -> Widget:
+        """Build a chain of nested containers.
+
+        Args:
+            depth: Number of containers.
+
+        Returns:
+            The outermost container.
+        """
+        widget: Widget = Label("leaf")
+        for index in range(depth):
+            widget = Container(Label(str(index)), widget, classes="nested")
+        return widget
+
+
+def arrange_all(containers: list[Widget]) -> None:
+    """Arrange the children of each container, at each width.
+
+    Args:
+        containers: Containers to arrange.
+    """
+    for width in WIDTHS:
+        size = Size(width, HEIGHT)
+        for container in containers:
+            container._layout.arrange(container, list(container.children), size)
+
+
+async def main() -> None:
+    app = LayoutBenchmarkApp()
+    async with app.run_test(size=(WIDTHS[-1], HEIGHT)) as pilot:
+        await pilot.pause()
+        containers = [
+            widget for widget in app.screen.walk_children(Widget) if widget.children
+        ]
+        start = perf_counter()
+        arrange_all(containers)
+        elapsed = perf_counter() - start
+        print(
+            f"Arranged {len(containers)} containers at {len(WIDTHS)} widths "
+            f"in {elapsed:.3f}s"
+        )
+        if "--profile" in sys.argv:
+            profile = cProfile.Profile()
+            profile.runcall(arrange_all, containers)
+            pstats.Stats(profile).sort_stats("tottime").print_stats(15)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())